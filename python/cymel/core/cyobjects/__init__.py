@@ -9,13 +9,16 @@ del _os_path
 from .cyobject import *
 from .objectref import *
 from .node_c import *
+from .dagnode_c import *
 from .node import *
 from .plug import *
 from .dagnode import *
 from .transform import *
+from .transform_c import *
 from .shape import *
 from .reference import *
 from .constraint import *
+from .dagsnapshot import *
 
 def _all():
     from types import ModuleType
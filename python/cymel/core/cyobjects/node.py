@@ -12,12 +12,14 @@ from ...utils.namespace import _wrapNS, _mayaNS
 from ...utils.operation import undoChunk
 from ..typeregistry import nodetypes, _FIX_SLOTS
 from .node_c import Node_c
+from ._attrschema import AttrSchema
 from .cyobject import (
     CyObject, UUID_ATTR_NAME,
+    _touchUUIDIndex,
     IS_SUPPORTING_NON_UNIQUE_ATTR_NAMES,
 )
 
-__all__ = ['Node']
+__all__ = ['Node', 'AttrSchema', 'addAttrsToNodes']
 
 _delete = cmds.delete
 _lockNode = cmds.lockNode
@@ -128,6 +130,7 @@ class Node(Node_c):
         if new:
             val = _uuid4()
             plug.set(str(val))
+            _touchUUIDIndex(self._CyObject__data.mnode)
             return val
         else:
             return _UUID(plug.get())
@@ -139,6 +142,9 @@ class Node(Node_c):
             self.plug_(UUID_ATTR_NAME).set(str(val))
         elif self.hasAttr(UUID_ATTR_NAME):
             _deleteAttr(self.name_() + _DOT_UUID_ATTR_NAME)
+        else:
+            return
+        _touchUUIDIndex(self._CyObject__data.mnode)
 
     if MAYA_VERSION < (2016,):
         uuid = _py_uuid
@@ -567,6 +573,20 @@ class Node(Node_c):
                 plug.mfn().channelBox = True
             return plug
 
+    def addAttrs(self, schema):
+        u"""
+        スキーマに従って複数のアトリビュートをまとめて追加する。
+
+        :mayacmd:`addAttr` コマンドを使わず、
+        1つの :mayaapi2:`MDGModifier` で実行され、 undo も1回で済む。
+        多数のノードに追加する場合は `addAttrsToNodes` を使うと良い。
+
+        :param schema:
+            `.AttrSchema` か、
+            それに渡すアトリビュート仕様の辞書のリスト。
+        """
+        _toAttrSchema(schema).apply([self])
+
     def plugs(self, **kwargs):
         u"""
         指定した条件にマッチするプラグのリストを得る。
@@ -580,6 +600,9 @@ class Node(Node_c):
         m=True を指定しても要素は得られない
         （worldSpace の場合はインデックスを明示しない方が良いため）。
 
+        多数のアトリビュートを列挙する場合は、
+        :mayacmd:`listAttr` を使わない `iterPlugs` の方が高速である。
+
         :rtype: `list`
         """
         p = self.plug_
@@ -603,6 +626,28 @@ class Node(Node_c):
 nodetypes.registerNodeClass(Node, 'node')
 
 
+#------------------------------------------------------------------------------
+def addAttrsToNodes(nodes, schema):
+    u"""
+    複数のノードにスキーマに従ってアトリビュートをまとめて追加する。
+
+    スキーマは1回だけコンパイルされ、全てのノードへの追加が
+    1つの :mayaapi2:`MDGModifier` で実行され、 undo も1回で済む。
+    既に同名のアトリビュートを持つノードがあれば、
+    何も実行せずにエラーとなる。
+
+    :param `iterable` nodes: `.Node` のリスト。
+    :param schema:
+        `.AttrSchema` か、
+        それに渡すアトリビュート仕様の辞書のリスト。
+    """
+    _toAttrSchema(schema).apply(nodes)
+
+
+def _toAttrSchema(schema):
+    return schema if isinstance(schema, AttrSchema) else AttrSchema(schema)
+
+
 #------------------------------------------------------------------------------
 if IS_SUPPORTING_NON_UNIQUE_ATTR_NAMES:
     def _pathnameToAddAttr(name, opts):
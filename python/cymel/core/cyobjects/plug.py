@@ -12,10 +12,12 @@ from .plug_c import Plug_c
 from .cyobject import CyObject
 from ..datatypes import Matrix, Transformation, Vector, Quaternion
 from ...utils import docmd, listEnum, correctNodeName, undoChunk
+from ._api2mplug import attrFromRawValue, attrFromUnitValue, getMPlugName
+from ._mplugarray import mplugSetArrayModifier
 import maya.OpenMaya as api1
 import maya.api.OpenMaya as api2
 
-__all__ = ['Plug']
+__all__ = ['Plug', 'PlugBatch', 'connectMany', 'disconnectMany']
 
 _api1_executeCommand = api1.MGlobal.executeCommand
 
@@ -110,6 +112,11 @@ class Plug(Plug_c):
         if self.isArray():
             raise RuntimeError("The attribute '%s' is a multi. Its values must be set individually." % self.name_())
 
+        # PlugBatch の中では、その終了時にまとめてセットされる。
+        if _PLUG_BATCH is not None:
+            _PLUG_BATCH._append(_batchSet, self, val, False, safe)
+            return
+
         # None の場合は、APIを使った疑似コマンドでセットする。
         if val is None:
             do = self.apiGetSetNullProc()
@@ -127,7 +134,7 @@ class Plug(Plug_c):
         else:
             if safe:
                 try:
-                    _setRawValue(self.name_(), self._unittype(), val)
+                    _setPlugRawValue(self, val)
                 except:
                     # 個々のセット操作をオーバーライド可能なように、きちんと Plug を呼び出す。
                     if self.subType():
@@ -144,7 +151,7 @@ class Plug(Plug_c):
                     return 1
                 return 0
             else:
-                _setRawValue(self.name_(), self._unittype(), val)
+                _setPlugRawValue(self, val)
 
     def setu(self, val, safe=False):
         u"""
@@ -166,6 +173,11 @@ class Plug(Plug_c):
         if self.isArray():
             raise RuntimeError("The attribute '%s' is a multi. Its values must be set individually." % self.name_())
 
+        # PlugBatch の中では、その終了時にまとめてセットされる。
+        if _PLUG_BATCH is not None:
+            _PLUG_BATCH._append(_batchSet, self, val, True, safe)
+            return
+
         # None の場合は、APIを使った疑似コマンドでセットする。
         if val is None:
             do = self.apiGetSetNullProc()
@@ -182,9 +194,8 @@ class Plug(Plug_c):
         # 通常の値の場合は、setAttr コマンドでセットする。
         else:
             if safe:
-                name = self.name()
                 try:
-                    _setUnitValue(name, self._unittype(), val)
+                    _setPlugUnitValue(self, val)
                 except:
                     # 個々のセット操作をオーバーライド可能なように、きちんと Plug を呼び出す。
                     if self.subType():
@@ -201,7 +212,53 @@ class Plug(Plug_c):
                     return 1
                 return 0
             else:
-                _setUnitValue(self.name(), self._unittype(), val)
+                _setPlugUnitValue(self, val)
+
+    def setArray(self, arr):
+        u"""
+        データ配列型アトリビュートに NumPy 配列の値をセットする。
+
+        `getArray` と対になるもので、
+        :mayaapi2:`MDGModifier` によってセットされ、 undo も可能。
+
+        :param arr:
+            セットする値。
+            doubleArray 、 floatArray 、 Int32Array は (N,) 、
+            vectorArray は (N,3) 、 pointArray は (N,3) か (N,4) の形状とする。
+        """
+        self.checkValid()
+        mplug = self._CyObject__data.mplug
+        if mplug.isFreeToChange() != _2_MPlug_kFreeToChange:
+            raise RuntimeError("The attribute '%s' is locked or connected and cannot be modified." % self.name_())
+        mod = mplugSetArrayModifier(mplug, self.mplug1_, self._CyObject__data.typeinfo['typename'], arr)
+        docmd(mod.doIt, mod.undoIt)
+
+    @staticmethod
+    def enableApiSetter(enable=True):
+        u"""
+        `set` と `setu` の API による高速なセットを有効化、又は無効化する。
+
+        有効にすると、数値型、単位付き数値型、数値コンパウンド、行列型の値が
+        :mayacmd:`setAttr` コマンドではなく :mayaapi2:`MDGModifier`
+        によってセットされるようになる（undo も可能）。
+
+        アトリビュートがロックや接続によって変更できない場合や、
+        値が API で扱えない場合は、従来通り :mayacmd:`setAttr` が使用されるため、
+        エラーや safe オプションの挙動は変わらない。
+
+        :param `bool` enable: True だと有効、 False だと無効。
+        """
+        global _API_SETTER_ENABLED
+        _API_SETTER_ENABLED = enable
+
+    @staticmethod
+    def isApiSetterEnabled():
+        u"""
+        `set` と `setu` の API による高速なセットが有効かどうか。
+
+        :rtype: `bool`
+        """
+        return _API_SETTER_ENABLED
 
     def connect(
         self, src,
@@ -247,6 +304,13 @@ class Plug(Plug_c):
         if not self.isArray():
             nextAvailable = False
 
+        # PlugBatch の中では、その終了時にまとめて接続される。
+        if _PLUG_BATCH is not None:
+            if nextAvailable:
+                raise ValueError('nextAvailable is not supported in PlugBatch: ' + self.name_())
+            _PLUG_BATCH._append(_batchConnect, self, src, force, lock)
+            return self
+
         # force ではないとき、ロックされていたらエラー。
         if not force and self.isLocked():
             raise RuntimeError('attribute is locked: ' + self.name_())
@@ -339,6 +403,8 @@ class Plug(Plug_c):
             演算子 // でも同様の操作が可能。
         """
         force |= f
+        if _PLUG_BATCH is not None and (nextAvailable or na):
+            raise ValueError('nextAvailable is not supported in PlugBatch: ' + self.name_())
         if src:
             if (nextAvailable or na) and self.isArray():
                 if src.longName() == 'output' and src.nodeType() in _UnitConvTypeNames:
@@ -358,6 +424,11 @@ class Plug(Plug_c):
         return src
 
     def _disconnect(self, src, force):
+        # PlugBatch の中では、その終了時にまとめて切断される。
+        if _PLUG_BATCH is not None:
+            _PLUG_BATCH._append(_batchDisconnect, self, src, force)
+            return self
+
         # 一時的なロックの解除。
         if force and not self.isNodeFromReferencedFile():
             tmpUnlocked = self.unlock(undoable=False)
@@ -814,26 +885,27 @@ class Plug(Plug_c):
             プラグを1つ受け `bool` を返す関数を指定する。
             False を返すところから下層には降りない。
         """
-        if checker(self):
-            yield self
-        else:
-            return
+        # 再帰せずに、スタックで深さ優先で辿る。
+        stack = [self]
+        while stack:
+            plug = stack.pop()
+            if not checker(plug):
+                continue
+            yield plug
 
-        if self.isArray():
-            if connected:
-                queue = self.connectedElements()
+            if plug.isArray():
+                if connected:
+                    queue = plug.connectedElements()
+                else:
+                    if evaluate:
+                        plug.evaluateNumElements()
+                    queue = plug.elements()
+            elif plug.isCompound():
+                queue = plug.children()
             else:
-                if evaluate:
-                    self.evaluateNumElements()
-                queue = self.elements()
-        elif self.isCompound():
-            queue = self.children()
-        else:
-            return
-
-        for plug in queue:
-            for plug in plug.iterHierarchy(evaluate, connected):
-                yield plug
+                continue
+            queue.reverse()
+            stack.extend(queue)
 
     def iterElements(self, start=None, end=None, step=1, all=False, infinite=False):
         u"""
@@ -1467,6 +1539,195 @@ class Plug(Plug_c):
 CyObject.setGlobalPlugClass(Plug)
 
 
+#------------------------------------------------------------------------------
+class PlugBatch(object):
+    u"""
+    `Plug` の操作をまとめて1回で実行するコンテキスト。
+
+    コンテキスト内での `Plug.set` 、 `Plug.setu` 、
+    `Plug.connect` 、 `Plug.disconnect` はその場では実行されず、
+    コンテキストの終了時に1つの :mayaapi2:`MDGModifier` によって実行され、
+    undo も1回で済む。
+
+    実行前に全ての操作が検証され、エラーがあれば、
+    何も実行せずに問題のあったプラグ名を列挙した例外が送出される。
+    コンテキスト内で例外が発生した場合も何も実行されない。
+
+    >>> import maya.cmds as cmds
+    >>> import cymel.main as cm
+    >>> cmds.file(f=True, new=True)
+    u'untitled'
+    >>> objs = [cm.Transform() for i in range(3)]
+    >>> with cm.PlugBatch():
+    ...     for i, obj in enumerate(objs):
+    ...         obj.tx.set(i)
+    ...
+    >>> [x.tx.get() for x in objs]
+    [0.0, 1.0, 2.0]
+    >>> cmds.undo()
+    >>> [x.tx.get() for x in objs]
+    [0.0, 0.0, 0.0]
+
+    :param `bool` safe:
+        `Plug.set` の safe=True と同様に、
+        セットできない操作をエラーにせずにスキップする。
+        数値コンパウンドの場合はセットできる箇所だけセットされる。
+        失敗したプラグ名は `failures` で得られる。
+
+    .. note::
+        コンテキスト内ではまだ何も実行されていないため、
+        値の取得や接続の検査は実行前の状態に対して行われる。
+        また、 nextAvailable オプションはサポートされない。
+    """
+    def __init__(self, safe=False):
+        self.safe = safe
+        self.failures = []  #: safe=True のときにセットや接続に失敗したプラグ名のリスト。
+        self.__entries = []
+        self.__prev = None
+
+    def __enter__(self):
+        global _PLUG_BATCH
+        self.__prev = _PLUG_BATCH
+        _PLUG_BATCH = self
+        return self
+
+    def __exit__(self, type, value, traceback):
+        global _PLUG_BATCH
+        _PLUG_BATCH = self.__prev
+        self.__prev = None
+        entries = self.__entries
+        self.__entries = []
+        if type is None:
+            self.__commit(entries)
+
+    def __len__(self):
+        return len(self.__entries)
+
+    @staticmethod
+    def current():
+        u"""
+        現在有効な `PlugBatch` を得る。
+
+        :rtype: `PlugBatch` or None
+        """
+        return _PLUG_BATCH
+
+    def _append(self, proc, *args):
+        self.__entries.append((proc, args))
+
+    def __commit(self, entries):
+        if not entries:
+            return
+
+        mod = _2_MDGModifier()
+        ctx = _BatchContext(self.safe)
+        for proc, args in entries:
+            proc(ctx, mod, *args)
+
+        if ctx.errors:
+            raise RuntimeError('PlugBatch failed:\n  ' + '\n  '.join(ctx.errors))
+        self.failures = ctx.failures
+
+        def doit():
+            try:
+                mod.doIt()
+            except:
+                try:
+                    mod.undoIt()
+                except:
+                    pass
+                raise
+        docmd(doit, mod.undoIt, mod.doIt)
+
+
+def connectMany(pairs, force=False, lock=False, safe=False):
+    u"""
+    複数の接続をまとめて1回で実行する。
+
+    `PlugBatch` によって1つの :mayaapi2:`MDGModifier` で実行され、
+    undo も1回で済む。
+    ロックや既存の接続のチェックは `Plug.connect` と同様であり、
+    エラーがあれば何も実行されない。
+
+    `PlugBatch` の中で呼ばれた場合は、その終了時にまとめて実行される。
+    その場合、 safe の扱いは外側の `PlugBatch` の設定に従い、
+    失敗したプラグ名は外側の `PlugBatch.failures` に記録され、
+    戻り値は常に空リストとなる。
+    外側が safe=False のときに safe=True を指定するとエラーとなる。
+
+    :param `iterable` pairs: 入力元と出力先の `Plug` のペアのリスト。
+    :param `bool` force:
+        他の接続やロックなどのエラー要因を回避して接続する。
+    :param `bool` lock: 接続後にロックする。
+    :param `bool` safe:
+        接続できないものをエラーにせずにスキップする。
+    :returns: 失敗したプラグ名のリスト（safe=False なら常に空）。
+    :rtype: `list`
+    """
+    if _PLUG_BATCH is not None:
+        _checkOuterBatchSafe(safe)
+        for src, dst in pairs:
+            dst.connect(src, force, lock=lock)
+        return []
+
+    with PlugBatch(safe) as batch:
+        for src, dst in pairs:
+            dst.connect(src, force, lock=lock)
+    return batch.failures
+
+
+def disconnectMany(plugs_or_pairs, force=False, safe=False):
+    u"""
+    複数の接続をまとめて1回で切断する。
+
+    `PlugBatch` によって1つの :mayaapi2:`MDGModifier` で実行され、
+    undo も1回で済む。
+    ロックのチェックは `Plug.disconnect` と同様であり、
+    エラーがあれば何も実行されない。
+
+    `PlugBatch` の中で呼ばれた場合は、その終了時にまとめて実行される。
+    その場合の safe と戻り値の扱いは `connectMany` と同様である。
+
+    :param `iterable` plugs_or_pairs:
+        入力コネクションを切断する `Plug` か、
+        入力元と出力先の `Plug` のペアのリスト。
+        入力コネクションの無い `Plug` は、失敗として扱われる。
+    :param `bool` force:
+        ロックされていても極力エラーを回避して切断する。
+    :param `bool` safe:
+        切断できないものをエラーにせずにスキップする。
+    :returns: 失敗したプラグ名のリスト（safe=False なら常に空）。
+    :rtype: `list`
+    """
+    if _PLUG_BATCH is not None:
+        _checkOuterBatchSafe(safe)
+        _disconnectMany(_PLUG_BATCH, plugs_or_pairs, force)
+        return []
+
+    with PlugBatch(safe) as batch:
+        _disconnectMany(batch, plugs_or_pairs, force)
+    return batch.failures
+
+
+def _disconnectMany(batch, plugs_or_pairs, force):
+    for x in plugs_or_pairs:
+        if isinstance(x, Plug_c):
+            # 入力コネクションが無い場合も、例外ではなくバッチの失敗として扱う。
+            src = x.connections(True, False, scn=True)
+            if src:
+                x._disconnect(src[0], force)
+            else:
+                batch._append(_batchFail, x, 'input connection not found')
+        else:
+            src, dst = x
+            dst._disconnect(src, force)
+
+
+def _checkOuterBatchSafe(safe):
+    if safe and not _PLUG_BATCH.safe:
+        raise ValueError('safe=True cannot be used in a PlugBatch with safe=False')
+
+
 #------------------------------------------------------------------------------
 _ATTRTYPE_ANIMCURVET_DICT = {
     'bool': 'animCurveTU',
@@ -1512,6 +1773,17 @@ _2_MTime_kSeconds = _2_MTime.kSeconds
 _2_MAngle_rawToUI = api2.MAngle.internalToUI
 _2_MDistance_rawToUI = api2.MDistance.internalToUI
 
+_2_MAngle = api2.MAngle
+_2_MAngle_uiUnit = _2_MAngle.uiUnit
+_2_MDistance = api2.MDistance
+_2_MDistance_uiUnit = _2_MDistance.uiUnit
+_2_MMatrix = api2.MMatrix
+_2_MFnMatrixData = api2.MFnMatrixData
+_2_MDGModifier = api2.MDGModifier
+_2_MPlug_kFreeToChange = api2.MPlug.kFreeToChange
+_2_MObject = api2.MObject
+_2_MObject_kNullObj = _2_MObject.kNullObj
+
 
 def _setAttr_generic(name, val, **kwargs):
     u"""
@@ -1739,6 +2011,347 @@ _setUnitValue = _makePlugValueSetter(_CMD_SETUVAL_DICT.get)
 _setRawValue = _makePlugValueSetter(_CMD_SETVAL_DICT.get)
 
 
+#------------------------------------------------------------------------------
+def _setPlugRawValue(plug, val):
+    u"""
+    プラグに内部単位の値をセットする。
+    """
+    if not (_API_SETTER_ENABLED and _apiSetValue(plug, val, _API_SETVAL_DICT_get)):
+        _setRawValue(plug.name_(), plug._unittype(), val)
+
+
+def _setPlugUnitValue(plug, val):
+    u"""
+    プラグにUI設定単位の値をセットする。
+    """
+    if not (_API_SETTER_ENABLED and _apiSetValue(plug, val, _API_SETUVAL_DICT_get)):
+        _setUnitValue(plug.name(), plug._unittype(), val)
+
+
+def _apiSetValue(plug, val, tbl_get):
+    u"""
+    :mayaapi2:`MDGModifier` によって undo 可能な値のセットをする。
+
+    API でセットできないものは何もせずに False を返す。
+    ロックや接続によって変更できない場合のエラーは
+    :mayacmd:`setAttr` に任せるため、それも False となる。
+    """
+    proc = tbl_get(plug._unittype())
+    if not proc:
+        return False
+    mplug = plug._CyObject__data.mplug
+    if mplug.isFreeToChange() != _2_MPlug_kFreeToChange:
+        return False
+    mod = _2_MDGModifier()
+    try:
+        proc(mod, mplug, val)
+    except Exception:
+        return False
+    docmd(mod.doIt, mod.undoIt)
+    return True
+
+
+def _apiSetVal_bool(mod, mplug, val):
+    mod.newPlugValueBool(mplug, val)
+
+
+def _apiSetVal_char(mod, mplug, val):
+    mod.newPlugValueChar(mplug, val)
+
+
+def _apiSetVal_short(mod, mplug, val):
+    mod.newPlugValueShort(mplug, val)
+
+
+def _apiSetVal_long(mod, mplug, val):
+    mod.newPlugValueInt(mplug, val)
+
+
+def _apiSetVal_float(mod, mplug, val):
+    mod.newPlugValueFloat(mplug, val)
+
+
+def _apiSetVal_double(mod, mplug, val):
+    mod.newPlugValueDouble(mplug, val)
+
+
+def _apiSetVal_raw_distance(mod, mplug, val):
+    mod.newPlugValueMDistance(mplug, _2_MDistance(val))
+
+
+def _apiSetVal_raw_angle(mod, mplug, val):
+    mod.newPlugValueMAngle(mplug, _2_MAngle(val))
+
+
+def _apiSetVal_raw_time(mod, mplug, val):
+    mod.newPlugValueMTime(mplug, _2_MTime(val, _2_MTime_kSeconds))
+
+
+def _apiSetVal_distance(mod, mplug, val):
+    mod.newPlugValueMDistance(mplug, _2_MDistance(val, _2_MDistance_uiUnit()))
+
+
+def _apiSetVal_angle(mod, mplug, val):
+    mod.newPlugValueMAngle(mplug, _2_MAngle(val, _2_MAngle_uiUnit()))
+
+
+def _apiSetVal_time(mod, mplug, val):
+    mod.newPlugValueMTime(mplug, _2_MTime(val, _2_MTime_uiUnit()))
+
+
+def _apiSetVal_matrix(mod, mplug, val):
+    # Transformation は setAttr に任せる（matrix 型には xformMatrix として保存される）。
+    if isinstance(val, Matrix):
+        val = val._Matrix__data
+    elif isinstance(val, Transformation):
+        raise TypeError('Transformation is not supported')
+    else:
+        val = _2_MMatrix(val)
+    mod.newPlugValue(mplug, _2_MFnMatrixData().create(val))
+
+
+def _makeApiCompoundSetter(setter):
+    def compoundSetter(mod, mplug, val):
+        n = mplug.numChildren()
+        if len(val) != n:
+            raise ValueError('length mismatch')
+        for i in range(n):
+            setter(mod, mplug.child(i), val[i])
+    return compoundSetter
+
+
+def _makeApiSetValDict(distance, angle, time):
+    tbl = {
+        'bool': _apiSetVal_bool,
+        'byte': _apiSetVal_char,
+        'char': _apiSetVal_char,
+        'short': _apiSetVal_short,
+        'enum': _apiSetVal_short,
+        'long': _apiSetVal_long,
+        'float': _apiSetVal_float,
+        'double': _apiSetVal_double,
+
+        'floatLinear': distance,
+        'doubleLinear': distance,
+        'floatAngle': angle,
+        'doubleAngle': angle,
+        'time': time,
+
+        'matrix': _apiSetVal_matrix,
+        'at:matrix': _apiSetVal_matrix,
+        'fltMatrix': _apiSetVal_matrix,
+    }
+    for typ, setter in (
+        ('short', _apiSetVal_short),
+        ('long', _apiSetVal_long),
+        ('float', _apiSetVal_float),
+        ('double', _apiSetVal_double),
+    ):
+        tbl[typ + '2'] = tbl[typ + '3'] = _makeApiCompoundSetter(setter)
+    tbl['double4'] = tbl['double3']
+
+    # NOTE: 数値コンパウンドに time は使用できない。
+    for typ in ('float2', 'float3', 'double2', 'double3', 'double4'):
+        base = typ[:-1]
+        tbl[typ + base + 'Linear'] = _makeApiCompoundSetter(distance)
+        tbl[typ + base + 'Angle'] = _makeApiCompoundSetter(angle)
+    return tbl
+
+_API_SETVAL_DICT_get = _makeApiSetValDict(_apiSetVal_raw_distance, _apiSetVal_raw_angle, _apiSetVal_raw_time).get
+_API_SETUVAL_DICT_get = _makeApiSetValDict(_apiSetVal_distance, _apiSetVal_angle, _apiSetVal_time).get
+
+_API_SETTER_ENABLED = False  #: set と setu の API による高速なセットが有効かどうか。
+
+
+#------------------------------------------------------------------------------
+class _BatchContext(object):
+    u"""
+    `PlugBatch` の実行時の検証の状態。
+    """
+    __slots__ = ('safe', 'errors', 'failures', 'scratch', 'connected', 'disconnected',)
+
+    def __init__(self, safe):
+        self.safe = safe
+        self.errors = []
+        self.failures = []
+        self.scratch = _2_MDGModifier()  # 値の検証用で実行はされない。
+        self.connected = set()  # (src, dst) の名前。
+        self.disconnected = set()  # (src, dst) の名前。
+
+    def fail(self, plug, msg, safe=False):
+        name = plug.name_()
+        if safe or self.safe:
+            self.failures.append(name)
+        else:
+            self.errors.append(name + ': ' + msg)
+
+
+def _batchSet(ctx, mod, plug, val, unit, safe):
+    u"""
+    `PlugBatch` のセット操作を検証して MDGModifier に追加する。
+    """
+    safe = safe or ctx.safe
+    if not plug.isValid():
+        ctx.fail(plug, 'invalid plug', safe)
+        return
+    mplug = plug._CyObject__data.mplug
+    if mplug.isFreeToChange() != _2_MPlug_kFreeToChange:
+        # safe なら、数値コンパウンドはセットできる箇所だけセットする。
+        if safe and val is not None and plug.subType():
+            for p, v in zip(plug.children(), val):
+                _batchSet(ctx, mod, p, v, unit, safe)
+            return
+        ctx.fail(plug, 'attribute is locked or connected', safe)
+        return
+
+    if val is None:
+        mod.newPlugValue(mplug, _2_MObject_kNullObj)
+        return
+
+    ttype = plug._unittype()
+    if unit:
+        proc = _API_SETUVAL_DICT_get(ttype)
+        attrFrom = attrFromUnitValue
+    else:
+        proc = _API_SETVAL_DICT_get(ttype)
+        attrFrom = attrFromRawValue
+
+    # 検証用の MDGModifier で成功したら、本番用にも追加する。
+    if proc:
+        try:
+            proc(ctx.scratch, mplug, val)
+        except Exception:
+            pass
+        else:
+            proc(mod, mplug, val)
+            return
+
+    try:
+        data = attrFrom(val, ttype)
+    except Exception as e:
+        ctx.fail(plug, str(e) or 'invalid value: %r' % (val,), safe)
+        return
+    if not isinstance(data, _2_MObject):
+        ctx.fail(plug, 'invalid value for %s: %r' % (ttype, val), safe)
+        return
+    mod.newPlugValue(mplug, data)
+
+
+def _batchFail(ctx, mod, plug, msg):
+    u"""
+    `PlugBatch` の操作を失敗として記録する。
+    """
+    ctx.fail(plug, msg)
+
+
+def _batchConnect(ctx, mod, dst, src, force, lock):
+    u"""
+    `PlugBatch` の接続操作を検証して MDGModifier に追加する。
+    """
+    if not (src.isValid() and dst.isValid()):
+        ctx.fail(dst, 'invalid plug')
+        return
+    # 名前の重複したDAGノードでも区別できるよう、ユニーク名で扱う。
+    dstmplug = dst._CyObject__data.mplug
+    dstname = getMPlugName(dstmplug)
+    key = (getMPlugName(src._CyObject__data.mplug), dstname)
+    locked = dst.isLocked()
+    if locked and not force:
+        ctx.fail(dst, 'attribute is locked')
+        return
+    if key in ctx.connected or (key not in ctx.disconnected and src.isConnectedTo(dst)):
+        ctx.fail(dst, 'already connected: %s -> %s' % key)
+        return
+
+    srcs = [(x, getMPlugName(x)) for x in dstmplug.connectedTo(True, False)]
+    srcs = [x for x in srcs if (x[1], dstname) not in ctx.disconnected]
+    if srcs or [x for x in ctx.connected if x[1] == dstname]:
+        if not force:
+            ctx.fail(dst, 'already has an incoming connection')
+            return
+        for mp, name in srcs:
+            mod.disconnect(mp, dstmplug)
+            ctx.disconnected.add((name, dstname))
+
+    # リファレンスノードのロックは解除できないので、通常の connect と同様に一時的な解除はしない。
+    unlocked = _batchUnlock(mod, dst) if locked and not dst.isNodeFromReferencedFile() else EMPTY_TUPLE
+    mod.connect(src._CyObject__data.mplug, dstmplug)
+    _batchRelock(mod, unlocked)
+    if lock and dst not in unlocked:
+        mod.commandToExecute('setAttr -l true "%s"' % dstname)
+    ctx.connected.add(key)
+    ctx.disconnected.discard(key)
+
+
+def _batchDisconnect(ctx, mod, dst, src, force):
+    u"""
+    `PlugBatch` の切断操作を検証して MDGModifier に追加する。
+    """
+    if not (src.isValid() and dst.isValid()):
+        ctx.fail(dst, 'invalid plug')
+        return
+    dstname = getMPlugName(dst._CyObject__data.mplug)
+    key = (getMPlugName(src._CyObject__data.mplug), dstname)
+    if key not in ctx.connected and (key in ctx.disconnected or not src.isConnectedTo(dst)):
+        ctx.fail(dst, 'connection not found: %s -> %s' % key)
+        return
+    locked = dst.isLocked()
+    if locked and not force:
+        ctx.fail(dst, 'attribute is locked')
+        return
+
+    unlocked = _batchUnlock(mod, dst) if locked and not dst.isNodeFromReferencedFile() else EMPTY_TUPLE
+    mod.disconnect(src._CyObject__data.mplug, dst._CyObject__data.mplug)
+    _batchRelock(mod, unlocked)
+    ctx.disconnected.add(key)
+    ctx.connected.discard(key)
+
+
+def _batchUnlock(mod, plug):
+    u"""
+    プラグと上位のうち、実際にロックされているものを一時的にアンロックするコマンドを MDGModifier に追加する。
+
+    ロック状態は上位から引き継がれるため、 `Plug.unlock` と同様に
+    上位から順にアンロックしながら判定する（判定後にロックは元に戻される）。
+
+    :returns: アンロックされるプラグの上から順に並んだリスト。
+    """
+    queue = []
+    p = plug
+    while p.isLocked():
+        queue.append(p)
+        if p.isElement():
+            p = p.array()
+        elif p.isChild():
+            p = p.parent()
+        else:
+            break
+
+    results = []
+    try:
+        for p in reversed(queue):
+            if p.isLocked():
+                _unlockApi(p)
+                results.append(p)
+    finally:
+        for p in results:
+            p.apiSetLocked(True)
+
+    for p in results:
+        mod.commandToExecute('setAttr -l false "%s"' % getMPlugName(p._CyObject__data.mplug))
+    return results
+
+
+def _batchRelock(mod, plugs):
+    u"""
+    `_batchUnlock` でアンロックしたプラグを再ロックするコマンドを MDGModifier に追加する。
+    """
+    for p in reversed(plugs):
+        mod.commandToExecute('setAttr -l true "%s"' % getMPlugName(p._CyObject__data.mplug))
+
+_PLUG_BATCH = None  #: 現在有効な PlugBatch 。
+
+
 #------------------------------------------------------------------------------
 def _addElement(queue):
     u"""
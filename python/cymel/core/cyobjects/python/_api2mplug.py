@@ -9,6 +9,7 @@ from __future__ import print_function
 from ...common import *
 from ..datatypes import Matrix, Transformation
 from ._api2attrname import _MayaAPI2RuntimeError
+from .._callbacks import addCallback
 import maya.api.OpenMaya as _api2
 import maya.OpenMaya as _api1
 
@@ -21,6 +22,7 @@ __all__ = [
 
     'makePlugTypeInfo', 'fixUnitTypeInfo',
     'mplugGetRawValue', 'mplugGetUnitValue',
+    'mplugRawValueGetter', 'mplugUnitValueGetter',
     'dataToValue',
     'attrToRawValue', 'unitAttrToRawValue',
     'attrToUnitValue', 'unitAttrToUnitValue',
@@ -42,6 +44,7 @@ _MFn_kDagNode = _MFn.kDagNode
 _MFn_kNumericAttribute = _MFn.kNumericAttribute
 _2_getAllPathsTo = _api2.MDagPath.getAllPathsTo
 _2_MObjectHandle = _api2.MObjectHandle
+_2_MEventMessage = _api2.MEventMessage
 _2_MPlug = _api2.MPlug
 _2_MFnDagNode = _api2.MFnDagNode
 _2_MFnDependencyNode = _api2.MFnDependencyNode
@@ -685,29 +688,81 @@ def _mplug_get_pointArray(mplug):
 
 
 def _mplug_get_distance(mp):
-    return _2_MDistance_rawToUI(mp.asDouble())
+    return mp.asDouble() * _distanceFactor()
 
 
 def _mplug_get_angle(mp):
-    return _2_MAngle_rawToUI(mp.asDouble())
+    return mp.asDouble() * _angleFactor()
 
 
 def _mplug_get_time(mp):
-    return _2_MTime_rawToUI(mp.asDouble())
+    return mp.asDouble() * _timeFactor()
 
 
 def _mplug_get_distances(mp):
-    return [_2_MDistance_rawToUI(x) for x in _2_MFnNumericData(mp.asMObject()).getData()]
+    return _scaleValues(_2_MFnNumericData(mp.asMObject()).getData(), _distanceFactor())
 
 
 def _mplug_get_angles(mp):
-    return [_2_MAngle_rawToUI(x) for x in _2_MFnNumericData(mp.asMObject()).getData()]
+    return _scaleValues(_2_MFnNumericData(mp.asMObject()).getData(), _angleFactor())
 
 
 #def _mplug_get_times(mp):
 #    return [_2_MTime_rawToUI(x) for x in _2_MFnNumericData(mp.asMObject()).getData()]
 
 
+#------------------------------------------------------------------------------
+def _distanceFactor():
+    u"""
+    内部単位の距離に乗じてUI設定単位にする係数を得る。
+    """
+    f = _UNIT_FACTORS[0]
+    if f is None:
+        f = _2_MDistance_rawToUI(1.)
+        _UNIT_FACTORS[0] = f
+    return f
+
+
+def _angleFactor():
+    u"""
+    内部単位の角度に乗じてUI設定単位にする係数を得る。
+    """
+    f = _UNIT_FACTORS[1]
+    if f is None:
+        f = _2_MAngle_rawToUI(1.)
+        _UNIT_FACTORS[1] = f
+    return f
+
+
+def _timeFactor():
+    u"""
+    内部単位の時間に乗じてUI設定単位にする係数を得る。
+    """
+    f = _UNIT_FACTORS[2]
+    if f is None:
+        f = _2_MTime_rawToUI(1.)
+        _UNIT_FACTORS[2] = f
+    return f
+
+
+def _scaleValues(vals, f):
+    u"""
+    リストか NumPy 配列の値に係数を乗じる。
+    """
+    if hasattr(vals, 'dtype'):
+        return vals * f
+    return [x * f for x in vals]
+
+
+def _clearUnitFactors(*args):
+    _UNIT_FACTORS[:] = [None, None, None]
+
+_UNIT_FACTORS = [None, None, None]  #: 距離、角度、時間のUI設定単位への係数のキャッシュ。
+addCallback(('unitFactor', 'linear'), _2_MEventMessage.addEventCallback, 'linearUnitChanged', _clearUnitFactors)
+addCallback(('unitFactor', 'angular'), _2_MEventMessage.addEventCallback, 'angularUnitChanged', _clearUnitFactors)
+addCallback(('unitFactor', 'time'), _2_MEventMessage.addEventCallback, 'timeUnitChanged', _clearUnitFactors)
+
+
 _MPLUG_GETVAL_DICT = {
     'bool': lambda p: p.asBool(),
     'char': lambda p: p.asChar(),
@@ -810,6 +865,16 @@ mplugGetRawValue = _makePlugValueGetter(_MPLUG_GETVAL_DICT.get)
 mplugGetUnitValue = _makePlugValueGetter(_MPLUG_GETUVAL_DICT.get)
 
 
+def _makePlugValueGetterFactory(tbl_get, getter):
+    def factory(ttype, isArray=False):
+        proc = None if isArray else tbl_get(ttype)
+        return proc or (lambda mplug: getter(mplug, ttype))
+    return factory
+
+mplugRawValueGetter = _makePlugValueGetterFactory(_MPLUG_GETVAL_DICT.get, mplugGetRawValue)  #: 型名から、MPlug の値を内部単位で得る関数を得る。
+mplugUnitValueGetter = _makePlugValueGetterFactory(_MPLUG_GETUVAL_DICT.get, mplugGetUnitValue)  #: 型名から、MPlug の値をUI設定単位で得る関数を得る。
+
+
 #------------------------------------------------------------------------------
 def dataToValue(mobj, mplug=None):
     u"""
@@ -995,11 +1060,11 @@ def _obj_values(v):
 
 
 def _distances_rawToUI(v):
-    return [_2_MDistance_rawToUI(x) for x in v]
+    return _scaleValues(v, _distanceFactor())
 
 
 def _angles_rawToUI(v):
-    return [_2_MAngle_rawToUI(x) for x in v]
+    return _scaleValues(v, _angleFactor())
 
 
 #def _times_rawToUI(v):
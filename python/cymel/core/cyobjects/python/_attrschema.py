@@ -0,0 +1,479 @@
+# -*- coding: utf-8 -*-
+u"""
+アトリビュート追加のスキーマ。
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from ...common import *
+from ...utils.operation import docmd
+import maya.api.OpenMaya as _api2
+
+__all__ = ['AttrSchema']
+
+_2_MDGModifier = _api2.MDGModifier
+_2_MFnNumericAttribute = _api2.MFnNumericAttribute
+_2_MFnUnitAttribute = _api2.MFnUnitAttribute
+_2_MFnTypedAttribute = _api2.MFnTypedAttribute
+_2_MFnEnumAttribute = _api2.MFnEnumAttribute
+_2_MFnMessageAttribute = _api2.MFnMessageAttribute
+_2_MFnCompoundAttribute = _api2.MFnCompoundAttribute
+_2_MFnStringData = _api2.MFnStringData
+_2_MFnMatrixData = _api2.MFnMatrixData
+_2_MDistance = _api2.MDistance
+_2_MAngle = _api2.MAngle
+_2_MTime = _api2.MTime
+_2_MTime_kSeconds = _2_MTime.kSeconds
+_MM = _api2.MMatrix
+_MFnData = _api2.MFnData
+_MFnNumericData = _api2.MFnNumericData
+_MFnUnitAttribute = _api2.MFnUnitAttribute
+
+_NUMERIC_TYPES = {
+    'bool': _MFnNumericData.kBoolean,
+    'byte': _MFnNumericData.kByte,
+    'char': _MFnNumericData.kChar,
+    'short': _MFnNumericData.kShort,
+    'long': _MFnNumericData.kInt,
+    'float': _MFnNumericData.kFloat,
+    'double': _MFnNumericData.kDouble,
+}
+
+_UNIT_TYPES = {
+    'doubleLinear': (_MFnUnitAttribute.kDistance, _2_MDistance),
+    'doubleAngle': (_MFnUnitAttribute.kAngle, _2_MAngle),
+    'time': (_MFnUnitAttribute.kTime, lambda v: _2_MTime(v, _2_MTime_kSeconds)),
+}
+
+_NUMERIC_COMPOUND_TYPES = {
+    'double2': ('double', 2),
+    'double3': ('double', 3),
+    'float2': ('float', 2),
+    'float3': ('float', 3),
+    'long2': ('long', 2),
+    'long3': ('long', 3),
+    'short2': ('short', 2),
+    'short3': ('short', 3),
+}
+
+_TYPED_TYPES = {
+    'string': _MFnData.kString,
+    'matrix': _MFnData.kMatrix,
+    'stringArray': _MFnData.kStringArray,
+    'doubleArray': _MFnData.kDoubleArray,
+    'floatArray': _MFnData.kFloatArray,
+    'Int32Array': _MFnData.kIntArray,
+    'vectorArray': _MFnData.kVectorArray,
+    'pointArray': _MFnData.kPointArray,
+    'componentList': _MFnData.kComponentList,
+    'mesh': _MFnData.kMesh,
+    'nurbsCurve': _MFnData.kNurbsCurve,
+    'nurbsSurface': _MFnData.kNurbsSurface,
+    'lattice': _MFnData.kLattice,
+}
+
+#: スキーマのキーのロング名とショート名。
+_KEY_ALIASES = {
+    'longName': 'ln',
+    'shortName': 'sn',
+    'niceName': 'nn',
+    'attributeType': 'type',
+    'at': 'type',
+    'dataType': 'type',
+    'dt': 'type',
+    'defaultValue': 'dv',
+    'minValue': 'min',
+    'maxValue': 'max',
+    'softMinValue': 'smn',
+    'softMaxValue': 'smx',
+    'enumName': 'en',
+    'keyable': 'k',
+    'channelBox': 'cb',
+    'hidden': 'h',
+    'storable': 's',
+    'readable': 'r',
+    'writable': 'w',
+    'multi': 'm',
+    'usedAsColor': 'uac',
+}
+_KEYS = frozenset(list(_KEY_ALIASES.values()) + [
+    'subType', 'childNames', 'childShortNames', 'childSuffixes', 'children',
+])
+
+#: MFnAttribute にそのままセットされるフラグ。
+_FLAG_PROPS = (
+    ('k', 'keyable'),
+    ('cb', 'channelBox'),
+    ('h', 'hidden'),
+    ('s', 'storable'),
+    ('r', 'readable'),
+    ('w', 'writable'),
+    ('m', 'array'),
+    ('uac', 'usedAsColor'),
+)
+
+#: 数値コンパウンドの子にも継承されるフラグ。
+_CHILD_FLAG_KEYS = ('k', 'cb', 'h', 's', 'r', 'w')
+
+
+#------------------------------------------------------------------------------
+class AttrSchema(object):
+    u"""
+    まとめて追加するアトリビュートのスキーマ。
+
+    アトリビュート仕様の辞書のリストを1回だけ検証、解析し、
+    :mayaapi2:`MFnNumericAttribute` や :mayaapi2:`MFnTypedAttribute` や
+    :mayaapi2:`MFnCompoundAttribute` などで
+    アトリビュートを生成する手続きにコンパイルする。
+
+    `.Node.addAttrs` や `addAttrsToNodes` に渡すことで、
+    全てのノードへの追加が1つの :mayaapi2:`MDGModifier` で実行され、
+    undo も1回で済む。
+    同じスキーマを繰り返し使う場合は、
+    一度生成したものを使い回すと良い。
+
+    仕様の辞書のキーは `.Node.addAttr` のオプションに準じ、
+    ロング名とショート名のどちらも指定可能である。
+
+    - ln|longName, sn|shortName, nn|niceName
+    - type （省略時は double 。 at:, dt: の接頭辞も可）
+    - dv|defaultValue, min|minValue, max|maxValue,
+      smn|softMinValue, smx|softMaxValue （内部単位で指定）
+    - en|enumName （ ``'A:B=3:C'`` の形式）
+    - k|keyable, cb|channelBox, h|hidden, s|storable,
+      r|readable, w|writable, m|multi, uac|usedAsColor
+    - subType, childNames, childShortNames, childSuffixes
+      （double2, double3, float3 などの数値コンパウンドの子の指定）
+    - children （compound の子の仕様のリスト）
+
+    >>> import maya.cmds as cmds
+    >>> import cymel.main as cm
+    >>> cmds.file(f=True, new=True)
+    u'untitled'
+    >>> schema = cm.AttrSchema([
+    ...     {'ln': 'weight', 'dv': 1., 'min': 0., 'max': 1., 'k': True},
+    ...     {'ln': 'offset', 'type': 'double3', 'subType': 'doubleLinear', 'cb': True},
+    ...     {'ln': 'mode', 'type': 'enum', 'en': 'off:on'},
+    ... ])
+    >>> objs = [cm.nt.Transform() for i in range(3)]
+    >>> cm.addAttrsToNodes(objs, schema)
+    >>> objs[0].weight.get()
+    1.0
+    >>> cmds.undo()
+    >>> objs[0].hasAttr('weight')
+    False
+
+    :param `iterable` specs: アトリビュート仕様の辞書のリスト。
+    """
+    def __init__(self, specs):
+        self.__creators = []
+        self.__names = []
+        self.__allNames = []
+        for spec in specs:
+            spec = _normalizeSpec(spec)
+            create, names = _compileSpec(spec)
+            self.__creators.append(create)
+            self.__names.append(spec.get('ln') or spec['sn'])
+            self.__allNames.extend(names)
+        _checkDuplicateNames(self.__allNames)
+
+    def __len__(self):
+        return len(self.__creators)
+
+    def names(self):
+        u"""
+        トップレベルのアトリビュート名のリストを得る。
+
+        :rtype: `list`
+        """
+        return list(self.__names)
+
+    def apply(self, nodes):
+        u"""
+        複数のノードにアトリビュートを追加する。
+
+        1つの :mayaapi2:`MDGModifier` で実行され、 undo も1回で済む。
+        既に同名のアトリビュートを持つノードがあれば、
+        何も実行せずにエラーとなる。
+        名前の検査は、子アトリビュートも含めたロング名とショート名で行われる。
+        同じノードが複数含まれる場合は1回だけ追加される。
+
+        :param `iterable` nodes: `.Node` のリスト。
+        """
+        nodes = _uniqueNodes(nodes)
+        names = self.__allNames
+        for node in nodes:
+            mfn = node.mfn()
+            for name in names:
+                if mfn.hasAttribute(name):
+                    raise ValueError('attribute already exists: ' + node.name_() + '.' + name)
+
+        mod = _2_MDGModifier()
+        for node in nodes:
+            mnode = node.mnode_()
+            for create in self.__creators:
+                mod.addAttribute(mnode, create())
+
+        def doit():
+            try:
+                mod.doIt()
+            except:
+                try:
+                    mod.undoIt()
+                except:
+                    pass
+                raise
+        docmd(doit, mod.undoIt, mod.doIt)
+
+
+#------------------------------------------------------------------------------
+def _uniqueNodes(nodes):
+    u"""
+    ノードリストから重複を除く（DAGインスタンスも同じノードとみなす）。
+    """
+    res = []
+    done = {}
+    for node in nodes:
+        data = node._CyObject__data
+        mnodes = done.get(data.hash)
+        if mnodes is None:
+            done[data.hash] = [data.mnode]
+        elif data.mnode in mnodes:
+            continue
+        else:
+            mnodes.append(data.mnode)
+        res.append(node)
+    return res
+
+
+def _checkDuplicateNames(names):
+    u"""
+    スキーマ内でのアトリビュート名の重複を検査する。
+    """
+    done = set()
+    for name in names:
+        if name in done:
+            raise ValueError('duplicate attribute name in schema: ' + name)
+        done.add(name)
+
+
+def _normalizeSpec(spec):
+    u"""
+    仕様の辞書のキーをショート名に揃え、検証する。
+    """
+    res = {}
+    for k, v in spec.items():
+        k = _KEY_ALIASES.get(k, k)
+        if k not in _KEYS:
+            raise ValueError('unknown attribute schema key: ' + repr(k))
+        res[k] = v
+    if not (res.get('ln') or res.get('sn')):
+        raise ValueError('attribute schema needs either a long or short name')
+    typename = res.get('type') or 'double'
+    if typename.startswith('at:') or typename.startswith('dt:'):
+        typename = typename[3:]
+    res['type'] = typename
+    return res
+
+
+def _compileSpec(spec):
+    u"""
+    仕様の辞書から、アトリビュートを生成する関数を得る。
+
+    :mayaapi2:`MObject` のアトリビュートはノードごとに必要なため、
+    解析済みの値で毎回生成する関数とする。
+
+    :returns: 生成関数と、子孫も含めたロング名とショート名のリストのペア。
+    """
+    typename = spec['type']
+    ln = spec.get('ln') or spec['sn']
+    sn = spec.get('sn') or ln
+    names = [ln] if sn == ln else [ln, sn]
+
+    if typename in _NUMERIC_TYPES:
+        ntype = _NUMERIC_TYPES[typename]
+        mfn_create = _numericCreator(ntype, spec)
+    elif typename in _UNIT_TYPES:
+        mfn_create = _unitCreator(typename, spec)
+    elif typename in _NUMERIC_COMPOUND_TYPES:
+        mfn_create = _numericCompoundCreator(typename, ln, spec, names)
+    elif typename == 'enum':
+        mfn_create = _enumCreator(spec)
+    elif typename in _TYPED_TYPES:
+        mfn_create = _typedCreator(typename, spec)
+    elif typename == 'message':
+        def mfn_create(ln, sn):
+            mfn = _2_MFnMessageAttribute()
+            return mfn, mfn.create(ln, sn)
+    elif typename == 'compound':
+        mfn_create = _compoundCreator(spec, names)
+    else:
+        raise ValueError('unsupported attribute type: ' + typename)
+
+    flags = [(prop, spec[k]) for k, prop in _FLAG_PROPS if k in spec]
+    nn = spec.get('nn')
+
+    def create():
+        mfn, mobj = mfn_create(ln, sn)
+        for prop, v in flags:
+            setattr(mfn, prop, v)
+        if nn:
+            mfn.setNiceNameOverride(nn)
+        return mobj
+    return create, names
+
+
+def _setRange(mfn, spec, conv):
+    for key, setter in (
+        ('min', mfn.setMin),
+        ('max', mfn.setMax),
+        ('smn', mfn.setSoftMin),
+        ('smx', mfn.setSoftMax),
+    ):
+        if key in spec:
+            setter(conv(spec[key]))
+
+
+def _numericCreator(ntype, spec):
+    dv = spec.get('dv')
+
+    def mfn_create(ln, sn):
+        mfn = _2_MFnNumericAttribute()
+        mobj = mfn.create(ln, sn, ntype)
+        if dv is not None:
+            mfn.default = dv
+        _setRange(mfn, spec, _through)
+        return mfn, mobj
+    return mfn_create
+
+
+def _unitCreator(typename, spec):
+    utype, conv = _UNIT_TYPES[typename]
+    dv = spec.get('dv')
+
+    def mfn_create(ln, sn):
+        mfn = _2_MFnUnitAttribute()
+        mobj = mfn.create(ln, sn, utype)
+        if dv is not None:
+            mfn.default = conv(dv)
+        _setRange(mfn, spec, conv)
+        return mfn, mobj
+    return mfn_create
+
+
+def _numericCompoundCreator(typename, ln, spec, names):
+    basetype, num = _NUMERIC_COMPOUND_TYPES[typename]
+    subType = spec.get('subType') or basetype
+
+    # 子の名前を決める。
+    lnames = spec.get('childNames')
+    snames = spec.get('childShortNames')
+    suffixes = spec.get('childSuffixes') or ('RGBA' if spec.get('uac') else 'XYZW')[:num]
+    if not lnames:
+        lnames = [ln + x for x in suffixes]
+    if not snames:
+        sn = spec.get('sn')
+        snames = [(sn + x.lower()) for x in suffixes] if sn else lnames
+    if len(lnames) != num or len(snames) != num:
+        raise ValueError('the number of child names must be %d for %s' % (num, typename))
+
+    # 子の仕様。デフォルト値は要素ごとに分ける。
+    dv = spec.get('dv')
+    if dv is not None and len(dv) != num:
+        raise ValueError('the default value must have %d elements for %s' % (num, typename))
+    children = []
+    for i in range(num):
+        child = dict([(k, spec[k]) for k in _CHILD_FLAG_KEYS if k in spec])
+        child['type'] = subType
+        if dv is not None:
+            child['dv'] = dv[i]
+        for k in ('min', 'max', 'smn', 'smx'):
+            if k in spec:
+                v = spec[k]
+                child[k] = v[i] if hasattr(v, '__len__') else v
+        child['ln'] = lnames[i]
+        child['sn'] = snames[i]
+        if subType not in _NUMERIC_TYPES and subType not in _UNIT_TYPES:
+            raise ValueError('unsupported subType: ' + subType)
+        create, childNames = _compileSpec(child)
+        children.append(create)
+        names.extend(childNames)
+
+    def mfn_create(ln, sn):
+        mfn = _2_MFnNumericAttribute()
+        mobj = mfn.create(ln, sn, *[x() for x in children])
+        return mfn, mobj
+    return mfn_create
+
+
+def _enumCreator(spec):
+    fields = []
+    idx = 0
+    for x in (spec.get('en') or '').split(':'):
+        if not x:
+            continue
+        if '=' in x:
+            x, idx = x.split('=', 1)
+            idx = int(idx)
+        fields.append((x, idx))
+        idx += 1
+    dv = spec.get('dv')
+    if dv is None and fields:
+        dv = fields[0][1]
+
+    def mfn_create(ln, sn):
+        mfn = _2_MFnEnumAttribute()
+        mobj = mfn.create(ln, sn)
+        for name, val in fields:
+            mfn.addField(name, val)
+        if dv is not None:
+            mfn.default = dv
+        return mfn, mobj
+    return mfn_create
+
+
+def _typedCreator(typename, spec):
+    dtype = _TYPED_TYPES[typename]
+    dv = spec.get('dv')
+    if dv is not None:
+        if typename == 'string':
+            makeDefault = lambda: _2_MFnStringData().create(dv)
+        elif typename == 'matrix':
+            m = getattr(dv, '_Matrix__data', None) or _MM(dv)
+            makeDefault = lambda: _2_MFnMatrixData().create(m)
+        else:
+            raise ValueError('default value is not supported for ' + typename)
+    else:
+        makeDefault = None
+
+    def mfn_create(ln, sn):
+        mfn = _2_MFnTypedAttribute()
+        if makeDefault:
+            mobj = mfn.create(ln, sn, dtype, makeDefault())
+        else:
+            mobj = mfn.create(ln, sn, dtype)
+        return mfn, mobj
+    return mfn_create
+
+
+def _compoundCreator(spec, names):
+    children = []
+    for x in (spec.get('children') or EMPTY_TUPLE):
+        create, childNames = _compileSpec(_normalizeSpec(x))
+        children.append(create)
+        names.extend(childNames)
+    if not children:
+        raise ValueError('compound attribute schema needs children')
+
+    def mfn_create(ln, sn):
+        mfn = _2_MFnCompoundAttribute()
+        mobj = mfn.create(ln, sn)
+        for x in children:
+            mfn.addChild(x())
+        return mfn, mobj
+    return mfn_create
+
+
+def _through(v):
+    return v
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+u"""
+データ配列型の :mayaapi2:`MPlug` と NumPy 配列との変換のサポート。
+
+NumPy はオプションであり、インストールされていなければ
+関数の呼び出し時に ImportError となる。
+
+API2 には MFnFloatArrayData が無く、
+MFnPointArrayData からは値が得られないというバグがあるため、
+floatArray と pointArray は取得もセットも API1 を使用する。
+vectorArray も、要素ごとに MVector を生成せずに一括でセットできるよう API1 を使用する。
+
+要素ごとの Python の処理を避けるため、取得は :func:`numpy.fromiter` で、
+セットは :mayaapi1:`MScriptUtil` で作ったバッファから一括で行う。
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from ...common import imap
+from itertools import chain as _chain
+from operator import attrgetter as _attrgetter
+import maya.api.OpenMaya as _api2
+import maya.OpenMaya as _api1
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+__all__ = [
+    'ARRAY_DATA_TYPES',
+    'mplugGetArray',
+    'mplugSetArrayModifier',
+]
+
+_2_MDGModifier = _api2.MDGModifier
+_2_MFnDoubleArrayData = _api2.MFnDoubleArrayData
+_2_MFnIntArrayData = _api2.MFnIntArrayData
+
+_1_MDGModifier = _api1.MDGModifier
+_1_MFnFloatArrayData = _api1.MFnFloatArrayData
+_1_MFnPointArrayData = _api1.MFnPointArrayData
+_1_MFnVectorArrayData = _api1.MFnVectorArrayData
+_1_MFloatArray = _api1.MFloatArray
+_1_MPointArray = _api1.MPointArray
+_1_MVectorArray = _api1.MVectorArray
+_1_MScriptUtil = _api1.MScriptUtil
+
+_xyz = _attrgetter('x', 'y', 'z')
+_xyzw = _attrgetter('x', 'y', 'z', 'w')
+
+
+#------------------------------------------------------------------------------
+def _requireNumpy():
+    if _np is None:
+        raise ImportError('numpy is required')
+
+
+def mplugGetArray(mplug, mplug1Getter, typename):
+    u"""
+    データ配列型の MPlug の値を NumPy 配列として得る。
+
+    :param mplug: :mayaapi2:`MPlug`
+    :param `callable` mplug1Getter: API1 の MPlug を得る関数。
+    :param `str` typename: アトリビュートタイプ名。
+    :rtype: numpy.ndarray
+    """
+    _requireNumpy()
+    proc = _GET_ARRAY_DICT.get(typename)
+    if not proc:
+        raise TypeError('unsupported attribute type: ' + typename)
+    proc, dtype, ncols = proc
+    try:
+        arr = proc(mplug, mplug1Getter)
+    except RuntimeError:
+        # データが Null なら空の配列とする。
+        arr = None
+    if arr is None or not len(arr):
+        return _np.empty((0, ncols) if ncols else (0,), dtype=dtype)
+    return arr
+
+
+def _getArray_doubleArray(mplug, mplug1Getter):
+    arr = _2_MFnDoubleArrayData(mplug.asMObject()).array()
+    return _np.fromiter(arr, _np.float64, len(arr))
+
+
+def _getArray_Int32Array(mplug, mplug1Getter):
+    arr = _2_MFnIntArrayData(mplug.asMObject()).array()
+    return _np.fromiter(arr, _np.int32, len(arr))
+
+
+def _getArray_floatArray(mplug, mplug1Getter):
+    arr = _1_MFnFloatArrayData(mplug1Getter().asMObject()).array()
+    n = arr.length()
+    return _np.fromiter(imap(arr.__getitem__, range(n)), _np.float32, n)
+
+
+def _getArray_vectorArray(mplug, mplug1Getter):
+    return _getArray_tuples(_1_MFnVectorArrayData(mplug1Getter().asMObject()).array(), _xyz, 3)
+
+
+def _getArray_pointArray(mplug, mplug1Getter):
+    return _getArray_tuples(_1_MFnPointArrayData(mplug1Getter().asMObject()).array(), _xyzw, 4)
+
+
+def _getArray_tuples(arr, getter, ncols):
+    n = arr.length()
+    buf = _np.fromiter(
+        _chain.from_iterable(imap(getter, imap(arr.__getitem__, range(n)))),
+        _np.float64, n * ncols)
+    return buf.reshape(n, ncols)
+
+
+_GET_ARRAY_DICT = {
+    'doubleArray': (_getArray_doubleArray, 'float64', 0),
+    'floatArray': (_getArray_floatArray, 'float32', 0),
+    'Int32Array': (_getArray_Int32Array, 'int32', 0),
+    'vectorArray': (_getArray_vectorArray, 'float64', 3),
+    'pointArray': (_getArray_pointArray, 'float64', 4),
+}
+
+ARRAY_DATA_TYPES = frozenset(_GET_ARRAY_DICT)  #: NumPy 配列で扱えるアトリビュートタイプ名。
+
+
+#------------------------------------------------------------------------------
+def mplugSetArrayModifier(mplug, mplug1Getter, typename, arr):
+    u"""
+    データ配列型の MPlug に NumPy 配列の値をセットする MDGModifier を得る。
+
+    得られるモディファイアは doIt も undoIt も可能である。
+
+    :param mplug: :mayaapi2:`MPlug`
+    :param `callable` mplug1Getter: API1 の MPlug を得る関数。
+    :param `str` typename: アトリビュートタイプ名。
+    :param arr:
+        セットする値。
+        スカラー配列型は (N,) 、
+        vectorArray は (N,3) 、
+        pointArray は (N,3) か (N,4) の形状とする。
+    :returns: API2 か API1 の MDGModifier 。
+    """
+    _requireNumpy()
+    proc = _SET_ARRAY_DICT.get(typename)
+    if not proc:
+        raise TypeError('unsupported attribute type: ' + typename)
+    proc, dtype, ncols = proc
+
+    arr = _np.asarray(arr, dtype=dtype)
+    if ncols:
+        if arr.ndim != 2 or arr.shape[1] not in ncols:
+            if arr.size or arr.ndim > 2:
+                raise ValueError('array shape must be (N, %s): %r' % ('|'.join([str(x) for x in ncols]), arr.shape))
+            arr = arr.reshape(0, ncols[0])
+    elif arr.ndim != 1:
+        raise ValueError('array shape must be (N,): %r' % (arr.shape,))
+    return proc(mplug, mplug1Getter, arr)
+
+
+def _newValueModifier2(mplug, mobj):
+    mod = _2_MDGModifier()
+    mod.newPlugValue(mplug, mobj)
+    return mod
+
+
+def _setArray_doubleArray(mplug, mplug1Getter, arr):
+    return _newValueModifier2(mplug, _2_MFnDoubleArrayData().create(arr.tolist()))
+
+
+def _setArray_Int32Array(mplug, mplug1Getter, arr):
+    return _newValueModifier2(mplug, _2_MFnIntArrayData().create(arr.tolist()))
+
+
+def _setArray_floatArray(mplug, mplug1Getter, arr):
+    farr = _1_MFloatArray()
+    _1_MScriptUtil.createFloatArrayFromList(arr.tolist(), farr)
+    return _newValueModifier1(mplug1Getter, _1_MFnFloatArrayData().create(farr))
+
+
+def _setArray_vectorArray(mplug, mplug1Getter, arr):
+    n = len(arr)
+    if n:
+        util = _1_MScriptUtil()
+        util.createFromList(arr.ravel().tolist(), n * 3)
+        varr = _1_MVectorArray(util.asDouble3Ptr(), n)
+    else:
+        varr = _1_MVectorArray()
+    return _newValueModifier1(mplug1Getter, _1_MFnVectorArrayData().create(varr))
+
+
+def _setArray_pointArray(mplug, mplug1Getter, arr):
+    n = len(arr)
+    if n:
+        if arr.shape[1] == 3:
+            arr = _np.hstack((arr, _np.ones((n, 1))))
+        util = _1_MScriptUtil()
+        util.createFromList(arr.ravel().tolist(), n * 4)
+        parr = _1_MPointArray(util.asDouble4Ptr(), n)
+    else:
+        parr = _1_MPointArray()
+    return _newValueModifier1(mplug1Getter, _1_MFnPointArrayData().create(parr))
+
+
+def _newValueModifier1(mplug1Getter, mobj):
+    mod = _1_MDGModifier()
+    mod.newPlugValue(mplug1Getter(), mobj)
+    return mod
+
+
+_SET_ARRAY_DICT = {
+    'doubleArray': (_setArray_doubleArray, 'float64', None),
+    'floatArray': (_setArray_floatArray, 'float32', None),
+    'Int32Array': (_setArray_Int32Array, 'int32', None),
+    'vectorArray': (_setArray_vectorArray, 'float64', (3,)),
+    'pointArray': (_setArray_pointArray, 'float64', (4, 3)),
+}
@@ -9,9 +9,15 @@ from __future__ import print_function
 import sys
 import types
 from uuid import UUID as _UUID
+from weakref import WeakValueDictionary as _WeakValueDictionary
+from collections import OrderedDict as _OrderedDict
 from ...common import *
 from ..typeinfo import isDerivedNodeType as _isDerivedNodeType
 from ..typeregistry import nodetypes
+from .._callbacks import (
+    addCallback, removeCallback, removeCallbacks,
+    addSceneResetCallback, addPluginChangedCallback,
+)
 from ._api2mplug import (
     _1_mpath, _1_mnode,
     makePlugTypeInfo,
@@ -47,6 +53,13 @@ _2_MSelectionList = _api2.MSelectionList
 _2_MObjectHandle = _api2.MObjectHandle
 _2_MFnDagNode = _api2.MFnDagNode
 _2_MFnAttribute = _api2.MFnAttribute
+_2_MEventMessage = _api2.MEventMessage
+_2_MDagMessage = _api2.MDagMessage
+_2_MDGMessage = _api2.MDGMessage
+_2_MNodeMessage = _api2.MNodeMessage
+_2_MFnDependencyNode = _api2.MFnDependencyNode
+_2_MItDependencyNodes = _api2.MItDependencyNodes
+_2_MMessage_removeCallback = _api2.MMessage.removeCallback
 
 _MFn_kDagNode = _MFn.kDagNode
 _MFn_kTransform = _MFn.kTransform
@@ -59,6 +72,7 @@ _2_getSelectionListByName = _api2.MGlobal.getSelectionListByName
 _ls = cmds.ls
 
 _decideClass = nodetypes._NodeTypes__decideClass
+_decideClassMemo = nodetypes._NodeTypes__decideClassMemo
 _relatedNodeTypes = nodetypes.relatedNodeTypes
 
 _object_new = object.__new__
@@ -154,22 +168,22 @@ class CyObject(object):
             return True
 
     def __hash__(self):
-        return self.__data['hash']
+        return self.__data.hash
 
     def __repr__(self):
-        if self.__data['isValid']():
+        if self.__data.isValid():
             try:
-                return "%s('%s')" % (type(self).__name__, self.__data['getname']())
+                return "%s('%s')" % (type(self).__name__, self.__data.getname())
             except:
                 return "<%s at %0.16X; unexpected error>" % (type(self).__name__, id(self))
-        elif self.__data['isAlive']():
+        elif self.__data.isAlive():
             return "<%s at %0.16X; invalid handle>" % (type(self).__name__, id(self))
         else:
             return "<%s at %0.16X; dead internal reference>" % (type(self).__name__, id(self))
 
     def __str__(self):
         self.checkValid()
-        return self.__data['getname']()
+        return self.__data.getname()
 
     def __add__(self, other):
         return str(self) + str(other)
@@ -179,10 +193,10 @@ class CyObject(object):
 
     def __unicode__(self):
         self.checkValid()
-        return self.__data['getname']()
+        return self.__data.getname()
 
     def __eq__(self, other):
-        return self.__data['eq'](self, other)
+        return self.__data.eq(self, other)
 
     def __ne__(self, other):
         return not self.__eq__(other)
@@ -195,7 +209,7 @@ class CyObject(object):
 
         :rtype: `bool`
         """
-        return self.__data['isValid']()
+        return self.__data.isValid()
 
     def isAlive(self):
         u"""
@@ -205,13 +219,13 @@ class CyObject(object):
 
         :rtype: `bool`
         """
-        return self.__data['isAlive']()
+        return self.__data.isAlive()
 
     def checkValid(self):
         u"""
         内部ハンドルの有効性チェック。無効なら `.CymelInvalidHandle` エラーとなる。
         """
-        if not self.__data['isValid']():
+        if not self.__data.isValid():
             raise CymelInvalidHandle('%s at %0.16X' % (type(self).__name__, id(self)))
 
     def name(self):
@@ -224,7 +238,7 @@ class CyObject(object):
         :rtype: `str`
         """
         self.checkValid()
-        return self.__data['getname']()
+        return self.__data.getname()
 
     def name_(self):
         u"""
@@ -235,7 +249,7 @@ class CyObject(object):
 
         :rtype: `str`
         """
-        return self.__data['getname']()
+        return self.__data.getname()
 
     def node(self):
         u"""
@@ -306,6 +320,359 @@ class CyObject(object):
             _defaultPlugCls = pcls
         CyObject.__glbpcls = pcls or _defaultPlugCls
 
+    @staticmethod
+    def enableNodeCache(enable=True):
+        u"""
+        ノードラッパーのインターンキャッシュを有効化、又は無効化する。
+
+        有効にすると、同じノードを同じクラス指定で得ようとした場合に、
+        生存している既存の `.Node` インスタンスが再利用されるようになる
+        （ `O('pCube1') is O('pCube1')` が真となる）。
+        キャッシュは弱参照で保持されるため、インスタンスの寿命には影響しない。
+
+        キーは :mayaapi2:`MObjectHandle` のハッシュコードと、
+        DAGノードの場合はインスタンス番号であり、
+        ヒット時には :mayaapi2:`MObject` や :mayaapi2:`MDagPath`
+        の一致と、ハンドルの有効性が検査される。
+        よって、削除されたノードや、同じ名前で作り直されたノードの
+        古いインスタンスが得られることはない。
+
+        :param `bool` enable: True だと有効、 False だと無効（キャッシュは破棄される）。
+
+        .. warning::
+            キャッシュヒット時はクラス決定処理が省略されるため、
+            `_verifyNode` を持つカスタムクラスの判定結果が
+            ノードの状態の変化によって変わる場合は、
+            `clearNodeCache` を呼ぶ必要がある。
+        """
+        global _NODE_CACHE
+        if enable:
+            if _NODE_CACHE is None:
+                _NODE_CACHE = _WeakValueDictionary()
+        else:
+            _NODE_CACHE = None
+        _NODE_CACHE_STATS[0] = 0
+        _NODE_CACHE_STATS[1] = 0
+
+    @staticmethod
+    def isNodeCacheEnabled():
+        u"""
+        ノードラッパーのインターンキャッシュが有効かどうか。
+
+        :rtype: `bool`
+        """
+        return _NODE_CACHE is not None
+
+    @staticmethod
+    def clearNodeCache():
+        u"""
+        ノードラッパーのインターンキャッシュをクリアする。
+
+        ヒット数とミス数のカウンタもリセットされる。
+        """
+        if _NODE_CACHE is not None:
+            _NODE_CACHE.clear()
+        _NODE_CACHE_STATS[0] = 0
+        _NODE_CACHE_STATS[1] = 0
+
+    @staticmethod
+    def nodeCacheStats():
+        u"""
+        ノードラッパーのインターンキャッシュの統計情報を得る。
+
+        hits （ヒット数）、 misses （ミス数）、
+        size （現在のエントリー数）をキーとする辞書が返される。
+
+        :rtype: `dict`
+        """
+        return {
+            'hits': _NODE_CACHE_STATS[0],
+            'misses': _NODE_CACHE_STATS[1],
+            'size': len(_NODE_CACHE) if _NODE_CACHE is not None else 0,
+        }
+
+    @staticmethod
+    def enableNameCache(enable=True, size=None):
+        u"""
+        ノード名の解決結果のキャッシュを有効化、又は無効化する。
+
+        文字列からオブジェクトを得る際の
+        :mayaapi2:`MGlobal.getSelectionListByName` 相当の処理の結果が、
+        ノード名ごとに :mayaapi2:`MObjectHandle` と
+        :mayaapi2:`MDagPath` として LRU キャッシュされる
+        （プラグ名の場合もノード名部分がキャッシュされる）。
+
+        キャッシュはデフォルトで有効であり、
+        ノードのリネーム、DAG の変更、ノードの削除、
+        シーンの新規作成やオープンで破棄される。
+
+        :param `bool` enable: True だと有効、 False だと無効（キャッシュは破棄される）。
+        :param `int` size:
+            キャッシュの最大エントリー数。
+            省略時は現在の設定が維持される。
+        """
+        global _NAME_CACHE_ENABLED, _NAME_CACHE_SIZE
+        _clearNameCache()
+        if size is not None:
+            if size < 1:
+                raise ValueError('invalid cache size: ' + repr(size))
+            _NAME_CACHE_SIZE = size
+        if enable:
+            _addNameCacheCallbacks()
+        else:
+            removeCallbacks('nameCache')
+        _NAME_CACHE_ENABLED = enable
+
+    @staticmethod
+    def isNameCacheEnabled():
+        u"""
+        ノード名の解決結果のキャッシュが有効かどうか。
+
+        :rtype: `bool`
+        """
+        return _NAME_CACHE_ENABLED
+
+    @staticmethod
+    def clearNameCache():
+        u"""
+        ノード名の解決結果のキャッシュをクリアする。
+        """
+        _clearNameCache()
+
+    @staticmethod
+    def enableTypeInfoCache(enable=True):
+        u"""
+        プラグのタイプ情報のキャッシュを有効化、又は無効化する。
+
+        `.Plug` の生成時に構築されるアトリビュートのタイプ情報が、
+        静的アトリビュートについてはノードタイプごとに、
+        ダイナミックアトリビュートについてはノードごとにキャッシュされ、
+        同じアトリビュートのプラグ間で共有される。
+
+        キャッシュはデフォルトで有効であり、
+        プラグインのロードやアンロード、
+        シーンの新規作成やオープンで破棄される。
+
+        :param `bool` enable: True だと有効、 False だと無効（キャッシュは破棄される）。
+        """
+        global _TYPEINFO_CACHE_ENABLED
+        _clearTypeInfoCache()
+        if enable:
+            _addTypeInfoCacheCallbacks()
+        else:
+            removeCallbacks('typeInfoCache')
+        _TYPEINFO_CACHE_ENABLED = enable
+
+    @staticmethod
+    def isTypeInfoCacheEnabled():
+        u"""
+        プラグのタイプ情報のキャッシュが有効かどうか。
+
+        :rtype: `bool`
+        """
+        return _TYPEINFO_CACHE_ENABLED
+
+    @staticmethod
+    def clearTypeInfoCache():
+        u"""
+        プラグのタイプ情報のキャッシュをクリアする。
+        """
+        _clearTypeInfoCache()
+
+    @staticmethod
+    def enableAttrPathCache(enable=True, size=None):
+        u"""
+        アトリビュートパスの解決結果のキャッシュを有効化、又は無効化する。
+
+        `.Node.plug` などでアトリビュートを得る際の、
+        パス文字列の分解結果と、ノードタイプごとの
+        アトリビュート :mayaapi2:`MObject` の解決結果が LRU キャッシュされる。
+        キャッシュヒット時には、ノードごとに
+        ロジカルインデックスの選択だけが行われる。
+
+        エイリアスを含むパスや、ダイナミックアトリビュートの解決結果は
+        キャッシュされない。
+        キャッシュはデフォルトで有効であり、
+        プラグインのロードやアンロードで破棄される。
+
+        :param `bool` enable: True だと有効、 False だと無効（キャッシュは破棄される）。
+        :param `int` size:
+            キャッシュの最大エントリー数。
+            省略時は現在の設定が維持される。
+        """
+        global _ATTRPATH_CACHE_ENABLED, _ATTRPATH_CACHE_SIZE
+        _clearAttrPathCache()
+        if size is not None:
+            if size < 1:
+                raise ValueError('invalid cache size: ' + repr(size))
+            _ATTRPATH_CACHE_SIZE = size
+        _ATTRPATH_CACHE_STATS[:] = [0, 0, 0, 0]
+        _ATTRPATH_CACHE_ENABLED = enable
+
+    @staticmethod
+    def isAttrPathCacheEnabled():
+        u"""
+        アトリビュートパスの解決結果のキャッシュが有効かどうか。
+
+        :rtype: `bool`
+        """
+        return _ATTRPATH_CACHE_ENABLED
+
+    @staticmethod
+    def clearAttrPathCache():
+        u"""
+        アトリビュートパスの解決結果のキャッシュをクリアする。
+
+        統計情報のカウンタもリセットされる。
+        """
+        _clearAttrPathCache()
+        _ATTRPATH_CACHE_STATS[:] = [0, 0, 0, 0]
+
+    @staticmethod
+    def attrPathCacheStats():
+        u"""
+        アトリビュートパスの解決結果のキャッシュの統計情報を得る。
+
+        解決結果についての hits （ヒット数）、 misses （ミス数）、
+        size （現在のエントリー数）、 hitRate （ヒット率）と、
+        パスの分解結果についての tokenHits 、 tokenMisses 、 tokenSize
+        をキーとする辞書が返される。
+
+        :rtype: `dict`
+        """
+        hits, misses, thits, tmisses = _ATTRPATH_CACHE_STATS
+        return {
+            'hits': hits,
+            'misses': misses,
+            'size': len(_ATTRPATH_CACHE),
+            'hitRate': (hits / (hits + misses)) if (hits or misses) else 0.,
+            'tokenHits': thits,
+            'tokenMisses': tmisses,
+            'tokenSize': len(_ATTRPATH_TOKEN_CACHE),
+        }
+
+    @staticmethod
+    def enableShapeCache(enable=True):
+        u"""
+        :mayanode:`transform` のシェイプ取得結果のキャッシュを有効化、又は無効化する。
+
+        `.DagNode.shape` や `.DagNode.transform` の結果が
+        :mayaapi2:`MDagMessage` の子の追加、削除、並べ替えと、
+        シェイプの intermediateObject アトリビュートの変更を監視することで
+        検証済みとしてキャッシュされ、
+        ヒット時には辞書の参照と有効性チェックだけで得られる。
+
+        キャッシュはデフォルトで有効であり、
+        シーンの新規作成やオープンで破棄される。
+
+        :param `bool` enable: True だと有効、 False だと無効（キャッシュは破棄される）。
+        """
+        global _SHAPE_CACHE_ENABLED
+        _clearShapeCache()
+        if enable:
+            _addShapeCacheCallbacks()
+        else:
+            removeCallbacks('shapeCache')
+        _SHAPE_CACHE_STATS[:] = [0, 0, 0]
+        _SHAPE_CACHE_ENABLED = enable
+
+    @staticmethod
+    def isShapeCacheEnabled():
+        u"""
+        シェイプ取得結果のキャッシュが有効かどうか。
+
+        :rtype: `bool`
+        """
+        return _SHAPE_CACHE_ENABLED
+
+    @staticmethod
+    def invalidateShapeCache(node=None):
+        u"""
+        シェイプ取得結果のキャッシュを無効化する。
+
+        通常はコールバックによって自動的に無効化されるため、
+        デバッグ用である。
+
+        :param node:
+            無効化する :mayanode:`transform` ノード。
+            省略時は全て無効化される。
+        """
+        if node is None:
+            _invalidateShapeCache()
+        else:
+            _invalidateShapeCache(node._CyObject__data.hash)
+
+    @staticmethod
+    def shapeCacheStats():
+        u"""
+        シェイプ取得結果のキャッシュの統計情報を得る。
+
+        hits （ヒット数）、 misses （ミス数）、 hitRate （ヒット率）、
+        invalidations （無効化の回数）、
+        watched （intermediateObject を監視中のシェイプ数）
+        をキーとする辞書が返される。
+
+        :rtype: `dict`
+        """
+        hits, misses, invalidations = _SHAPE_CACHE_STATS
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hitRate': (hits / (hits + misses)) if (hits or misses) else 0.,
+            'invalidations': invalidations,
+            'watched': sum([len(x) for x in _SHAPE_CACHE_WATCHED.values()]),
+        }
+
+    @staticmethod
+    def enableUUIDIndex(enable=True):
+        u"""
+        `byUUID` のための UUID インデックスを有効化、又は無効化する。
+
+        有効にすると、 uuid アトリビュートに保存された UUID （py=True）と
+        Maya 標準の UUID から :mayaapi2:`MObjectHandle` を得る辞書が、
+        最初の `byUUID` 呼び出し時にシーンごとに一度だけ構築され、
+        以降の検索は辞書引きとなる。
+
+        インデックスはノードの追加と削除、
+        uuid アトリビュートの変更のコールバックで維持され、
+        シーンの新規作成やオープンで破棄される。
+
+        :param `bool` enable: True だと有効、 False だと無効（インデックスは破棄される）。
+
+        .. note::
+            uuid アトリビュートを持たないノードに、
+            cymel を介さずにアトリビュートが追加された場合は検知されないため、
+            `clearUUIDIndex` を呼ぶ必要がある。
+        """
+        global _UUID_INDEX
+        _clearUUIDIndex()
+        if enable:
+            _UUID_INDEX = _UUIDIndex()
+            addCallback(('uuidIndex', 'added'), _2_MDGMessage.addNodeAddedCallback, _onUUIDIndexNodeAdded, 'dependNode')
+            addCallback(('uuidIndex', 'removed'), _2_MDGMessage.addNodeRemovedCallback, _onUUIDIndexNodeRemoved, 'dependNode')
+            addSceneResetCallback('uuidIndex', _clearUUIDIndex)
+        else:
+            _UUID_INDEX = None
+            removeCallbacks('uuidIndex')
+
+    @staticmethod
+    def isUUIDIndexEnabled():
+        u"""
+        `byUUID` のための UUID インデックスが有効かどうか。
+
+        :rtype: `bool`
+        """
+        return _UUID_INDEX is not None
+
+    @staticmethod
+    def clearUUIDIndex():
+        u"""
+        `byUUID` のための UUID インデックスを破棄する。
+
+        インデックスは次の `byUUID` 呼び出し時に再構築される。
+        """
+        _clearUUIDIndex()
+
     @classmethod
     def ls(cls, *args, **kwargs):
         u"""
@@ -344,6 +711,51 @@ class CyObject(object):
         else:
             return [_getObjectBySelIdx(sel, i, objMap) for i in range(num)]
 
+    @classmethod
+    def fromNames(cls, names):
+        u"""
+        名前のリストからオブジェクトのリストを一括して得る。
+
+        コンストラクタを個別に呼び出すのと同じ結果が入力順に得られるが、
+        クラスの決定はノードタイプごとにまとめて行われ、
+        同じノードのプラグ間ではノードの `.ObjectRef` が共有される。
+        同じ名前が複数含まれる場合は、同じオブジェクトが返される。
+
+        ただし、クラス指定が無い場合のプラグのクラスは、
+        そのノード自体も要求されていれば `.Node.plug` と同様に
+        ノードの `~.Node.plugClass` となる
+        （ `.Node.setPlugClass` でセットされていなければ、コンストラクタと同じ
+        `globalPlugClass` となる）。
+
+        :param `iterable` names: ノード名やプラグ名のリスト。
+        :rtype: `list`
+        """
+        names = [(x if isinstance(x, BASESTR) else str(x)) for x in names]
+        argsDict = {}
+        for name in names:
+            if name not in argsDict:
+                argsDict[name] = _apiArgsByName(name)
+        return _batchObjects(cls, [argsDict[x] for x in names], names)
+
+    @classmethod
+    def fromMObjects(cls, objs):
+        u"""
+        Python API 2.0 オブジェクトのリストからオブジェクトのリストを一括して得る。
+
+        :mayaapi2:`MObject` 、 :mayaapi2:`MDagPath` 、 :mayaapi2:`MPlug`
+        を混在して指定することができる。
+
+        コンストラクタを個別に呼び出すのと同じ結果が入力順に得られるが、
+        クラスの決定はノードタイプごとにまとめて行われ、
+        同じノードのプラグ間ではノードの `.ObjectRef` が共有される。
+        プラグのクラスは `fromNames` と同様に決められる。
+
+        :param `iterable` objs: Python API 2.0 オブジェクトのリスト。
+        :rtype: `list`
+        """
+        objs = list(objs)
+        return _batchObjects(cls, [_apiArgsByAPI2(x) for x in objs], objs)
+
     @classmethod
     def checktype(cls, obj):
         u"""
@@ -374,7 +786,9 @@ class CyObject(object):
         if candidates:
             chk = cls.checktype
             objs = [chk(x) for x in candidates]
-            objs = [x for x in candidates if x]
+            objs = [x for x in objs if x]
+        elif _UUID_INDEX is not None:
+            return cls._byUUIDIndex(val, True)
         else:
             objs = cls.ls()
 
@@ -409,6 +823,8 @@ class CyObject(object):
             """
             if py:
                 return cls._py_byUUID(val, candidates)
+            elif _UUID_INDEX is not None:
+                return cls._byUUIDIndex(val, False)
             elif isinstance(val, BASESTR):
                 return cls.ls(val)
             elif isinstance(val, Iterable):
@@ -421,8 +837,35 @@ class CyObject(object):
             #   MSelectionList.add() での MUuid 指定は C++ や API1 では可能だが
             #   API2 ではサポートされていないため、保留にしている。
 
+    @classmethod
+    def _byUUIDIndex(cls, val, py):
+        if isinstance(val, BASESTR) or isinstance(val, _UUID) or not isinstance(val, Iterable):
+            val = [val]
+        # 通常の byUUID と同様に、重複した UUID は1つにまとめる。
+        uuids = []
+        done = set()
+        for x in val:
+            if not isinstance(x, _UUID):
+                x = _UUID(x)
+            if x not in done:
+                done.add(x)
+                uuids.append(x)
+
+        mnodes, missing = _UUID_INDEX.find(uuids, py)
+        chk = cls.checktype
+        objs = [x for x in [chk(x) for x in mnodes] if x]
+        if missing:
+            # Maya 標準の UUID はインデックスを経由せずに変更され得るので、
+            # 見つからなかったものは ls でも探す。
+            objs.extend(cls.ls([str(x) for x in missing]))
+        return objs
+
 _defaultPlugCls = None  #: Plug が import 後にセットされる。
 
+_UUID_INDEX = None  #: byUUID のための UUID インデックス。有効時は _UUIDIndex となる。
+_NODE_CACHE = None  #: ノードラッパーのインターンキャッシュ。有効時は WeakValueDictionary となる。
+_NODE_CACHE_STATS = [0, 0]  #: インターンキャッシュの [ヒット数, ミス数] 。
+
 O = CyObject  #: `CyObject` の別名。
 
 _O_ls = O.ls
@@ -475,49 +918,118 @@ def _newPlugRefFromData(*args):
 
 
 #------------------------------------------------------------------------------
-def _makeNodeData(mpath, mnode, mfn, dummy=None):
+class _NodeData(object):
     u"""
-    Node の内部データを構築する。
+    Node の内部データ。
+
+    インスタンスごとの辞書やクロージャを持たないよう、
+    全てのメソッドはクラスで共有される。
+
+    `bits` には `BIT_DAGNODE` 、 `BIT_TRANSFORM` 、 `BIT_SHAPE`
+    の組み合わせでノードの特徴が保持される。
+    API1 オブジェクト（ mnode1, mpath1, mfn1 ）は、
+    `_initAPI1Objects` で初期化されるまで未セットのままとなる。
     """
-    mhdl = _2_MObjectHandle(mnode)
-    isAlive = mhdl.isAlive
-    data = {
-        'hash': mhdl.hashCode(),
-        'isAlive': isAlive,
-        'isValid': mhdl.isValid,
-        'mnode': mnode,
-        'mfn': mfn,
-        'nodetype': mfn.typeName,
-        'getname': mfn.partialPathName if mpath else mfn.name,
-        'plugcls': None,
-    }
+    __slots__ = (
+        'hash', 'mhdl', 'mnode', 'mfn', 'nodetype', 'mpath', 'bits', 'plugcls',
+        'shape', 'transform',
+        'mnode1', 'mpath1', 'mfn1',
+    )
 
-    if mpath:
-        data['mpath'] = mpath
-        if mnode.hasFn(_MFn_kTransform):
-            data['shape'] = [{}, {}]
-        elif mnode.hasFn(_MFn_kShape):
-            data['transform'] = None
-
-        def eq(self, other):
-            if isAlive() and isinstance(other, CyObject) and other._CyObject__data['isAlive']():
-                if (
-                    (self.refclass() if self.CLASS_TYPE is CY_OBJREF else self).TYPE_BITS and
-                    (other.refclass() if other.CLASS_TYPE is CY_OBJREF else other).TYPE_BITS
-                ):
-                    return mpath == other._CyObject__data['mpath']
-                else:
-                    return mnode == other._CyObject__data['mnode']
-            return False
+    def isAlive(self):
+        return self.mhdl.isAlive()
 
-    else:
-        def eq(self, other):
+    def isValid(self):
+        return self.mhdl.isValid()
+
+    def getname(self):
+        if self.mpath is None:
+            return self.mfn.name()
+        return self.mfn.partialPathName()
+
+    def eq(self, obj, other):
+        if self.mhdl.isAlive() and isinstance(other, CyObject):
+            dt = other._CyObject__data
+            if type(dt) is not _NodeData or not dt.mhdl.isAlive():
+                return False
+            if (
+                self.mpath is not None and
+                (obj.refclass() if obj.CLASS_TYPE is CY_OBJREF else obj).TYPE_BITS and
+                (other.refclass() if other.CLASS_TYPE is CY_OBJREF else other).TYPE_BITS
+            ):
+                return self.mpath == dt.mpath
+            return self.mnode == dt.mnode
+        return False
+
+
+class _PlugData(object):
+    u"""
+    Plug の内部データ。
+
+    インスタンスごとの辞書やクロージャを持たないよう、
+    全てのメソッドはクラスで共有される。
+
+    `attrIsAlive` はダイナミックアトリビュートの場合のみセットされ、
+    その場合の有効性チェックには `keyname` が使用される。
+    API1 オブジェクト（ mplug1, mfn1 ）は、
+    `_initAPI1Objects` で初期化されるまで未セットのままとなる。
+    """
+    __slots__ = (
+        'hash', 'mplug', 'noderef', 'nodedata', 'attrname', 'typeinfo', 'elemIdxAttrs',
+        'attrIsAlive', 'keyname',
+        'mplug1', 'mfn1',
+    )
+
+    def isAlive(self):
+        if self.attrIsAlive:
+            return self.attrIsAlive() and self.nodedata.mhdl.isAlive()
+        return self.nodedata.mhdl.isAlive()
+
+    def isValid(self):
+        if self.attrIsAlive:
             return (
-                isAlive() and isinstance(other, CyObject) and
-                other._CyObject__data['isAlive']() and
-                mnode == other._CyObject__data['mnode']
+                self.attrIsAlive() and self.nodedata.mhdl.isValid() and
+                self.nodedata.mfn.hasAttribute(self.keyname)
             )
-    data['eq'] = eq
+        return self.nodedata.mhdl.isValid()
+
+    def getname(self):
+        return self.nodedata.getname() + self.attrname
+
+    def eq(self, obj, other):
+        if self.isAlive() and isinstance(other, CyObject):
+            dt = other._CyObject__data
+            return (
+                type(dt) is _PlugData and dt.isAlive() and
+                self.mplug == dt.mplug and self.attrname == dt.attrname
+            )
+        return False
+
+
+def _makeNodeData(mpath, mnode, mfn, dummy=None):
+    u"""
+    Node の内部データを構築する。
+    """
+    mhdl = _2_MObjectHandle(mnode)
+    data = _NodeData()
+    data.hash = mhdl.hashCode()
+    data.mhdl = mhdl
+    data.mnode = mnode
+    data.mfn = mfn
+    data.nodetype = mfn.typeName
+    data.mpath = mpath
+    data.plugcls = None
+
+    if mpath is None:
+        data.bits = 0
+    elif mnode.hasFn(_MFn_kTransform):
+        data.bits = BIT_DAGNODE | BIT_TRANSFORM
+        data.shape = [{}, {}, {}, None]
+    elif mnode.hasFn(_MFn_kShape):
+        data.bits = BIT_DAGNODE | BIT_SHAPE
+        data.transform = None
+    else:
+        data.bits = BIT_DAGNODE
     return data
 
 
@@ -529,46 +1041,90 @@ def _makePlugData(noderef, mplug, typeinfo=None, typename=None, attrname=None):
     #if mplug.isNetworked:
     #    raise ValueError('Networked plug is specified')
 
+    nodedata = noderef._CyObject__data
     if not typeinfo:
-        typeinfo = makePlugTypeInfo(mplug.attribute(), typename)
+        typeinfo = _getPlugTypeInfo(nodedata, mplug.attribute(), typename)
     if not attrname:
         attrname = '.' + mplug.partialName(includeNonMandatoryIndices=True, includeInstancedIndices=True)
-    noderef_data = noderef._CyObject__data
-    node_getname = noderef_data['getname']
-    data = {
-        'hash': hash((noderef_data['hash'], attrname)),
-        'mplug': mplug,
-        'noderef': noderef,
-        'attrname': attrname,
-        'typeinfo': typeinfo,
-        'getname': lambda: node_getname() + attrname,
-        'elemIdxAttrs': None,
-    }
+    data = _PlugData()
+    data.hash = hash((nodedata.hash, attrname))
+    data.mplug = mplug
+    data.noderef = noderef
+    data.nodedata = nodedata
+    data.attrname = attrname
+    data.typeinfo = typeinfo
+    data.elemIdxAttrs = None
 
     attr_isAlive = typeinfo['isAlive']
-    if attr_isAlive:
-        node_isAlive = noderef_data['isAlive']
-        node_isValid = noderef_data['isValid']
-        node_hasAttr = noderef_data['mfn'].hasAttribute
-        keyname = _getAttrKeyName(typeinfo)
-        data['isValid'] = lambda: attr_isAlive() and node_isValid() and node_hasAttr(keyname)
-        isAlive = lambda: attr_isAlive() and node_isAlive()
+    data.attrIsAlive = attr_isAlive
+    data.keyname = _getAttrKeyName(typeinfo) if attr_isAlive else None
+    return data
+
+
+def _getPlugTypeInfo(nodedata, mattr, typename=None):
+    u"""
+    `.Plug` のタイプ情報を、キャッシュを利用して得る。
+
+    静的アトリビュートの :mayaapi2:`MObject` は同じタイプのノード間で共有されるため、
+    ノードタイプとアトリビュートのハッシュコードをキーにして
+    全ノードで同じタイプ情報を共有する。
+    ダイナミックアトリビュートはノードごとに異なるため、
+    ノードのハッシュコードをキーにして別に保持する。
+    """
+    if not _TYPEINFO_CACHE_ENABLED:
+        return makePlugTypeInfo(mattr, typename)
+
+    ahash = _2_MObjectHandle(mattr).hashCode()
+    key = (nodedata.nodetype, ahash)
+    typeinfo = _TYPEINFO_CACHE_get(key)
+    if typeinfo:
+        isAlive = typeinfo['isAlive']
+        if isAlive is None or isAlive():
+            if not typename or typename == typeinfo['typename']:
+                return typeinfo
+            return makePlugTypeInfo(mattr, typename)
+        del _TYPEINFO_CACHE[key]
+    else:
+        dynkey = (nodedata.hash, ahash)
+        typeinfo = _DYN_TYPEINFO_CACHE.get(dynkey)
+        if typeinfo:
+            if typeinfo['isAlive']():
+                if not typename or typename == typeinfo['typename']:
+                    return typeinfo
+                return makePlugTypeInfo(mattr, typename)
+            del _DYN_TYPEINFO_CACHE[dynkey]
+
+    typeinfo = makePlugTypeInfo(mattr, typename)
+    if typeinfo['mfn'].dynamic:
+        if len(_DYN_TYPEINFO_CACHE) >= _DYN_TYPEINFO_CACHE_SIZE:
+            _DYN_TYPEINFO_CACHE.clear()
+        _DYN_TYPEINFO_CACHE[(nodedata.hash, ahash)] = typeinfo
     else:
-        data['isValid'] = noderef_data['isValid']
-        isAlive = noderef_data['isAlive']
-    data['isAlive'] = isAlive
+        _TYPEINFO_CACHE[key] = typeinfo
+    return typeinfo
 
-    def eq(self, other):
-        if isAlive() and isinstance(other, CyObject):
-            dt = other._CyObject__data
-            return (
-                'mplug' in dt and dt['isAlive']() and
-                mplug == dt['mplug'] and attrname == dt['attrname']
-            )
-        return False
-    data['eq'] = eq
 
-    return data
+def _clearTypeInfoCache(*args):
+    _TYPEINFO_CACHE.clear()
+    _DYN_TYPEINFO_CACHE.clear()
+
+
+def _addTypeInfoCacheCallbacks():
+    u"""
+    プラグのタイプ情報のキャッシュを破棄するためのコールバックを登録する。
+
+    プラグインのアンロードでノードタイプの静的アトリビュートが破棄されるため、
+    キャッシュ全体を破棄する。
+    """
+    addPluginChangedCallback('typeInfoCache', _clearTypeInfoCache)
+    addSceneResetCallback('typeInfoCache', _clearTypeInfoCache)
+
+_TYPEINFO_CACHE_ENABLED = True  #: プラグのタイプ情報のキャッシュが有効かどうか。
+_TYPEINFO_CACHE = {}  #: (ノードタイプ, 静的アトリビュートのハッシュコード) をキーとするタイプ情報のキャッシュ。
+_TYPEINFO_CACHE_get = _TYPEINFO_CACHE.get
+_DYN_TYPEINFO_CACHE = {}  #: (ノードのハッシュコード, ダイナミックアトリビュートのハッシュコード) をキーとするタイプ情報のキャッシュ。
+_DYN_TYPEINFO_CACHE_SIZE = 10000  #: ダイナミックアトリビュートのタイプ情報のキャッシュの最大エントリー数（超えると全て破棄）。
+_addTypeInfoCacheCallbacks()
 
 
 if IS_SUPPORTING_NON_UNIQUE_ATTR_NAMES:
@@ -584,16 +1140,16 @@ def _initAPI1Objects(data):
     u"""
     API1 オブジェクトを初期化する。
     """
-    if 'mfn1' in data:
+    if hasattr(data, 'mfn1'):
         return
 
-    if 'mplug' in data:
-        nodedata = data['noderef']._CyObject__data
+    if type(data) is _PlugData:
+        nodedata = data.nodedata
         _initAPI1Objects(nodedata)
-        mfnnode = nodedata['mfn1']
+        mfnnode = nodedata.mfn1
 
         # mplug のパスを得て分解。
-        attrTkns = _argToFindComplexMPlug(data['mplug'].info.split('.')[1:])
+        attrTkns = _argToFindComplexMPlug(data.mplug.info.split('.')[1:])
 
         # ノードからプラグを取得。
         # MPlug から得たパスなので _findMPlug には strict=True を指定でき、それ以上のチェックも不要。
@@ -610,22 +1166,22 @@ def _initAPI1Objects(data):
             # 末尾のロジカルインデックスを選択する。
             if leafIdx is not None and leafIdx >= 0:
                 mplug1.selectAncestorLogicalIndex(leafIdx)
-            data['mplug1'] = mplug1
-            data['mfn1'] = getattr(_api1, type(data['typeinfo']['mfn']).__name__)(mplug1.attribute())
+            data.mplug1 = mplug1
+            data.mfn1 = getattr(_api1, type(data.typeinfo['mfn']).__name__)(mplug1.attribute())
         except RuntimeError:
-            data['mplug1'] = None
-            data['mfn1'] = None
+            data.mplug1 = None
+            data.mfn1 = None
 
-    elif 'mpath' in data:
-        mpath1 = _1_mpath(data['getname']())
-        data['mpath1'] = mpath1
-        data['mnode1'] = mpath1.node()
-        data['mfn1'] = getattr(_api1, type(data['mfn']).__name__)(mpath1)
+    elif data.mpath is not None:
+        mpath1 = _1_mpath(data.getname())
+        data.mpath1 = mpath1
+        data.mnode1 = mpath1.node()
+        data.mfn1 = getattr(_api1, type(data.mfn).__name__)(mpath1)
 
-    else:  #if 'mnode' in data:
-        mnode1 = _1_mnode(data['getname']())
-        data['mnode1'] = mnode1
-        data['mfn1'] = getattr(_api1, type(data['mfn']).__name__)(mnode1)
+    else:
+        mnode1 = _1_mnode(data.getname())
+        data.mnode1 = mnode1
+        data.mfn1 = getattr(_api1, type(data.mfn).__name__)(mnode1)
 
 
 def _setPlugCache(node, plug):
@@ -634,9 +1190,9 @@ def _setPlugCache(node, plug):
 
     Plug の後に Node を作った場合に、任意でキャッシュをセットすることができる。
     """
-    cache = node._Node_c__plugCache.get(plug._CyObject__data['attrname'])
+    cache = node._Node_c__plugCache.get(plug._CyObject__data.attrname)
     if cache is None:
-        node._Node_c__plugCache[plug._CyObject__data['attrname']] = {id(type(plug)): plug}
+        node._Node_c__plugCache[plug._CyObject__data.attrname] = {id(type(plug)): plug}
     else:
         cache[id(type(plug))] = plug
 
@@ -690,7 +1246,7 @@ def _decideNodeClsFromData(data):
     u"""
     ノード内部データからクラスを決定する。
     """
-    return _decideClass(data['getname'](), data['mfn'].typeName, lambda: data['mfn'])
+    return _decideClass(data.getname(), data.mfn.typeName, lambda: data.mfn)
 
 
 #def _newNodeFromData(data):
@@ -704,12 +1260,22 @@ def _newNodeObjByArgs(args):
     u"""
     `_makeNodeData` と同じ引数リストから Node インスタンスを生成する。
     """
+    if _NODE_CACHE is not None:
+        key = _nodeCacheKey(CyObject, args[0], args[1])
+        obj = _getCachedNode(key, args[0], args[1])
+        if obj:
+            return obj
+
     data = _makeNodeData(*args)
     mfn = args[2]
-    return _decideClass(
-        args[-1] if len(args) == 4 else data['getname'](),
+    obj = _decideClass(
+        args[-1] if len(args) == 4 else data.getname(),
         mfn.typeName, lambda: mfn).newObject(data)
 
+    if _NODE_CACHE is not None:
+        _NODE_CACHE[key] = obj
+    return obj
+
 
 def _newNodeRefByArgs(args):
     u"""
@@ -723,11 +1289,204 @@ def _newNodeObjByMPath(mpath):
     API2 MDagPath から Node インスタンスを生成する。
     """
     mnode = mpath.node()
+    if _NODE_CACHE is not None:
+        key = _nodeCacheKey(CyObject, mpath, mnode)
+        obj = _getCachedNode(key, mpath, mnode)
+        if obj:
+            return obj
+
     mfn = _mnodeFn(mpath, mnode)
-    return _decideClass(
+    obj = _decideClass(
         mpath.partialPathName(), mfn.typeName, lambda: mfn
     ).newObject(_makeNodeData(mpath, mnode, mfn))
 
+    if _NODE_CACHE is not None:
+        _NODE_CACHE[key] = obj
+    return obj
+
+
+def _nodeCacheKey(cls, mpath, mnode):
+    u"""
+    ノードラッパーのインターンキャッシュのキーを得る。
+
+    同一ノードでも、DAGインスタンスやクラス指定が異なれば別のキーとなる。
+    """
+    return (
+        _2_MObjectHandle(mnode).hashCode(),
+        mpath.instanceNumber() if mpath else -1,
+        cls,
+    )
+
+
+def _getCachedNode(key, mpath, mnode):
+    u"""
+    ノードラッパーのインターンキャッシュからインスタンスを得る。
+
+    ハッシュコードの衝突や、削除されたノード、作り直されたノード、
+    インスタンス番号の変化したDAGパスのインスタンスは無効とし、
+    キャッシュから除去して None を返す。
+    """
+    obj = _NODE_CACHE.get(key)
+    if obj is not None:
+        data = obj._CyObject__data
+        if data.isValid() and mnode == data.mnode and (not mpath or mpath == data.mpath):
+            _NODE_CACHE_STATS[0] += 1
+            return obj
+        try:
+            del _NODE_CACHE[key]
+        except KeyError:
+            pass
+    _NODE_CACHE_STATS[1] += 1
+
+
+#------------------------------------------------------------------------------
+class _UUIDIndex(object):
+    u"""
+    `CyObject.byUUID` のための UUID インデックス。
+
+    uuid アトリビュートの UUID と Maya 標準の UUID それぞれから、
+    ノードの :mayaapi2:`MObjectHandle` のハッシュコードを得る辞書を保持する。
+    構築は最初の検索時に行われ、以降はコールバックで蓄積された
+    変更のあったノードだけが検索時に更新される。
+    """
+    __slots__ = ('built', 'pyTable', 'nativeTable', 'nodes', 'pending', 'callbacks',)
+
+    def __init__(self):
+        self.built = False
+        self.pyTable = {}  # py UUID: set(hashCode)
+        self.nativeTable = {}  # Maya UUID: set(hashCode)
+        self.nodes = {}  # hashCode: (MObjectHandle, py UUID, Maya UUID)
+        self.pending = []  # 更新が必要な MObjectHandle のリスト。
+        self.callbacks = {}  # hashCode: uuid アトリビュートを監視するコールバックID
+
+    def clear(self):
+        for cid in self.callbacks.values():
+            try:
+                _2_MMessage_removeCallback(cid)
+            except RuntimeError:
+                pass
+        self.__init__()
+
+    def build(self):
+        self.pending = []
+        it = _2_MItDependencyNodes()
+        while not it.isDone():
+            self.add(it.thisNode())
+            it.next()
+        self.built = True
+
+    def update(self):
+        if not self.built:
+            self.build()
+            return
+        pending = self.pending
+        if pending:
+            self.pending = []
+            for hdl in pending:
+                if hdl.isValid():
+                    self.add(hdl.object())
+                else:
+                    self.remove(hdl.hashCode())
+
+    def add(self, mnode):
+        hdl = _2_MObjectHandle(mnode)
+        hc = hdl.hashCode()
+        self.remove(hc)
+
+        mfn = _2_MFnDependencyNode(mnode)
+        native = _UUID(str(mfn.uuid())) if _HAS_NATIVE_UUID else None
+        pyid = None
+        if mfn.hasAttribute(UUID_ATTR_NAME):
+            try:
+                pyid = _UUID(mfn.findPlug(UUID_ATTR_NAME, False).asString())
+            except ValueError:
+                pass
+            self.callbacks[hc] = _2_MNodeMessage.addAttributeChangedCallback(mnode, _onUUIDIndexAttrChanged)
+
+        self.nodes[hc] = (hdl, pyid, native)
+        if pyid:
+            self.pyTable.setdefault(pyid, set()).add(hc)
+        if native:
+            self.nativeTable.setdefault(native, set()).add(hc)
+
+    def remove(self, hc):
+        entry = self.nodes.pop(hc, None)
+        if entry:
+            for table, key in ((self.pyTable, entry[1]), (self.nativeTable, entry[2])):
+                hcs = table.get(key)
+                if hcs:
+                    hcs.discard(hc)
+                    if not hcs:
+                        del table[key]
+        cid = self.callbacks.pop(hc, None)
+        if cid is not None:
+            try:
+                _2_MMessage_removeCallback(cid)
+            except RuntimeError:
+                pass
+
+    def find(self, uuids, py):
+        u"""
+        UUID リストにマッチする MObject のリストと、
+        Maya 標準の UUID の場合は見つからなかった UUID のリストを得る。
+        """
+        self.update()
+        table = self.pyTable if py else self.nativeTable
+        nodes = self.nodes
+        mnodes = []
+        missing = []
+        for uuid in uuids:
+            found = False
+            for hc in table.get(uuid, EMPTY_TUPLE):
+                hdl = nodes[hc][0]
+                if not hdl.isValid():
+                    self.pending.append(hdl)
+                    continue
+                mnode = hdl.object()
+                if py or _UUID(str(_2_MFnDependencyNode(mnode).uuid())) == uuid:
+                    mnodes.append(mnode)
+                    found = True
+                else:
+                    self.pending.append(hdl)
+            if not (py or found):
+                missing.append(uuid)
+        return mnodes, missing
+
+
+def _clearUUIDIndex():
+    if _UUID_INDEX is not None:
+        _UUID_INDEX.clear()
+
+
+def _touchUUIDIndex(mnode):
+    u"""
+    uuid アトリビュートを変更したノードをインデックスの更新対象にする。
+    """
+    if _UUID_INDEX is not None and _UUID_INDEX.built:
+        _UUID_INDEX.pending.append(_2_MObjectHandle(mnode))
+
+
+def _onUUIDIndexNodeAdded(mnode, *args):
+    # 追加時点ではアトリビュートが揃っていないこともあるので、検索時に更新する。
+    if _UUID_INDEX is not None and _UUID_INDEX.built:
+        _UUID_INDEX.pending.append(_2_MObjectHandle(mnode))
+
+
+def _onUUIDIndexNodeRemoved(mnode, *args):
+    if _UUID_INDEX is not None and _UUID_INDEX.built:
+        _UUID_INDEX.remove(_2_MObjectHandle(mnode).hashCode())
+
+
+def _onUUIDIndexAttrChanged(msg, mplug, other, *args):
+    if _UUID_INDEX is not None and _UUID_INDEX.built and (
+        msg & _2_MNodeMessage_kAttributeRenamed or
+        mplug.partialName(useLongNames=True) == UUID_ATTR_NAME
+    ):
+        _UUID_INDEX.pending.append(_2_MObjectHandle(mplug.node()))
+
+_HAS_NATIVE_UUID = MAYA_VERSION >= (2016,)
+_2_MNodeMessage_kAttributeRenamed = _2_MNodeMessage.kAttributeRenamed
+
 
 #------------------------------------------------------------------------------
 def _anyClsObjByObj(cls, obj):
@@ -739,7 +1498,7 @@ def _anyClsObjByObj(cls, obj):
     elif cls.CLASS_TYPE is CY_OBJREF:
         return _getObjectRef(obj, cls)
     elif obj.CLASS_TYPE is CY_NODE:
-        _checkNodeCls(cls, obj._CyObject__data['mfn'], obj.name(), obj)
+        _checkNodeCls(cls, obj._CyObject__data.mfn, obj.name(), obj)
     elif obj.CLASS_TYPE is CY_PLUG:
         _checkPlugCls(cls, obj)
     else:
@@ -751,13 +1510,26 @@ def _nodeClsObjByAPI2(cls, mpath, mnode, mfn, src, name=None):
     u"""
     クラス指定と API2 オブジェクトから Node か ObjectRef インスタンスを得る。
     """
-    if cls is CyObject:
-        cls = _decideClass(name or (mpath.partialPathName() if mpath else mfn.name()), mfn.typeName, lambda: mfn)
-    elif cls.CLASS_TYPE is CY_OBJREF:
+    if cls.CLASS_TYPE is CY_OBJREF:
         return _newNodeRefFromData(_makeNodeData(mpath, mnode, mfn), cls)
+
+    if _NODE_CACHE is not None:
+        key = _nodeCacheKey(cls, mpath, mnode)
+        obj = _getCachedNode(key, mpath, mnode)
+        if obj:
+            return obj
+
+    if cls is CyObject:
+        obj = _decideClass(
+            name or (mpath.partialPathName() if mpath else mfn.name()), mfn.typeName, lambda: mfn
+        ).newObject(_makeNodeData(mpath, mnode, mfn))
     else:
         _checkNodeCls(cls, mfn, name or (mpath.partialPathName() if mpath else mfn.name()), src)
-    return cls.newObject(_makeNodeData(mpath, mnode, mfn))
+        obj = cls.newObject(_makeNodeData(mpath, mnode, mfn))
+
+    if _NODE_CACHE is not None:
+        _NODE_CACHE[key] = obj
+    return obj
 
 
 def _nodeClsObjByMObj(cls, mnode):
@@ -776,20 +1548,8 @@ def _nodeClsObjByName(cls, name):
     u"""
     クラス指定とノード名から Node か ObjectRef インスタンスを得る。
     """
-    sel = _2_MSelectionList()
-    try:
-        sel.add(name)
-    except:
-        raise KeyError('not exist: ' + name)
-
-    try:
-        mpath = sel.getDagPath(0)
-    except TypeError:
-        mnode = sel.getDependNode(0)
-        return _nodeClsObjByAPI2(cls, None, mnode, _mnodeFn(mnode, mnode), name, name)
-    else:
-        mnode = mpath.node()
-        return _nodeClsObjByAPI2(cls, mpath, mnode, _mnodeFn(mpath, mnode), name, name)
+    mpath, mnode, mfn = _node3ArgsByName(name)
+    return _nodeClsObjByAPI2(cls, mpath, mnode, mfn, name, name)
 
 
 def _plugClsObjByMPlug(cls, mplug, src, nodeArgs=None):
@@ -812,28 +1572,338 @@ def _anyClsObjByName(cls, name):
     u"""
     クラス指定と名前から Node か Plug オブジェクトインスタンスを得る。
     """
+    mpath, mnode, mfn, mplug = _apiArgsByName(name)
+    if mplug is None:
+        return _nodeClsObjByAPI2(cls, mpath, mnode, mfn, name, name)
+    return _plugClsObjByMPlug(cls, mplug, name, (mpath, mnode, mfn))
+
+
+def _node3ArgsByName(name):
+    u"""
+    ノード名から、ノード用の3個の引数を得る。
+    """
+    mpath, mnode = _nodeByName(name)
+    return mpath, mnode, _mnodeFn(mpath or mnode, mnode)
+
+
+def _nodeByName(name, errname=None):
+    u"""
+    ノード名から、ノードの MDagPath （DAGノードでなければ None ）と MObject を得る。
+
+    ノード名の解決結果は LRU キャッシュされる。
+    キャッシュには MDagPath のコピーが保持され、
+    得られた MDagPath を変更してもキャッシュには影響しない。
+    """
+    if _NAME_CACHE_ENABLED:
+        cache = _NAME_CACHE
+        val = cache.pop(name, None)
+        if val:
+            hdl, mpath = val
+            if hdl.isValid() and (mpath is None or mpath.isValid()):
+                cache[name] = val
+                return (_2_MDagPath(mpath) if mpath else None), hdl.object()
+
+    sel = _2_MSelectionList()
+    try:
+        sel.add(name)
+    except:
+        raise KeyError('not exist: ' + (errname or name))
+
+    try:
+        mpath = sel.getDagPath(0)
+    except TypeError:
+        mpath = None
+        mnode = sel.getDependNode(0)
+    else:
+        mnode = mpath.node()
+
+    if _NAME_CACHE_ENABLED:
+        cache = _NAME_CACHE
+        cache[name] = (_2_MObjectHandle(mnode), _2_MDagPath(mpath) if mpath else None)
+        if len(cache) > _NAME_CACHE_SIZE:
+            cache.popitem(False)
+    return mpath, mnode
+
+
+def _clearNameCache(*args):
+    _NAME_CACHE.clear()
+
+
+def _addNameCacheCallbacks():
+    u"""
+    ノード名の解決結果のキャッシュを破棄するためのコールバックを登録する。
+
+    名前の変化は他のノードの名前の解決結果（一意性など）にも影響し得るため、
+    変更の都度キャッシュ全体を破棄する。
+    """
+    addCallback(('nameCache', 'name'), _2_MNodeMessage.addNameChangedCallback, _2_MObject.kNullObj, _clearNameCache)
+    addCallback(('nameCache', 'dag'), _2_MDagMessage.addAllDagChangesCallback, _clearNameCache)
+    addCallback(('nameCache', 'removed'), _2_MDGMessage.addNodeRemovedCallback, _clearNameCache, 'dependNode')
+    addSceneResetCallback('nameCache', _clearNameCache)
+
+_NAME_CACHE_ENABLED = True  #: ノード名の解決結果のキャッシュが有効かどうか。
+_NAME_CACHE_SIZE = 1000  #: ノード名の解決結果のキャッシュの最大エントリー数。
+_NAME_CACHE = _OrderedDict()  #: ノード名と (MObjectHandle, MDagPath) の LRU キャッシュ。
+_addNameCacheCallbacks()
+
+
+def _findMPlugByPath(mfnnode, nodetype, path, strict=False):
+    u"""
+    アトリビュートパス文字列から、キャッシュを利用して MPlug を得る。
+
+    パスを分解したトークンと、ノードタイプごとのアトリビュート MObject の解決結果が
+    LRU キャッシュされ、ヒット時にはロジカルインデックスの選択だけが行われる。
+    エイリアスを含むパスや、ダイナミックアトリビュートはノードごとに異なるため
+    解決結果はキャッシュされない。
+
+    得られない場合は `_MayaAPI2Errors` のいずれかになる。
+    """
+    if not _ATTRPATH_CACHE_ENABLED:
+        return _findComplexMPlug(mfnnode, _argToFindComplexMPlug(path.split('.')), False, strict)
+
+    stats = _ATTRPATH_CACHE_STATS
+    key = (nodetype, path, strict)
+    cache = _ATTRPATH_CACHE
+    val = cache.pop(key, None)
+    if val:
+        cache[key] = val
+        stats[0] += 1
+        leafAttr, ancestors, leafIdx = val
+        mplug = mfnnode.findPlug(leafAttr, False)
+        for mattr, idx in ancestors:
+            mplug.selectAncestorLogicalIndex(idx, mattr)
+        if leafIdx is not None:
+            if mplug.isElement:
+                raise RuntimeError()
+            mplug.selectAncestorLogicalIndex(leafIdx)
+        return mplug
+    stats[1] += 1
+
+    # パスの分解。
+    tcache = _ATTRPATH_TOKEN_CACHE
+    attrTkns = tcache.pop(path, None)
+    if attrTkns:
+        stats[2] += 1
+    else:
+        stats[3] += 1
+        attrTkns = _argToFindComplexMPlug(path.split('.'))
+        if len(tcache) >= _ATTRPATH_CACHE_SIZE:
+            tcache.popitem(False)
+    tcache[path] = attrTkns
+
+    mplug = _findComplexMPlug(mfnnode, attrTkns, False, strict)
+
+    # ノードに依存しない解決結果ならキャッシュする。
+    findAlias = mfnnode.findAlias
+    if any([(name and not findAlias(name).isNull()) for name, idx in attrTkns]):
+        return mplug
+    leafAttr = mplug.attribute()
+    mfn = _2_MFnAttribute(leafAttr)
+    if mfn.dynamic or mfn.extension:
+        return mplug
+    ancestors = []
+    for i, (name, idx) in enumerate(attrTkns[:-1]):
+        if name and idx is not None:
+            mattr = _findMAttr(mfnnode, attrTkns, i, True)
+            if mattr.isNull():
+                return mplug
+            ancestors.append((mattr, idx))
+    if len(cache) >= _ATTRPATH_CACHE_SIZE:
+        cache.popitem(False)
+    cache[key] = (leafAttr, ancestors, attrTkns[-1][1])
+    return mplug
+
+
+def _clearAttrPathCache(*args):
+    _ATTRPATH_CACHE.clear()
+    _ATTRPATH_TOKEN_CACHE.clear()
+
+_ATTRPATH_CACHE_ENABLED = True  #: アトリビュートパスの解決結果のキャッシュが有効かどうか。
+_ATTRPATH_CACHE_SIZE = 1000  #: アトリビュートパスのキャッシュの最大エントリー数。
+_ATTRPATH_CACHE = _OrderedDict()  #: (ノードタイプ, パス, strict) と解決結果の LRU キャッシュ。
+_ATTRPATH_TOKEN_CACHE = _OrderedDict()  #: パスと分解したトークンの LRU キャッシュ。
+_ATTRPATH_CACHE_STATS = [0, 0, 0, 0]  #: [解決のヒット数, ミス数, 分解のヒット数, ミス数] 。
+addPluginChangedCallback('attrPathCache', _clearAttrPathCache)
+
+
+def _shapeCacheVersion(hash):
+    u"""
+    :mayanode:`transform` のシェイプキャッシュの現在のバージョンを得る。
+    """
+    return _SHAPE_CACHE_VERSIONS_get(hash, _SHAPE_CACHE_GEN[1])
+
+
+def _getCachedShape(data, ver, key):
+    u"""
+    検証済みのシェイプキャッシュから得る。無ければ None 。
+    """
+    if _SHAPE_CACHE_ENABLED:
+        cache = data.shape
+        if cache[3] == ver:
+            shape = cache[2].get(key)
+            if shape is not None and shape.isValid():
+                _SHAPE_CACHE_STATS[0] += 1
+                return shape
+        _SHAPE_CACHE_STATS[1] += 1
+
+
+def _storeCachedShape(data, ver, key, shape):
+    u"""
+    取得し直したシェイプを検証済みのキャッシュにセットする。
+
+    インデックスによる結果は、取得していないシェイプの
+    intermediateObject の変更にも影響されるため、
+    :mayanode:`transform` の全てのシェイプを監視する。
+
+    :param ver: 取得前に `_shapeCacheVersion` で得たバージョン。
+    """
+    if _SHAPE_CACHE_ENABLED and shape is not None:
+        cache = data.shape
+        if cache[3] != ver:
+            cache[2].clear()
+            cache[3] = ver
+        cache[2][key] = shape
+
+        mfn = _2_MFnDagNode(data.mnode)
+        for i in range(mfn.childCount()):
+            mnode = mfn.child(i)
+            if mnode.hasFn(_MFn_kShape):
+                _watchShape(_2_MObjectHandle(mnode).hashCode(), mnode)
+
+
+def _isCachedShapeOf(data, shape):
+    u"""
+    シェイプが :mayanode:`transform` の検証済みのキャッシュに含まれるかどうか。
+    """
+    if _SHAPE_CACHE_ENABLED:
+        cache = data.shape
+        if cache[3] == _shapeCacheVersion(data.hash) and data.isValid():
+            for x in cache[2].values():
+                if x is shape:
+                    _SHAPE_CACHE_STATS[0] += 1
+                    return True
+        _SHAPE_CACHE_STATS[1] += 1
+    return False
+
+
+def _invalidateShapeCache(hash=None):
+    u"""
+    :mayanode:`transform` のシェイプキャッシュを無効化する。
+
+    :param hash: ノードのハッシュコード。 None なら全て。
+    """
+    gen = _SHAPE_CACHE_GEN
+    gen[0] += 1
+    if hash is None:
+        _SHAPE_CACHE_VERSIONS.clear()
+        gen[1] = gen[0]
+    else:
+        _SHAPE_CACHE_VERSIONS[hash] = gen[0]
+    _SHAPE_CACHE_STATS[2] += 1
+
+
+def _clearShapeCache(*args):
+    for hash, mhdls in list(_SHAPE_CACHE_WATCHED.items()):
+        for mhdl in mhdls:
+            _unwatchShapeCallbacks(hash, mhdl)
+    _SHAPE_CACHE_WATCHED.clear()
+    _invalidateShapeCache()
+
+
+def _watchShape(hash, mnode):
+    u"""
+    シェイプの intermediateObject の変更を監視するコールバックを登録する。
+
+    ハッシュコードは削除されたノードのものが再利用され得るので、
+    :mayaapi2:`MObjectHandle` で同一ノードかどうかを判定し、
+    ノードが削除される際には監視を解除する。
+    """
+    mhdls = _SHAPE_CACHE_WATCHED.get(hash)
+    if mhdls:
+        for mhdl in mhdls:
+            if mhdl.isAlive() and mhdl.object() == mnode:
+                return
+    else:
+        mhdls = []
+        _SHAPE_CACHE_WATCHED[hash] = mhdls
+    mhdl = _2_MObjectHandle(mnode)
+    mhdls.append(mhdl)
+
+    def removed(mnode, *args):
+        _unwatchShape(hash, mhdl)
+
+    key = ('shapeCache', hash, id(mhdl))
+    addCallback(key, _2_MNodeMessage.addAttributeChangedCallback, mnode, _shapeAttrChanged)
+    addCallback(key + ('removal',), _2_MNodeMessage.addNodePreRemovalCallback, mnode, removed)
+
+
+def _unwatchShape(hash, mhdl):
+    u"""
+    シェイプの監視を解除する。
+    """
+    mhdls = _SHAPE_CACHE_WATCHED.get(hash)
+    if mhdls and mhdl in mhdls:
+        mhdls.remove(mhdl)
+        if not mhdls:
+            del _SHAPE_CACHE_WATCHED[hash]
+        _unwatchShapeCallbacks(hash, mhdl)
+
+
+def _unwatchShapeCallbacks(hash, mhdl):
+    key = ('shapeCache', hash, id(mhdl))
+    removeCallback(key)
+    removeCallback(key + ('removal',))
+
+
+def _shapeAttrChanged(msg, mplug, otherMPlug, clientData):
+    if msg & _2_MNodeMessage_kAttributeSet and mplug.attribute() == _DagNode_io:
+        mfn = _2_MFnDagNode(mplug.node())
+        for i in range(mfn.parentCount()):
+            _invalidateShapeCache(_2_MObjectHandle(mfn.parent(i)).hashCode())
+
+
+def _dagChildChanged(child, parent, clientData):
+    _invalidateShapeCache(_2_MObjectHandle(parent.node()).hashCode())
+
+
+def _addShapeCacheCallbacks():
+    u"""
+    シェイプキャッシュを無効化するためのコールバックを登録する。
+
+    子の構成が変わった親のバージョンだけを更新する。
+    """
+    addCallback('shapeCache', _2_MDagMessage.addChildAddedCallback, _dagChildChanged)
+    addCallback(('shapeCache', 'removed'), _2_MDagMessage.addChildRemovedCallback, _dagChildChanged)
+    addCallback(('shapeCache', 'reordered'), _2_MDagMessage.addChildReorderedCallback, _dagChildChanged)
+    addSceneResetCallback('shapeCache', _clearShapeCache)
+
+_2_MNodeMessage_kAttributeSet = _2_MNodeMessage.kAttributeSet
+_DagNode_io = _api2.MNodeClass('dagNode').attribute('intermediateObject')
+_SHAPE_CACHE_ENABLED = True  #: シェイプ取得結果のキャッシュが有効かどうか。
+_SHAPE_CACHE_GEN = [0, 0]  #: [バージョンのカウンタ, バージョンの基準値] 。
+_SHAPE_CACHE_VERSIONS = {}  #: ノードのハッシュコードをキーとするシェイプキャッシュのバージョン。
+_SHAPE_CACHE_VERSIONS_get = _SHAPE_CACHE_VERSIONS.get
+_SHAPE_CACHE_WATCHED = {}  #: intermediateObject を監視中のシェイプのハッシュコードと MObjectHandle リストの辞書。
+_SHAPE_CACHE_STATS = [0, 0, 0]  #: [ヒット数, ミス数, 無効化の回数] 。
+_addShapeCacheCallbacks()
+
+
+def _apiArgsByName(name):
+    u"""
+    ノード名かプラグ名から、ノード用の3個の引数と MPlug を得る。
+
+    ノード名の場合、 MPlug は None となる。
+    """
     # ノード名指定ならノードを得る。
     tkns = name.split('.')
     if len(tkns) == 1:
-        return _nodeClsObjByName(cls, name)
+        return _node3ArgsByName(name) + (None,)
 
     # ノード名が指定されているなら、そのノードの API2 オブジェクトを得る。
     nodename = tkns[0]
     if nodename:
-        sel = _2_MSelectionList()
-        try:
-            sel.add(nodename)
-        except:
-            raise KeyError('not exist: ' + name)
-        try:
-            mpath = sel.getDagPath(0)
-        except TypeError:
-            mnode = sel.getDependNode(0)
-            mpath = None
-            mfn = _mnodeFn(mnode, mnode)
-        else:
-            mnode = mpath.node()
-            mfn = _mnodeFn(mpath, mnode)
+        mpath, mnode = _nodeByName(nodename, name)
+        mfn = _mnodeFn(mpath or mnode, mnode)
 
     # ノード名が省略されているなら、カレントセレクションから得る。
     else:
@@ -863,9 +1933,9 @@ def _anyClsObjByName(cls, name):
             #nodename = mpath.partialPathName()
 
     # ノードからプラグを取得。
-    argToFind = _argToFindComplexMPlug(tkns[1:])
+    path = '.'.join(tkns[1:])
     try:
-        mplug = _findComplexMPlug(mfn, argToFind)
+        mplug = _findMPlugByPath(mfn, mfn.typeName, path)
 
     # 得られなかったらシェイプからの取得も試みる。
     except _MayaAPI2Errors:
@@ -879,12 +1949,142 @@ def _anyClsObjByName(cls, name):
         mnode = mpath.node()
         mfn = _mnodeFn(mpath, mnode)
         try:
-            mplug = _findComplexMPlug(mfn, argToFind)
+            mplug = _findMPlugByPath(mfn, mfn.typeName, path)
         except _MayaAPI2Errors:
             raise KeyError('not exist: ' + name)
         #nodename = mpath.partialPathName()
 
-    return _plugClsObjByMPlug(cls, mplug, name, (mpath, mnode, mfn))
+    return mpath, mnode, mfn, mplug
+
+
+def _apiArgsByAPI2(src):
+    u"""
+    API2 オブジェクトから、ノード用の3個の引数と MPlug を得る。
+
+    ノードの場合、 MPlug は None となる。
+    """
+    if isinstance(src, _2_MDagPath):
+        mnode = src.node()
+        mfn = _mnodeFn(src, mnode)
+        if not mfn.inModel:
+            raise ValueError('world (not a model) MDagPath specified')
+        return src, mnode, mfn, None
+
+    if isinstance(src, _2_MObject):
+        if src.hasFn(_MFn_kDagNode):
+            mpath = _2_getAPathTo(src)
+            return mpath, src, _mnodeFn(mpath, src), None
+        return None, src, _mnodeFn(src, src), None
+
+    if isinstance(src, _2_MPlug):
+        if src.isNetworked:
+            src = toNonNetworkedMPlug(src)
+        return _node3ArgsByMPlug(src) + (src,)
+
+    raise TypeError('not supported API object: ' + repr(src))
+
+
+def _batchObjects(cls, argsList, srcs):
+    u"""
+    ノード用の3個の引数と MPlug のリストから、オブジェクトのリストを一括して得る。
+
+    ノードはノードタイプごとにグループ化され、
+    検査メソッド付きクラスの候補が無いグループでは、クラスの決定は一度だけ行われる。
+    同じノードのプラグ間では、ノードの ObjectRef がシェアされ、
+    そのノード自体も要求されていれば、プラグはノードにキャッシュされ、
+    クラス指定が無ければノードの plugClass で生成される。
+    """
+    refcls = None
+    if cls is CyObject:
+        pcls = None
+    elif cls.CLASS_TYPE is CY_OBJREF:
+        refcls = cls
+        cls = CyObject
+        pcls = None
+    else:
+        pcls = cls
+
+    # ノードごとにまとめる。
+    # ハッシュコードは衝突し得るので、同じキーでも MObject が異なれば別のエントリとする。
+    # entry = [mpath, mnode, mfn, node, noderef, src]
+    entries = {}
+    groups = {}
+    items = []
+    for (mpath, mnode, mfn, mplug), src in zip(argsList, srcs):
+        key = _nodeCacheKey(None, mpath, mnode)
+        bucket = entries.get(key)
+        entry = None
+        if bucket:
+            for x in bucket:
+                if mnode == x[1] and (not mpath or mpath == x[0]):
+                    entry = x
+                    break
+        else:
+            bucket = []
+            entries[key] = bucket
+        if not entry:
+            entry = [mpath, mnode, mfn, None, None, None]
+            bucket.append(entry)
+        if mplug is None:
+            if entry[5] is None:
+                entry[5] = src
+                grp = groups.get(entry[2].typeName)
+                if grp:
+                    grp.append(entry)
+                else:
+                    groups[entry[2].typeName] = [entry]
+        elif pcls:
+            _checkPlugCls(pcls, src)
+        items.append((entry, mplug))
+
+    # ノードタイプごとにクラスを決定してノードを生成する。
+    for typename, grp in groups.items():
+        entry = grp[0]
+        if cls is CyObject:
+            clss, ncls = _decideClassMemo(
+                entry[0].partialPathName() if entry[0] else entry[2].name(), typename)
+        else:
+            clss = ncls = None
+        for entry in grp:
+            mpath, mnode, mfn = entry[:3]
+
+            if _NODE_CACHE is not None:
+                key = _nodeCacheKey(cls, mpath, mnode)
+                node = _getCachedNode(key, mpath, mnode)
+                if node:
+                    entry[3] = node
+                    continue
+
+            if cls is not CyObject:
+                _checkNodeCls(cls, mfn, mpath.partialPathName() if mpath else mfn.name(), entry[5])
+                c = cls
+            elif clss:
+                c = _decideClass(mpath.partialPathName() if mpath else mfn.name(), typename, lambda: mfn)
+            else:
+                c = ncls
+            node = c.newObject(_makeNodeData(mpath, mnode, mfn))
+            if _NODE_CACHE is not None:
+                _NODE_CACHE[key] = node
+            entry[3] = node
+
+    # 入力順に結果を並べる。
+    results = []
+    for entry, mplug in items:
+        node = entry[3]
+        if mplug is None:
+            results.append(node)
+        elif node:
+            results.append(_newNodePlug(pcls or node.plugClass(), node, mplug))
+        else:
+            noderef = entry[4]
+            if not noderef:
+                noderef = _newNodeRefFromData(_makeNodeData(*entry[:3]))
+                entry[4] = noderef
+            results.append(_newNodeRefPlug(pcls or CyObject._CyObject__glbpcls, noderef, mplug))
+
+    if refcls:
+        return [_getObjectRef(x, refcls) for x in results]
+    return results
 
 
 #------------------------------------------------------------------------------
@@ -1022,6 +2222,12 @@ class ModuleForSel(types.ModuleType):
 
         :rtype: `.CyObject` or None
         """
+        if _SELCACHE_ENABLED:
+            objs = _SELCACHE_OBJS if _SELCACHE_OBJS is not None else _getSelectionWithCache()
+            if objs:
+                return objs[0]
+            return
+
         sel = _2_getActiveSelectionList()
         if sel.length():
         #    return _getObjectBySelIdx(sel, 0)
@@ -1047,6 +2253,12 @@ class ModuleForSel(types.ModuleType):
         :param `int` i: 参照するセレクションインデックス。
         :rtype: `.CyObject`
         """
+        if _SELCACHE_ENABLED:
+            objs = _SELCACHE_OBJS if _SELCACHE_OBJS is not None else _getSelectionWithCache()
+            if 0 <= i < len(objs):
+                return objs[i]
+            raise IndexError('invalid selection index: ' + str(i))
+
         sel = _2_getActiveSelectionList()
         if not i:
             if sel.length():
@@ -1083,6 +2295,8 @@ class ModuleForSel(types.ModuleType):
 
         # sel指定無しの場合は、カレントセレクションから。
         if not sel:
+            if _SELCACHE_ENABLED and not kwargs:
+                return list(_SELCACHE_OBJS if _SELCACHE_OBJS is not None else _getSelectionWithCache())
             if kwargs:
                 kwargs['sl'] = True
                 sel = _strsToSelList(_ls(**kwargs))
@@ -1121,6 +2335,140 @@ class ModuleForSel(types.ModuleType):
 
         return [_getObjectBySelIdx(sel, i, objMap) for i in range(sel.length())]
 
+    @staticmethod
+    def enableSelectionCache(enable=True):
+        u"""
+        セレクションのスナップショットキャッシュを有効化、又は無効化する。
+
+        有効にすると、 `sel` 、 `selection` 、 `selobj` 、
+        引数無しの `selected` で得られるオブジェクトが、
+        セレクションが変更されるまで再利用されるようになる。
+
+        キャッシュは :mayaapi2:`MEventMessage` の SelectionChanged と、
+        DAG の変更で無効化され、次にアクセスされたときに、
+        前回のセレクションと比較して新たに選択されたものだけが生成される。
+
+        :param `bool` enable: True だと有効、 False だと無効。
+        """
+        global _SELCACHE_ENABLED
+        _clearSelectionCache()
+        if enable:
+            addCallback(('selectionCache', 'sel'), _2_MEventMessage.addEventCallback, 'SelectionChanged', _onSelectionChanged)
+            addCallback(('selectionCache', 'dag'), _2_MDagMessage.addAllDagChangesCallback, _onSelectionChanged)
+            addSceneResetCallback('selectionCache', _clearSelectionCache)
+        else:
+            removeCallbacks('selectionCache')
+        _SELCACHE_ENABLED = enable
+
+    @staticmethod
+    def isSelectionCacheEnabled():
+        u"""
+        セレクションのスナップショットキャッシュが有効かどうか。
+
+        :rtype: `bool`
+        """
+        return _SELCACHE_ENABLED
+
+
+#------------------------------------------------------------------------------
+def _onSelectionChanged(*args):
+    u"""
+    セレクションの変更時に呼ばれ、スナップショットを無効化する。
+
+    前回のアイテムは差分の比較のために保持したままにする。
+    """
+    global _SELCACHE_OBJS
+    _SELCACHE_OBJS = None
+
+
+def _clearSelectionCache(*args):
+    u"""
+    セレクションのスナップショットを完全に破棄する。
+    """
+    global _SELCACHE_OBJS, _SELCACHE_MAP
+    _SELCACHE_OBJS = None
+    _SELCACHE_MAP = {}
+
+
+def _getSelectionWithCache():
+    u"""
+    現在のセレクションのスナップショットを更新して得る。
+
+    前回のスナップショットと比較し、
+    有効なまま選択され続けているものは再利用され、
+    新たに選択されたものだけが生成される。
+    """
+    global _SELCACHE_OBJS, _SELCACHE_MAP
+
+    sel = _2_getActiveSelectionList()
+    oldMap = _SELCACHE_MAP
+    newMap = {}
+    objs = []
+    news = []
+    for i in range(sel.length()):
+        key, mpath, mnode = _selItemKey(sel, i)
+        obj = oldMap.get(key)
+        if obj and obj.isValid():
+            dt = obj._CyObject__data
+            if _isSameNodeData(dt.nodedata if obj.CLASS_TYPE is CY_PLUG else dt, mpath, mnode):
+                newMap[key] = obj
+                objs.append(obj)
+                continue
+        news.append((len(objs), key, i))
+        objs.append(None)
+
+    # 新たに選択されたものを生成する。
+    # 再利用したノードを objMap に入れておき、新規のプラグと共有させる。
+    if news:
+        objMap = {}
+        for obj in objs:
+            if obj and obj.CLASS_TYPE is CY_NODE:
+                objMap[obj.name_()] = (obj, None)
+        for j, key, i in news:
+            obj = _getObjectBySelIdx(sel, i, objMap)
+            newMap[key] = obj
+            objs[j] = obj
+
+    _SELCACHE_MAP = newMap
+    _SELCACHE_OBJS = objs
+    return objs
+
+
+def _selItemKey(sel, idx):
+    u"""
+    セレクションアイテムを識別するキーと、ノードの MDagPath と MObject を得る。
+    """
+    try:
+        mplug = sel.getPlug(idx)
+    except TypeError:
+        mplug = None
+    else:
+        if mplug.isNull:
+            mplug = None
+
+    if mplug:
+        mpath, mnode = _getMPlugNode(mplug)
+        attrname = mplug.partialName(includeNonMandatoryIndices=True, includeInstancedIndices=True)
+    else:
+        try:
+            mpath = sel.getDagPath(idx)
+        except TypeError:
+            mpath = None
+            mnode = sel.getDependNode(idx)
+        else:
+            mnode = mpath.node()
+        attrname = None
+
+    return (
+        _2_MObjectHandle(mnode).hashCode(),
+        mpath.instanceNumber() if mpath else -1,
+        attrname,
+    ), mpath, mnode
+
+_SELCACHE_ENABLED = False  #: セレクションのスナップショットキャッシュが有効かどうか。
+_SELCACHE_OBJS = None  #: セレクションのスナップショット。無効化されていると None となる。
+_SELCACHE_MAP = {}  #: スナップショットのアイテムのキーとオブジェクトの辞書。
+
 
 #------------------------------------------------------------------------------
 def _getSel0WithCache(sel):
@@ -1146,9 +2494,9 @@ def _getSel0WithCache(sel):
 
             # キャッシュがプラグなら、それを再利用できればする。またはノードだけでも再利用できればする。
             if _LAST_SEL.CLASS_TYPE is CY_PLUG:
-                noderef = dt['noderef']
+                noderef = dt.noderef
                 if _isSameNodeData(noderef._CyObject__data, mpath, mnode):
-                    if dt['attrname'][1:] != mplug.partialName(includeNonMandatoryIndices=True, includeInstancedIndices=True):
+                    if dt.attrname[1:] != mplug.partialName(includeNonMandatoryIndices=True, includeInstancedIndices=True):
                         #print("### reusing cached plug's node, and new plug ###");
                         _LAST_SEL = _newNodeRefPlug(CyObject._CyObject__glbpcls, noderef, mplug)
                     #else:
@@ -1184,7 +2532,7 @@ def _getSel0WithCache(sel):
 
             # キャッシュがプラグなら、そのノードを再利用できればする。
             if _LAST_SEL.CLASS_TYPE is CY_PLUG:
-                noderef = dt['noderef']
+                noderef = dt.noderef
                 if _isSameNodeData(noderef._CyObject__data, mpath, mnode):
                     _LAST_SEL = noderef()
                     #print("### reusing cached plug's node ###");
@@ -1209,9 +2557,9 @@ _LAST_SEL = None
 
 def _isSameNodeData(data, mpath, mnode):
     if mpath:
-        mp = data.get('mpath')
-        return mp and mp == mpath
-    return mnode == data['mnode']
+        mp = data.mpath
+        return mp is not None and mp == mpath
+    return mnode == data.mnode
 
 
 def _objMapFor_getObjectBySelIdx():
@@ -1345,12 +2693,21 @@ def _getNodeObjBySelIdx(sel, idx, basecls=None):
     else:
         nodeArgs = _node4ArgsBySelIdx(sel, idx)
 
+    if _NODE_CACHE is not None:
+        key = _nodeCacheKey(basecls or CyObject, nodeArgs[0], nodeArgs[1])
+        obj = _getCachedNode(key, nodeArgs[0], nodeArgs[1])
+        if obj:
+            return obj
+
     name = nodeArgs[-1]
     mfn = nodeArgs[-2]
     cls = _decideClass(name, mfn.typeName, lambda: mfn, basecls)
 
     if cls:
-        return cls.newObject(_makeNodeData(*nodeArgs))
+        obj = cls.newObject(_makeNodeData(*nodeArgs))
+        if _NODE_CACHE is not None:
+            _NODE_CACHE[key] = obj
+        return obj
 
 
 def _getPlugObjBySelIdx(sel, idx, pcls, objMap=None):
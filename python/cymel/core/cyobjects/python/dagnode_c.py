@@ -8,9 +8,10 @@ from __future__ import print_function
 
 from ...common import *
 from ._api2attrname import IS_SUPPORTING_NON_UNIQUE_ATTR_NAMES, _MayaAPI2RuntimeError
-from .cyobject import _newNodeObjByMPath
+from .cyobject import _newNodeObjByMPath, _isCachedShapeOf
 from .objectref import _getObjectRef
 from ._api2mplug import mplug_get_nums, mplug_get_xformmatrix
+from ._mplugarray import _requireNumpy
 from ..datatypes.boundingbox import _newBB
 from ..datatypes.matrix import _newM, ImmutableMatrix
 from ..datatypes.quaternion import _newQ
@@ -18,8 +19,13 @@ from ..datatypes.vector import _newV
 from ..datatypes.transformation import _newX
 from ..datatypes import E
 import maya.api.OpenMaya as _api2
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+from itertools import chain as _chain
 
-__all__ = []
+__all__ = ['getMatrices', 'sampleMatrices', 'boundingBoxes', 'unionBoundingBox']
 
 _REVERSE_RO = E.REVERSE_ORDER
 
@@ -32,6 +38,7 @@ _MQ = _api2.MQuaternion
 _ME = _api2.MEulerRotation
 _MP = _api2.MPoint
 _MV = _api2.MVector
+_MBB = _api2.MBoundingBox
 if MAYA_VERSION >= (2016, 5):
     _2_MItDag = _api2.MItDag
 
@@ -41,6 +48,13 @@ _MFn_kJoint = _MFn.kJoint
 _2_getAllPathsTo = _2_MDagPath.getAllPathsTo
 _2_getAPathTo = _2_MDagPath.getAPathTo
 _MSpace_kTransform = _api2.MSpace.kTransform
+_2_MFnMatrixData = _api2.MFnMatrixData
+_2_MDGContext = _api2.MDGContext
+_2_MDGContextGuard = getattr(_api2, 'MDGContextGuard', None)  # 2018 以降。
+_2_MTime = _api2.MTime
+_2_MTime_uiUnit = _2_MTime.uiUnit
+_currentTime = cmds.currentTime
+_chain_from_iterable = _chain.from_iterable
 
 if IS_SUPPORTING_NON_UNIQUE_ATTR_NAMES:
     __nodeAttr = lambda f, n: f.attribute('.' + n)
@@ -59,6 +73,14 @@ _Transform_rp = __nodeAttr(_TransformCls, 'rp')
 _Transform_rpt = __nodeAttr(_TransformCls, 'rpt')
 _Transform_sp = __nodeAttr(_TransformCls, 'sp')
 _Transform_spt = __nodeAttr(_TransformCls, 'spt')
+_Transform_m = __nodeAttr(_TransformCls, 'm')
+_Transform_im = __nodeAttr(_TransformCls, 'im')
+
+_DagNodeCls = _api2.MNodeClass('dagNode')
+_DagNode_wm = __nodeAttr(_DagNodeCls, 'wm')
+_DagNode_wim = __nodeAttr(_DagNodeCls, 'wim')
+_DagNode_pm = __nodeAttr(_DagNodeCls, 'pm')
+_DagNode_pim = __nodeAttr(_DagNodeCls, 'pim')
 
 _JointCls = _api2.MNodeClass('joint')
 _Joint_jo = __nodeAttr(_JointCls, 'jo')
@@ -776,7 +798,7 @@ class DagNodeMixin(object):
         allIdxDict = dict([(x.name(), i) for i, x in enumerate(mfns)])
 
         # 既存のキャッシュを取得。
-        oldCache0, oldCache1 = self._CyObject__data['shape']
+        oldCache0, oldCache1 = self._CyObject__data.shape[:2]
 
         # 現在のシェイプ構成に合わせて、既存のキャッシュから可能な限り引き継ぐ。
         cache1 = {}
@@ -798,14 +820,14 @@ class DagNodeMixin(object):
                 # all
                 for i in allIdxDict.values():
                     shape = _newNodeObjByMPath(_2_MDagPath(orig).push(mfns[i].object()))
-                    shape._CyObject__data['transform'] = wref
+                    shape._CyObject__data.transform = wref
                     cache1[i] = shape
             else:
                 # not intermediate
                 for i in allIdxDict.values():
                     if not mfns[i].isIntermediateObject:
                         shape = _newNodeObjByMPath(_2_MDagPath(orig).push(mfns[i].object()))
-                        shape._CyObject__data['transform'] = wref
+                        shape._CyObject__data.transform = wref
                         cache1[i] = shape
 
         # all を参照しながら not intermediate キャッシュを生成。
@@ -818,7 +840,9 @@ class DagNodeMixin(object):
                 k0 += 1
 
         # 新しいキャッシュをセット。
-        self._CyObject__data['shape'] = [cache0, cache1]
+        shapeCache = self._CyObject__data.shape
+        shapeCache[0] = cache0
+        shapeCache[1] = cache1
 
         # オプションに応じた list を返す。
         if others:
@@ -862,18 +886,25 @@ class DagNodeMixin(object):
 
         :rtype: `.Transform` or None
         """
-        # キャッシュが古い可能性があるので、MDagPath は毎回取得し直す。
-        mpath = _2_MDagPath(self._CyObject__data['mpath'])
+        # transform の検証済みのキャッシュに自身が在れば、それを返す。
+        obj = self._CyObject__data.transform
+        if obj:
+            obj = obj()
+            if obj and _isCachedShapeOf(obj._CyObject__data, self):
+                return obj
+
+        # キャッシュが古い可能性があるので、MDagPath は取得し直す。
+        mpath = _2_MDagPath(self._CyObject__data.mpath)
         try:
             mpath.pop()
         except _MayaAPI2RuntimeError:
             return
 
         # キャッシュが在ればそれを再利用、無ければ新規生成する。
-        obj = self._CyObject__data['transform']
+        obj = self._CyObject__data.transform
         if obj:
             obj = obj()
-            if obj and obj.isValid() and obj._CyObject__data['mpath'] == mpath:
+            if obj and obj.isValid() and obj._CyObject__data.mpath == mpath:
                 return obj
         obj = _newNodeObjByMPath(mpath)
 
@@ -881,7 +912,7 @@ class DagNodeMixin(object):
         k0 = 0  # not intermediate
         k1 = 0  # all
         get = mpath.child
-        shape_mnode = self._CyObject__data['mnode']
+        shape_mnode = self._CyObject__data.mnode
         for i in range(mpath.childCount()):
             mnode = get(i)
             if mnode == shape_mnode:
@@ -892,9 +923,9 @@ class DagNodeMixin(object):
                     k0 += 1
 
         # 相互キャッシュを生成。
-        obj._CyObject__data['shape'][0][k0] = self
-        obj._CyObject__data['shape'][1][k1] = self
-        self._CyObject__data['tranform'] = _getObjectRef(obj).weakref()
+        obj._CyObject__data.shape[0][k0] = self
+        obj._CyObject__data.shape[1][k1] = self
+        self._CyObject__data.transform = _getObjectRef(obj).weakref()
         return obj
 
     def isInstanceable(self):
@@ -1305,6 +1336,189 @@ class DagNodeMixin(object):
     getT = getTranslation  #: `getTranslation` の別名。
 
 
+#------------------------------------------------------------------------------
+def getMatrices(nodes, ws=True, p=False, inv=False):
+    u"""
+    複数のノードのマトリックスをまとめて NumPy 配列として得る。
+
+    `.DagNode.getMatrix` と同じ値が得られるが、
+    各ノードがキャッシュしている :mayaapi2:`MDagPath` から直接得て、
+    `.Matrix` オブジェクトは生成しない。
+
+    NumPy がインストールされていない場合は ImportError となる。
+
+    :param `iterable` nodes: `.DagNode` のリスト。
+    :param `bool` ws: ワールド空間で得るかどうか。
+    :param `bool` p: 親のマトリックスを得るかどうか。
+    :param `bool` inv: 逆行列を得るかどうか。
+    :returns: (ノード数, 4, 4) の形状の float64 配列。
+    :rtype: numpy.ndarray
+    """
+    _requireNumpy()
+    get = _MATRIX_GETTERS[(bool(ws), bool(p), bool(inv))]
+    mats = [get(x) for x in nodes]
+    num = len(mats)
+    return _np.fromiter(
+        _chain_from_iterable(mats), dtype=_np.float64, count=num * 16).reshape(num, 4, 4)
+
+
+def sampleMatrices(nodes, times, ws=True, p=False, inv=False):
+    u"""
+    複数のノードの複数の時間におけるマトリックスをまとめて得る。
+
+    値は :mayaapi2:`MDGContext` によって評価されるため、
+    カレントタイムは変更されず、シーン全体の評価も行われない。
+
+    ワールド空間では worldMatrix などのインスタンス番号に応じたプラグ、
+    ローカル空間では matrix や inverseMatrix のプラグから得られる。
+
+    NumPy がインストールされていない場合は ImportError となる。
+
+    :param `iterable` nodes: `.DagNode` のリスト。
+    :param `iterable` times: UI設定単位の時間のリスト。
+    :param `bool` ws: ワールド空間で得るかどうか。
+    :param `bool` p: 親のマトリックスを得るかどうか。
+    :param `bool` inv: 逆行列を得るかどうか。
+    :returns: (時間数, ノード数, 4, 4) の形状の float64 配列。
+    :rtype: numpy.ndarray
+    """
+    _requireNumpy()
+    mplugs = [_matrixPlug(x, ws, p, inv) for x in nodes]
+    times = list(times)
+    num = len(mplugs) * 16
+
+    def sample():
+        buf.append(_np.fromiter(_chain_from_iterable([
+            (_IDENTITY_MATRIX if x is None else _2_MFnMatrixData(x.asMObject()).matrix()) for x in mplugs
+        ]), dtype=_np.float64, count=num))
+
+    buf = []
+    uiUnit = _2_MTime_uiUnit()
+    if _2_MDGContextGuard:
+        for t in times:
+            with _2_MDGContextGuard(_2_MDGContext(_2_MTime(t, uiUnit))):
+                sample()
+    else:
+        # 2017 以前はカレントタイムを更新せずに変更して評価する。
+        cur = _currentTime(q=True)
+        try:
+            for t in times:
+                _currentTime(t, u=False)
+                sample()
+        finally:
+            _currentTime(cur, u=False)
+
+    if not buf:
+        return _np.empty((0, len(mplugs), 4, 4), dtype=_np.float64)
+    return _np.array(buf).reshape(len(buf), len(mplugs), 4, 4)
+
+
+def boundingBoxes(nodes, ws=True):
+    u"""
+    複数のノードのバウンディングボックスをまとめて NumPy 配列として得る。
+
+    `.DagNode.boundingBox` と同じ値が得られるが、
+    ワールド空間への変換は :mayaapi2:`MBoundingBox` の
+    transformUsing をノードごとに呼ぶのではなく、
+    全てのノードの8つのコーナーを NumPy でまとめて変換して計算する。
+
+    NumPy がインストールされていない場合は ImportError となる。
+
+    :param `iterable` nodes: `.DagNode` のリスト。
+    :param `bool` ws: ワールド空間で得るかどうか。
+    :returns: (ノード数, 2, 3) の形状の最小と最大の float64 配列。
+    :rtype: numpy.ndarray
+    """
+    _requireNumpy()
+    nodes = list(nodes)
+    num = len(nodes)
+    bbs = [x.mfn().boundingBox for x in nodes]
+    res = _np.fromiter(
+        _chain_from_iterable([(b.min.x, b.min.y, b.min.z, b.max.x, b.max.y, b.max.z) for b in bbs]),
+        dtype=_np.float64, count=num * 6).reshape(num, 2, 3)
+    if not ws or not num:
+        return res
+
+    mats = [x._mpath_().exclusiveMatrix() for x in nodes]
+    mats = _np.fromiter(
+        _chain_from_iterable(mats), dtype=_np.float64, count=num * 16).reshape(num, 4, 4)
+
+    # 最小と最大の組み合わせによる8つのコーナー (N,8,3) を行ベクトルとして変換する。
+    corners = res[:, _BB_CORNER_INDICES, [0, 1, 2]]
+    corners = _np.einsum('nkj,nji->nki', corners, mats[:, :3, :3]) + mats[:, None, 3, :3]
+    return _np.stack([corners.min(axis=1), corners.max(axis=1)], axis=1)
+
+
+def unionBoundingBox(nodes, ws=True):
+    u"""
+    複数のノードのバウンディングボックスを全て含むバウンディングボックスを得る。
+
+    `boundingBoxes` によってまとめて計算される。
+
+    NumPy がインストールされていない場合は ImportError となる。
+
+    :param `iterable` nodes: `.DagNode` のリスト。
+    :param `bool` ws: ワールド空間で得るかどうか。
+    :rtype: `.BoundingBox`
+    """
+    bbs = boundingBoxes(nodes, ws)
+    if not len(bbs):
+        return _newBB(_MBB())
+    return _newBB(_MBB(_MP(bbs[:, 0].min(axis=0).tolist()), _MP(bbs[:, 1].max(axis=0).tolist())))
+
+
+def _getLocalMatrix(node, inv):
+    if node.isTransform():
+        if inv:
+            return node.mfn().transformationMatrix().inverse()
+        return node.mfn().transformationMatrix()
+    return _IDENTITY_MATRIX
+
+
+def _getParentLocalMatrix(node, inv):
+    mpath = _2_MDagPath(node._mpath()).pop()
+    if inv:
+        return mpath.exclusiveMatrix() * mpath.inclusiveMatrixInverse()
+    return mpath.inclusiveMatrix() * mpath.exclusiveMatrixInverse()
+
+
+def _matrixPlug(node, ws, p, inv):
+    u"""
+    `sampleMatrices` で評価するプラグを得る。単位行列とすべき場合は None 。
+    """
+    mpath = node._mpath()
+    if ws:
+        if p:
+            mattr = _DagNode_pim if inv else _DagNode_pm
+        else:
+            mattr = _DagNode_wim if inv else _DagNode_wm
+        return node.mfn_().findPlug(mattr, True).elementByLogicalIndex(mpath.instanceNumber())
+
+    if p:
+        mpath = _getParentPath(mpath)
+        if not mpath.length():
+            return
+    elif not node.isTransform():
+        return
+    return _2_MFnDagNode(mpath).findPlug(_Transform_im if inv else _Transform_m, True)
+
+
+_IDENTITY_MATRIX = _MM()
+
+_BB_CORNER_INDICES = [[(i >> j) & 1 for j in range(3)] for i in range(8)]  #: 8つのコーナーの (min=0, max=1) の選択。
+
+_MATRIX_GETTERS = {
+    (True, True, True): lambda x: x._mpath().exclusiveMatrixInverse(),
+    (True, True, False): lambda x: x._mpath().exclusiveMatrix(),
+    (True, False, True): lambda x: x._mpath().inclusiveMatrixInverse(),
+    (True, False, False): lambda x: x._mpath().inclusiveMatrix(),
+    (False, True, True): lambda x: _getParentLocalMatrix(x, True),
+    (False, True, False): lambda x: _getParentLocalMatrix(x, False),
+    (False, False, True): lambda x: _getLocalMatrix(x, True),
+    (False, False, False): lambda x: _getLocalMatrix(x, False),
+}
+
+
 #------------------------------------------------------------------------------
 def _indexOfArr(obj, get, num):
     for i in range(num):
@@ -1326,7 +1540,7 @@ def _searchShapeCache(cache, key, mnode):
         if not shape.isValid():
             # 無効だったら削除。
             del cache[k]
-        elif shape._CyObject__data['mnode'] == mnode:
+        elif shape._CyObject__data.mnode == mnode:
             # 目的のものなら、キャッシュを作り直し。
             del cache[k]
             cache[key] = shape
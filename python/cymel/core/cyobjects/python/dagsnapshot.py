@@ -0,0 +1,408 @@
+# -*- coding: utf-8 -*-
+u"""
+シーン全体のDAG階層のスナップショット。
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from ...common import *
+from array import array as _array
+from weakref import ref as _wref
+from .._callbacks import removeCallbacks, addCallback, addSceneResetCallback
+from .cyobject import _newNodeObjByMPath
+import maya.api.OpenMaya as _api2
+
+__all__ = ['DagSnapshot']
+
+_MFn = _api2.MFn
+_MFn_kShape = _MFn.kShape
+_MFn_kTransform = _MFn.kTransform
+_2_MDagPath = _api2.MDagPath
+_2_MItDag = _api2.MItDag
+_2_MFnDagNode = _api2.MFnDagNode
+_2_MObjectHandle = _api2.MObjectHandle
+_2_MDagMessage = _api2.MDagMessage
+
+_BIT_SHAPE = 1
+_BIT_INTERMEDIATE = 2
+_BIT_TRANSFORM = 4
+_BIT_INSTANCED = 8
+
+
+#------------------------------------------------------------------------------
+class DagSnapshot(object):
+    u"""
+    シーン全体のDAG階層のスナップショット。
+
+    :mayaapi2:`MItDag` による1回の走査で、
+    全てのDAGパスの親、最初の子、次の兄弟のインデックスや、
+    パス長、兄弟インデックス、インスタンス番号をコンパクトな配列として保持し、
+    `.DagNode` の階層問い合わせメソッドと同等のものを
+    API 呼び出し無しで提供する。
+
+    DAGの変更があるとスナップショットは古くなったものとされ、
+    問い合わせは RuntimeError となる。
+    `update` で再構築できる。
+
+    アンダーワールドノード（カーブオンサーフェース等）は含まれない。
+
+    >>> import maya.cmds as cmds
+    >>> import cymel.main as cm
+    >>> cmds.file(f=True, new=True)
+    u'untitled'
+    >>> a = cm.nt.Transform(n='a')
+    >>> b = cm.nt.Transform(n='b', p=a)
+    >>> snap = cm.DagSnapshot()
+    >>> snap.parent(b) == a
+    True
+    >>> snap.pathLength(b)
+    2
+    >>> c = cm.nt.Transform(n='c')
+    >>> snap.isStale()
+    True
+    """
+    def __init__(self):
+        self.__key = 'dagSnapshot%d' % id(self)
+        self.__stale = True
+        self.update()
+
+    def __del__(self):
+        try:
+            removeCallbacks(self.__key)
+        except Exception:
+            pass
+
+    def __len__(self):
+        self.__check()
+        return len(self.__paths)
+
+    def isStale(self):
+        u"""
+        構築後にDAGが変更され、スナップショットが古くなったかどうか。
+
+        :rtype: `bool`
+        """
+        return self.__stale
+
+    def update(self):
+        u"""
+        スナップショットを再構築する。
+        """
+        paths = []
+        handles = {}
+        parents = _array('i')
+        firstChildren = _array('i')
+        nextSiblings = _array('i')
+        lengths = _array('i')
+        sibIndices = _array('i')
+        instNums = _array('i')
+        flags = bytearray()
+        lastChildren = {}
+        numChildren = {}
+
+        stack = []
+        it = _2_MItDag()
+        while not it.isDone():
+            mpath = it.getPath()
+            n = mpath.length()
+            if not n:
+                it.next()
+                continue
+
+            i = len(paths)
+            while stack and lengths[stack[-1]] >= n:
+                stack.pop()
+            parent = stack[-1] if stack else -1
+            stack.append(i)
+
+            mnode = it.currentItem()
+            if mnode.hasFn(_MFn_kShape):
+                bits = _BIT_SHAPE
+            elif mnode.hasFn(_MFn_kTransform):
+                bits = _BIT_TRANSFORM
+            else:
+                bits = 0
+            if _2_MFnDagNode(mnode).isIntermediateObject:
+                bits |= _BIT_INTERMEDIATE
+
+            paths.append(mpath)
+            parents.append(parent)
+            firstChildren.append(-1)
+            nextSiblings.append(-1)
+            lengths.append(n)
+            flags.append(bits)
+
+            sidx = numChildren.get(parent, 0)
+            numChildren[parent] = sidx + 1
+            sibIndices.append(sidx)
+            prev = lastChildren.get(parent)
+            if prev is None:
+                if parent >= 0:
+                    firstChildren[parent] = i
+            else:
+                nextSiblings[prev] = i
+            lastChildren[parent] = i
+
+            if it.isInstanced(True):
+                flags[i] |= _BIT_INSTANCED
+                instNums.append(mpath.instanceNumber())
+            else:
+                instNums.append(0)
+
+            # インスタンスやハッシュコードの衝突のため、同じキーのインデックスはリストで保持する。
+            key = _2_MObjectHandle(mnode).hashCode()
+            idx = handles.get(key)
+            if idx is None:
+                handles[key] = [i]
+            else:
+                idx.append(i)
+            it.next()
+
+        self.__paths = paths
+        self.__handles = handles
+        self.__parents = parents
+        self.__firstChildren = firstChildren
+        self.__nextSiblings = nextSiblings
+        self.__lengths = lengths
+        self.__sibIndices = sibIndices
+        self.__instNums = instNums
+        self.__flags = flags
+        self.__roots = [i for i in range(len(paths)) if parents[i] < 0]
+
+        ref = _wref(self)
+
+        def callback(*args):
+            obj = ref()
+            if obj is not None:
+                obj._DagSnapshot__stale = True
+        key = self.__key
+        addCallback((key, 'dag'), _2_MDagMessage.addAllDagChangesCallback, callback)
+        addSceneResetCallback(key, callback)
+        self.__stale = False
+
+    def indexOf(self, node):
+        u"""
+        ノードのスナップショット上のインデックスを得る。
+
+        インデックスはDAG階層の深さ優先順となっている。
+
+        :type node: `.DagNode`
+        :param node: 検査するノード。
+        :rtype: `int`
+        """
+        self.__check()
+        data = node._CyObject__data
+        mpath = data.mpath
+        if mpath:
+            paths = self.__paths
+            for i in self.__handles.get(data.hash, EMPTY_TUPLE):
+                if paths[i] == mpath:
+                    return i
+        raise KeyError('node is not in the snapshot: ' + node.name_())
+
+    def node(self, idx):
+        u"""
+        インデックスからノードを得る。
+
+        :param `int` idx: インデックス。
+        :rtype: `.DagNode`
+        """
+        self.__check()
+        return _newNodeObjByMPath(_2_MDagPath(self.__paths[idx]))
+
+    def nodes(self):
+        u"""
+        全ノードの深さ優先順のリストを得る。
+
+        :rtype: `list`
+        """
+        self.__check()
+        return [_newNodeObjByMPath(_2_MDagPath(x)) for x in self.__paths]
+
+    def roots(self):
+        u"""
+        全ルートノードのリストを得る。
+
+        :rtype: `list`
+        """
+        self.__check()
+        return [self.__node(i) for i in self.__roots]
+
+    def root(self, node):
+        u"""
+        `.DagNode.root` と同等。
+
+        :rtype: `.Transform`
+        """
+        i = self.indexOf(node)
+        parents = self.__parents
+        j = parents[i]
+        if j < 0:
+            return node
+        while parents[j] >= 0:
+            j = parents[j]
+        return self.__node(j)
+
+    def parent(self, node):
+        u"""
+        `.DagNode.parent` と同等。
+
+        :rtype: `.DagNode` or None
+        """
+        j = self.__parents[self.indexOf(node)]
+        if j >= 0:
+            return self.__node(j)
+
+    def numChildren(self, node, shapes=False, intermediates=False):
+        u"""
+        `.DagNode.numChildren` と同等。
+
+        :rtype: `int`
+        """
+        return len(self.__childIndices(self.indexOf(node), shapes, intermediates))
+
+    def children(self, node, shapes=False, intermediates=False):
+        u"""
+        `.DagNode.children` と同等。
+
+        :rtype: `list`
+        """
+        return [self.__node(j) for j in self.__childIndices(self.indexOf(node), shapes, intermediates)]
+
+    def siblings(self, node):
+        u"""
+        `.DagNode.siblings` と同等。
+
+        :rtype: `list`
+        """
+        i = self.indexOf(node)
+        p = self.__parents[i]
+        if p < 0:
+            return [self.__node(j) for j in self.__roots if j != i]
+        return [self.__node(j) for j in self.__childIndices(p, True, True) if j != i]
+
+    def leaves(self, node):
+        u"""
+        `.DagNode.leaves` と同等。
+
+        :rtype: `list`
+        """
+        i = self.indexOf(node)
+        firstChildren = self.__firstChildren
+        if firstChildren[i] < 0:
+            return [node]
+
+        # 深さ優先順なので、パス長がより長い連続範囲が階層下となる。
+        lengths = self.__lengths
+        n = lengths[i]
+        res = []
+        for j in range(i + 1, len(lengths)):
+            if lengths[j] <= n:
+                break
+            if firstChildren[j] < 0:
+                res.append(self.__node(j))
+        return res
+
+    def pathLength(self, node):
+        u"""
+        `.DagNode.pathLength` と同等。
+
+        :rtype: `int`
+        """
+        return self.__lengths[self.indexOf(node)]
+
+    def siblingIndex(self, node):
+        u"""
+        `.DagNode.siblingIndex` と同等。
+
+        :rtype: `int`
+        """
+        return self.__sibIndices[self.indexOf(node)]
+
+    def siblingIndices(self, node):
+        u"""
+        `.DagNode.siblingIndices` と同等。
+
+        :rtype: `list`
+        """
+        i = self.indexOf(node)
+        parents = self.__parents
+        sibIndices = self.__sibIndices
+        res = []
+        while i >= 0:
+            res.append(sibIndices[i])
+            i = parents[i]
+        res.reverse()
+        return res
+
+    def lengthAndSiblingIndices(self, node):
+        u"""
+        `.DagNode.lengthAndSiblingIndices` と同等。
+
+        :rtype: (int, `list`)
+        """
+        k = self.siblingIndices(node)
+        return len(k), k
+
+    def isInstanced(self, node):
+        u"""
+        `.DagNode.isInstanced` と同等（間接的なものも含む）。
+
+        :rtype: `bool`
+        """
+        return bool(self.__flags[self.indexOf(node)] & _BIT_INSTANCED)
+
+    def instanceIndex(self, node):
+        u"""
+        `.DagNode.instanceIndex` と同等。
+
+        :rtype: `int`
+        """
+        return self.__instNums[self.indexOf(node)]
+
+    def keyForDepthFirst(self, node):
+        u"""
+        `.keyForDepthFirst` と同等のソート用キー関数。
+
+        :rtype: `list`
+        """
+        return self.siblingIndices(node) if node.isDagNode() else []
+
+    def keyForBreadthFirst(self, node):
+        u"""
+        `.keyForBreadthFirst` と同等のソート用キー関数。
+
+        :rtype: (int, `list`)
+        """
+        return self.lengthAndSiblingIndices(node) if node.isDagNode() else (0, [])
+
+    def keyForPathLength(self, node):
+        u"""
+        `.keyForPathLength` と同等のソート用キー関数。
+
+        :rtype: `int`
+        """
+        return self.pathLength(node) if node.isDagNode() else 0
+
+    def __check(self):
+        if self.__stale:
+            raise RuntimeError('DagSnapshot is stale')
+
+    def __node(self, i):
+        return _newNodeObjByMPath(_2_MDagPath(self.__paths[i]))
+
+    def __childIndices(self, i, shapes, intermediates):
+        flags = self.__flags
+        nextSiblings = self.__nextSiblings
+        res = []
+        j = self.__firstChildren[i]
+        while j >= 0:
+            bits = flags[j]
+            if (
+                (shapes or not (bits & _BIT_SHAPE)) and
+                (intermediates or not (bits & _BIT_INTERMEDIATE))
+            ):
+                res.append(j)
+            j = nextSiblings[j]
+        return res
@@ -16,8 +16,6 @@ from ..typeregistry import nodetypes
 from ._api2attrname import (
     hasNodeAttribute as _hasNodeAttribute,
     findSimpleMPlug as _findSimpleMPlug,
-    findComplexMPlug as _findComplexMPlug,
-    argToFindComplexMPlug as _argToFindComplexMPlug,
     _MayaAPI2RuntimeError, _MayaAPI2Errors,
 )
 from .cyobject import (
@@ -26,11 +24,16 @@ from .cyobject import (
     _initAPI1Objects,
     _newNodePlug,
     _node4ArgsByMPlug,
+    _findMPlugByPath,
     _newNodeObjByMPath,
+    _shapeCacheVersion,
+    _getCachedShape,
+    _storeCachedShape,
     BIT_TRANSFORM,
+    BIT_SHAPE,
 )
 from .objectref import _getObjectRef
-from .plug_c import _evalConnList, _apiobject_error
+from .plug_c import _evalConnList, _iterDependencyGraph, _apiobject_error
 from ._api2mplug import (
     toNonNetworkedMPlug,
     getConnWithoutUC,
@@ -41,6 +44,8 @@ import maya.OpenMaya as _api1
 __all__ = ['keyForDepthFirst', 'keyForBreadthFirst', 'keyForPathLength']
 
 _MFn_kJoint = _api2.MFn.kJoint
+_MFn_kShape = _api2.MFn.kShape
+_MFn_kCompoundAttribute = _api2.MFn.kCompoundAttribute
 _2_MDagPath = _api2.MDagPath
 _2_MPlug = _api2.MPlug
 _2_MPlug_connectedTo = _2_MPlug.connectedTo
@@ -163,7 +168,7 @@ class Node_c(CyObject):
 
         :rtype: `bool`
         """
-        return self.isAlive() and self._CyObject__data['mnode'] == other._CyObject__data['mnode']
+        return self.isAlive() and self._CyObject__data.mnode == other._CyObject__data.mnode
 
     def __getattr__(self, name):
         u"""
@@ -227,7 +232,7 @@ class Node_c(CyObject):
 
         :rtype: `type`
         """
-        return self._CyObject__data['plugcls'] or CyObject._CyObject__glbpcls
+        return self._CyObject__data.plugcls or CyObject._CyObject__glbpcls
 
     def thisPlugClass(self):
         u"""
@@ -239,7 +244,7 @@ class Node_c(CyObject):
 
         :rtype: `type` or None
         """
-        return self._CyObject__data['plugcls']
+        return self._CyObject__data.plugcls
 
     def setPlugClass(self, pcls=None):
         u"""
@@ -249,7 +254,7 @@ class Node_c(CyObject):
             `.Plug` 派生クラス。
             None を指定するとクリアする。
         """
-        self._CyObject__data['plugcls'] = pcls
+        self._CyObject__data.plugcls = pcls
 
     @classmethod
     def pluginName_(cls):
@@ -300,7 +305,7 @@ class Node_c(CyObject):
 
         :rtype: `str`
         """
-        return _classification(self._CyObject__data['nodetype'])
+        return _classification(self._CyObject__data.nodetype)
 
     @classmethod
     def type_(cls):
@@ -317,7 +322,7 @@ class Node_c(CyObject):
 
         :rtype: `str`
         """
-        return self._CyObject__data['nodetype']
+        return self._CyObject__data.nodetype
 
     @classmethod
     def isAbstractType(cls):
@@ -346,7 +351,7 @@ class Node_c(CyObject):
         :param `str` typename: ノードタイプ名。
         :rtype: `bool`
         """
-        return _isDerivedNodeType(self._CyObject__data['nodetype'], typename, self._CyObject__data['getname']())
+        return _isDerivedNodeType(self._CyObject__data.nodetype, typename, self._CyObject__data.getname())
 
     def hasFn(self, fn):
         u"""
@@ -363,7 +368,7 @@ class Node_c(CyObject):
 
         :rtype: `bool`
         """
-        return 'mpath' in self._CyObject__data
+        return self._CyObject__data.mpath is not None
 
     def isTransform(self):
         u"""
@@ -371,7 +376,7 @@ class Node_c(CyObject):
 
         :rtype: `bool`
         """
-        return 'shape' in self._CyObject__data
+        return bool(self._CyObject__data.bits & BIT_TRANSFORM)
 
     def isShape(self):
         u"""
@@ -379,7 +384,7 @@ class Node_c(CyObject):
 
         :rtype: `bool`
         """
-        return 'transform' in self._CyObject__data
+        return bool(self._CyObject__data.bits & BIT_SHAPE)
 
     def isJoint(self):
         u"""
@@ -396,7 +401,7 @@ class Node_c(CyObject):
         :rtype: :mayaapi2:`MObject`
         """
         self.checkValid()
-        return self._CyObject__data['mnode']
+        return self._CyObject__data.mnode
 
     def mnode_(self):
         u"""
@@ -404,7 +409,7 @@ class Node_c(CyObject):
 
         :rtype: :mayaapi2:`MObject`
         """
-        return self._CyObject__data['mnode']
+        return self._CyObject__data.mnode
 
     def mnode1(self):
         u"""
@@ -414,7 +419,7 @@ class Node_c(CyObject):
         """
         self.checkValid()
         _initAPI1Objects(self._CyObject__data)
-        return self._CyObject__data['mnode1']
+        return self._CyObject__data.mnode1
 
     def mnode1_(self):
         u"""
@@ -423,7 +428,7 @@ class Node_c(CyObject):
         :rtype: :mayaapi1:`MObject`
         """
         _initAPI1Objects(self._CyObject__data)
-        return self._CyObject__data['mnode1']
+        return self._CyObject__data.mnode1
 
     def mfn(self):
         u"""
@@ -432,7 +437,7 @@ class Node_c(CyObject):
         :rtype: :mayaapi2:`MFnDependencyNode` の派生
         """
         self.checkValid()
-        return self._CyObject__data['mfn']
+        return self._CyObject__data.mfn
 
     def mfn_(self):
         u"""
@@ -440,7 +445,7 @@ class Node_c(CyObject):
 
         :rtype: :mayaapi2:`MFnDependencyNode` の派生
         """
-        return self._CyObject__data['mfn']
+        return self._CyObject__data.mfn
 
     def mfn1(self):
         u"""
@@ -450,7 +455,7 @@ class Node_c(CyObject):
         """
         self.checkValid()
         _initAPI1Objects(self._CyObject__data)
-        return self._CyObject__data['mfn1']
+        return self._CyObject__data.mfn1
 
     def mfn1_(self):
         u"""
@@ -459,7 +464,7 @@ class Node_c(CyObject):
         :rtype: :mayaapi1:`MFnDependencyNode` の派生
         """
         _initAPI1Objects(self._CyObject__data)
-        return self._CyObject__data['mfn1']
+        return self._CyObject__data.mfn1
 
     def mpath(self):
         u"""
@@ -473,9 +478,9 @@ class Node_c(CyObject):
 
         :rtype: :mayaapi2:`MDagPath` or None
         """
-        if 'mpath' in self._CyObject__data:
+        if self._CyObject__data.mpath is not None:
             self.checkValid()
-            return _2_MDagPath(self._CyObject__data['mpath'])
+            return _2_MDagPath(self._CyObject__data.mpath)
 
     def mpath_(self):
         u"""
@@ -483,7 +488,7 @@ class Node_c(CyObject):
 
         :rtype: :mayaapi2:`MDagPath`
         """
-        return _2_MDagPath(self._CyObject__data['mpath'])
+        return _2_MDagPath(self._CyObject__data.mpath)
 
     def _mpath(self):
         u"""
@@ -496,7 +501,7 @@ class Node_c(CyObject):
             得た後の取り扱いには注意が必要。
         """
         self.checkValid()
-        return self._CyObject__data['mpath']
+        return self._CyObject__data.mpath
 
     def _mpath_(self):
         u"""
@@ -508,7 +513,7 @@ class Node_c(CyObject):
             内部で保持している :mayaapi2:`MDagPath` がそのまま返されるので、
             得た後の取り扱いには注意が必要。
         """
-        return self._CyObject__data['mpath']
+        return self._CyObject__data.mpath
 
     def mpath1(self):
         u"""
@@ -524,8 +529,8 @@ class Node_c(CyObject):
         """
         self.checkValid()
         _initAPI1Objects(self._CyObject__data)
-        if 'mpath1' in self._CyObject__data:
-            return _1_MDagPath(self._CyObject__data['mpath1'])
+        if self._CyObject__data.mpath is not None:
+            return _1_MDagPath(self._CyObject__data.mpath1)
 
     def mpath1_(self):
         u"""
@@ -534,7 +539,7 @@ class Node_c(CyObject):
         :rtype: :mayaapi1:`MDagPath`
         """
         _initAPI1Objects(self._CyObject__data)
-        return _1_MDagPath(self._CyObject__data['mpath1'])
+        return _1_MDagPath(self._CyObject__data.mpath1)
 
     def _mpath1(self):
         u"""
@@ -548,7 +553,7 @@ class Node_c(CyObject):
         """
         self.checkValid()
         _initAPI1Objects(self._CyObject__data)
-        return self._CyObject__data['mpath1']
+        return self._CyObject__data.mpath1
 
     def _mpath1_(self):
         u"""
@@ -561,7 +566,7 @@ class Node_c(CyObject):
             得た後の取り扱いには注意が必要。
         """
         _initAPI1Objects(self._CyObject__data)
-        return self._CyObject__data['mpath1']
+        return self._CyObject__data.mpath1
 
     def hasUniqueName(self):
         u"""
@@ -728,15 +733,16 @@ class Node_c(CyObject):
             先頭ドットが指定されてもトップレベル以外のユニーク名のアトリビュートなら許容される。
         :rtype: `.Plug`
         """
-        argToFind = _argToFindComplexMPlug(name.split('.'))
+        data = self._CyObject__data
         try:
-            mplug = _findComplexMPlug(self._CyObject__data['mfn'], argToFind, False, strict)
+            mplug = _findMPlugByPath(data.mfn, data.nodetype, name, strict)
         except _MayaAPI2Errors:
             if self.isTransform():
                 shape = self._shape()
                 if shape:
+                    data = shape._CyObject__data
                     try:
-                        mplug = _findComplexMPlug(shape._CyObject__data['mfn'], argToFind, False, strict)
+                        mplug = _findMPlugByPath(data.mfn, data.nodetype, name, strict)
                     except _MayaAPI2Errors:
                         pass
                     else:
@@ -745,6 +751,53 @@ class Node_c(CyObject):
         else:
             return _newNodePlug(pcls or self.plugClass(), self, mplug)
 
+    def getAttrs(self, names, unit=False, asDict=False):
+        u"""
+        ノードの複数のアトリビュートの値をまとめて得る。
+
+        ノードの有効性チェックは1回だけ行われ、
+        値は `.Plug.getMany` によってまとめて得られる。
+
+        :param `iterable` names: `plug` で指定可能なアトリビュート名のリスト。
+        :param `bool` unit: 内部単位ではなくUI設定単位で得る。
+        :param `bool` asDict: アトリビュート名をキーとした辞書で得る。
+        :rtype: `list` or `dict`
+        """
+        self.checkValid()
+        names = list(names)
+        plug_ = self.plug_
+        plugs = [plug_(x) for x in names]
+        if not plugs:
+            return {} if asDict else []
+        vals = type(plugs[0]).getMany(plugs, unit)
+        if asDict:
+            return dict(zip(names, vals))
+        return vals
+
+    def sampleAttrs(self, names, times, unit=False):
+        u"""
+        ノードの複数のアトリビュートの複数の時間における値をまとめて得る。
+
+        値は `.Plug.sampleMany` によって
+        カレントタイムを変更せずに評価される。
+
+        NumPy がインストールされていない場合は ImportError となる。
+
+        :param `iterable` names: `plug` で指定可能なアトリビュート名のリスト。
+        :param `iterable` times: UI設定単位の時間のリスト。
+        :param `bool` unit: 内部単位ではなくUI設定単位で得る。
+        :returns:
+            (時間数, アトリビュート数) か、
+            要素を持つ型の場合は (時間数, アトリビュート数, 要素数) の形状の配列。
+        :rtype: numpy.ndarray
+        """
+        self.checkValid()
+        plug_ = self.plug_
+        plugs = [plug_(x) for x in names]
+        if not plugs:
+            raise ValueError('no attribute names are specified')
+        return type(plugs[0]).sampleMany(plugs, times, unit)
+
     def connections(
         self,
         s=True, d=True, c=False, t=None, et=False, scn=False,
@@ -811,7 +864,7 @@ class Node_c(CyObject):
 
         # コネクションを収集。
         results = []
-        for mplug in self._CyObject__data['mfn'].getConnections():
+        for mplug in self._CyObject__data.mfn.getConnections():
             marr = getConn(mplug, source, destination)
             if marr:
                 addMPlugs(marr, mplug)
@@ -868,6 +921,72 @@ class Node_c(CyObject):
 
     destinationsWithConversions = outputs  #: `outputs` の別名（unitConversionノードをスキップせずに、出力先のプラグかノードのリストを得る）。
 
+    def iterUpstream(
+        self, depth=None, type=None, exactType=False,
+        plugLevel=False, skipConversionNodes=True, breadthFirst=False,
+        prune=None, pcls=None,
+    ):
+        u"""
+        上流のノードかプラグを辿って得るジェネレータ。
+
+        :mayaapi2:`MItDependencyGraph` によって辿られ、
+        同じノード（プラグレベルの場合は同じプラグ）は1度しか得られない。
+        ラッパーオブジェクトは得られるものだけが生成される。
+
+        イテレーション中にグラフを変更してはならない。
+
+        :param `int` depth:
+            辿る深さの上限。1 だと直接の入力のみとなる。
+            省略時は制限されない。
+            深さは最短経路で判定されるため、
+            指定した場合は常に幅優先で辿られる。
+        :param `str` type:
+            得るノードタイプを限定する。
+            限定されても、その先は辿られる。
+        :param `bool` exactType:
+            type指定の場合に、派生タイプを許容せずに
+            指定タイプとの厳密な一致のみとするかどうか。
+        :param `bool` plugLevel:
+            ノードレベルではなくプラグレベルで辿り、
+            ノードではなく経由したプラグを得る。
+        :param `bool` skipConversionNodes:
+            unitConversion系ノードを結果に含めず、
+            深さにも数えない（その先は辿られる）。
+        :param `bool` breadthFirst:
+            深さ優先ではなく幅優先で辿る。
+        :param `callable` prune:
+            訪問したノードかプラグを受け取り、
+            True を返すとその先を辿らないようにする関数。
+            それ自体は結果に含まれる。
+            指定した場合は、訪問した全てのラッパーオブジェクトが生成される。
+        :param pcls:
+            plugLevel=True の場合に、得たいプラグオブジェクトのクラス。
+            省略時は `plugClass` で得られる
+            現在のデフォルトプラグクラスが使用される。
+        :rtype: generator
+        """
+        self.checkValid()
+        return _iterDependencyGraph(
+            self._CyObject__data.mnode, False, depth, type, exactType,
+            plugLevel, skipConversionNodes, breadthFirst, prune, pcls or self.plugClass())
+
+    def iterDownstream(
+        self, depth=None, type=None, exactType=False,
+        plugLevel=False, skipConversionNodes=True, breadthFirst=False,
+        prune=None, pcls=None,
+    ):
+        u"""
+        下流のノードかプラグを辿って得るジェネレータ。
+
+        オプションは `iterUpstream` と同じである。
+
+        :rtype: generator
+        """
+        self.checkValid()
+        return _iterDependencyGraph(
+            self._CyObject__data.mnode, True, depth, type, exactType,
+            plugLevel, skipConversionNodes, breadthFirst, prune, pcls or self.plugClass())
+
     def worldSpacePlugs(self, pcls=None):
         u"""
         ワールド空間出力プラグのリストを得る。
@@ -878,7 +997,7 @@ class Node_c(CyObject):
             現在のデフォルトプラグクラスが使用される。
         :rtype: `list`
         """
-        if 'mpath' in self._CyObject__data:
+        if self._CyObject__data.mpath is not None:
             mfnnode = self.mfn()
             mfn_attr = mfnnode.attribute
             mattrs = [mfn_attr(i) for i in range(mfnnode.attributeCount())]
@@ -900,7 +1019,7 @@ class Node_c(CyObject):
             現在のデフォルトプラグクラスが使用される。
         :rtype: `list`
         """
-        if 'mpath' in self._CyObject__data:
+        if self._CyObject__data.mpath is not None:
             mfnnode = self.mfn()
             mfn_attr = mfnnode.attribute
             mattrs = [mfn_attr(i) for i in range(mfnnode.attributeCount())]
@@ -912,6 +1031,74 @@ class Node_c(CyObject):
         else:
             return []
 
+    def iterPlugs(
+        self,
+        keyable=None, channelBox=None, userDefined=None, multi=None,
+        readable=None, writable=None, storable=None, hidden=None, connectable=None,
+        leaf=None, topLevel=None, pcls=None,
+    ):
+        u"""
+        条件にマッチするプラグを得るジェネレーター。
+
+        `.Node.plugs` と異なり :mayacmd:`listAttr` を使わず、
+        :mayaapi2:`MFnDependencyNode` のアトリビュートを列挙し、
+        :mayaapi2:`MFnAttribute` のフラグで判定して
+        :mayaapi2:`MPlug` から直接プラグを生成するため、
+        名前の解決を伴わず高速である。
+
+        各条件は None なら判定されず、
+        True か False ならそれにマッチするものに限定される。
+        マルチ要素は得られない。
+
+        :param `bool` keyable: キー設定可能かどうか。
+        :param `bool` channelBox: キー設定不可でチャンネルボックスに表示されるかどうか。
+        :param `bool` userDefined: ダイナミックアトリビュートかどうか。
+        :param `bool` multi: マルチアトリビュートかどうか。
+        :param `bool` readable: 読み込み可能かどうか。
+        :param `bool` writable: 書き込み可能かどうか。
+        :param `bool` storable: シーンに保存されるかどうか。
+        :param `bool` hidden: 隠しアトリビュートかどうか。
+        :param `bool` connectable: 接続可能かどうか。
+        :param `bool` leaf: コンパウンドでないかどうか。
+        :param `bool` topLevel: 親を持たないかどうか。
+        :param `type` pcls:
+            得たいプラグオブジェクトのクラス。
+            省略時は `plugClass` で得られる
+            現在のデフォルトプラグクラスが使用される。
+        :rtype: generator
+        """
+        conds = [(k, v) for k, v in (
+            ('keyable', keyable),
+            ('channelBox', channelBox),
+            ('dynamic', userDefined),
+            ('array', multi),
+            ('readable', readable),
+            ('writable', writable),
+            ('storable', storable),
+            ('hidden', hidden),
+            ('connectable', connectable),
+        ) if v is not None]
+
+        mfnnode = self.mfn()
+        mfn_attr = mfnnode.attribute
+        findPlug = mfnnode.findPlug
+        pcls = pcls or self.plugClass()
+        for i in range(mfnnode.attributeCount()):
+            mattr = mfn_attr(i)
+            if leaf is not None and leaf == mattr.hasFn(_MFn_kCompoundAttribute):
+                continue
+            if conds or topLevel is not None:
+                mfn = _2_MFnAttribute(mattr)
+                if topLevel is not None and topLevel != mfn.parent.isNull():
+                    continue
+                for k, v in conds:
+                    if getattr(mfn, k) != v:
+                        break
+                else:
+                    yield _newNodePlug(pcls, self, findPlug(mattr, False))
+            else:
+                yield _newNodePlug(pcls, self, findPlug(mattr, False))
+
     # どのクラスでも transform から shape のプラグを得られるようにするために Node クラスで実装が必要。
     def _shape(self, idx=0, intermediates=False):
         u"""
@@ -929,7 +1116,21 @@ class Node_c(CyObject):
             インターミディエイトオブジェクトも含めるかどうか。
         :rtype: `.Shape` or None
         """
-        orig = self._CyObject__data['mpath']
+        # 検証済みのキャッシュが在れば、それを返す。
+        data = self._CyObject__data
+        ver = _shapeCacheVersion(data.hash)
+        key = (idx, intermediates)
+        shape = _getCachedShape(data, ver, key)
+        if shape is None:
+            shape = self.__findShape(idx, intermediates)
+            _storeCachedShape(data, ver, key, shape)
+        return shape
+
+    def __findShape(self, idx, intermediates):
+        u"""
+        `_shape` のキャッシュが無効な場合の処理。
+        """
+        orig = self._CyObject__data.mpath
 
         # intermediate を含めるなら子ノードを数えてインデックスにマッチング。
         # この過程で cache0 と cache1 の両方のインデックスが確定する。
@@ -983,12 +1184,12 @@ class Node_c(CyObject):
         :param mpath: シェイプの :mayaapi2:`MDagPath` 。
         :rtype: `.Shape`
         """
-        cache0, cache1 = self._CyObject__data['shape']
+        cache0, cache1 = self._CyObject__data.shape[:2]
 
         # not intermediate (0) に有効なキャッシュが在れば再利用、無ければエントリを削除する。
         shape = cache0.get(k0)
         if shape:
-            if shape.isValid() and shape._CyObject__data['mnode'] == mnode:
+            if shape.isValid() and shape._CyObject__data.mnode == mnode:
                 if k1 is not None:
                     cache1[k1] = shape
                 return shape
@@ -997,7 +1198,7 @@ class Node_c(CyObject):
         # all (1) に有効なキャッシュが在れば再利用、無ければエントリを削除する。
         shape = cache1.get(k1)
         if shape:
-            if shape.isValid() and shape._CyObject__data['mnode'] == mnode:
+            if shape.isValid() and shape._CyObject__data.mnode == mnode:
                 if k0 is not None:
                     cache0[k0] = shape
                 return shape
@@ -1023,7 +1224,7 @@ class Node_c(CyObject):
             cache1[k1] = shape
         if self.TYPE_BITS & BIT_TRANSFORM:
             # shape の transform キャッシュは Transform 派生クラスに限るものとする。
-            shape._CyObject__data['transform'] = _getObjectRef(self).weakref()
+            shape._CyObject__data.transform = _getObjectRef(self).weakref()
         return shape
 
     if MAYA_VERSION >= (2019,):
@@ -1053,7 +1254,7 @@ def _searchShapeCache(cache, key, mnode):
         if not shape.isValid():
             # 無効だったら削除。
             del cache[k]
-        elif shape._CyObject__data['mnode'] == mnode:
+        elif shape._CyObject__data.mnode == mnode:
             # 目的のものなら、キャッシュを作り直し。
             del cache[k]
             cache[key] = shape
@@ -7,7 +7,7 @@ from __future__ import division
 from __future__ import print_function
 
 from ...common import *
-from .cyobject import CyObject, CY_OBJREF, _decideNodeClsFromData
+from .cyobject import CyObject, CY_OBJREF, _decideNodeClsFromData, _NodeData, _PlugData
 from weakref import ref as _wref
 
 __all__ = ['ObjectRef']
@@ -26,7 +26,7 @@ class ObjectRef(CyObject):
     CLASS_TYPE = CY_OBJREF  #: ラッパークラスの種類が `ObjectRef` であることを表す。
 
     def __call__(self):
-        return self.__data['wref']() or self._newobject()
+        return self.__data.wref() or self._newobject()
 
     @classmethod
     def newObject(cls, data):
@@ -45,11 +45,11 @@ class ObjectRef(CyObject):
         :param data: インスタンスにセットする内部データ。
         :rtype: 指定クラス
         """
-        core = data.get('DATA')
-        dt = core.get('DATA')
-        while dt:
+        core = _innerData(data)
+        dt = _innerData(core)
+        while dt is not None:
             core = dt
-            dt = core.get('DATA')
+            dt = _innerData(core)
         obj = super(ObjectRef, cls).newObject(core)
         obj.__data = data
         return obj
@@ -71,15 +71,15 @@ class ObjectRef(CyObject):
         u"""
         ラップしているオブジェクトの内部データを得る。
         """
-        return self.__data['DATA']
+        return self.__data.DATA
 
     def refclass(self):
         u"""
         ラップしているオブジェクトのクラスを得る。
         """
-        if not self.__data['cls']:
-            self.__data['cls'] = _decideNodeClsFromData(self.__data['DATA'])
-        return self.__data['cls']
+        if not self.__data.cls:
+            self.__data.cls = _decideNodeClsFromData(self.__data.DATA)
+        return self.__data.cls
 
     def object(self):
         u"""
@@ -87,7 +87,7 @@ class ObjectRef(CyObject):
 
         :rtype: `.CyObject`
         """
-        return self.__data['wref']()
+        return self.__data.wref()
 
     def weakref(self):
         u"""
@@ -95,7 +95,7 @@ class ObjectRef(CyObject):
 
         :rtype: `weakref.ref`
         """
-        return self.__data['wref']
+        return self.__data.wref
 
     def _newobject(self):
         u"""
@@ -110,9 +110,9 @@ class ObjectRef(CyObject):
 
         :rtype: `.CyObject`
         """
-        obj = self.refclass().newObject(self.__data['DATA'])
+        obj = self.refclass().newObject(self.__data.DATA)
         obj._CyObject__ref = self
-        self.__data['wref'] = _wref(obj)
+        self.__data.wref = _wref(obj)
         #obj.__init__()  # NOTE: Plug.node() や Plug.connections() などでも __init__() をサポートするなら必要。
         return obj
 
@@ -122,17 +122,40 @@ class ObjectRef(CyObject):
 
         :rtype: `.Node` 派生クラス
         """
-        noderef = self._CyObject__data.get('noderef')
-        if noderef:
-            return noderef()
+        data = self._CyObject__data
+        if type(data) is _PlugData:
+            return data.noderef()
 
-        if 'mnode' in self._CyObject__data:
+        if type(data) is _NodeData:
             obj = self()
             while obj.CLASS_TYPE is CY_OBJREF:
                 obj = obj()
             return obj
 
 
+def _innerData(data):
+    u"""
+    内部データが内包する基底のデータを得る。無ければ None 。
+
+    `_RefData` の他、派生クラスで拡張された辞書の 'DATA' キーにも対応する。
+    """
+    if isinstance(data, dict):
+        return data.get('DATA')
+    return getattr(data, 'DATA', None)
+
+
+class _RefData(object):
+    u"""
+    `ObjectRef` の内部データ。
+    """
+    __slots__ = ('DATA', 'wref', 'cls',)
+
+    def __init__(self, data, wref, cls):
+        self.DATA = data
+        self.wref = wref
+        self.cls = cls
+
+
 #------------------------------------------------------------------------------
 def _getObjectRef(src, cls=ObjectRef):
     u"""
@@ -140,11 +163,7 @@ def _getObjectRef(src, cls=ObjectRef):
     """
     ref = src._CyObject__ref
     if ref is None or type(ref) is not cls:
-        ref = cls.newObject({
-            'DATA': src.internalData(),
-            'wref': _wref(src),
-            'cls': type(src),
-        })
+        ref = cls.newObject(_RefData(src.internalData(), _wref(src), type(src)))
         src._CyObject__ref = ref
     return ref
 
@@ -153,20 +172,12 @@ def _newNodeRefFromData(data, cls=ObjectRef):
     u"""
     `.Node` 内部データから `ObjectRef` を生成する。
     """
-    return cls.newObject({
-        'DATA': data,
-        'wref': donothing,
-        'cls': None,
-    })
+    return cls.newObject(_RefData(data, donothing, None))
 
 
 def _newPlugRefFromData(data, cls=ObjectRef):
     u"""
     `.Plug` 内部データから `ObjectRef` を生成する。
     """
-    return cls.newObject({
-        'DATA': data,
-        'wref': donothing,
-        'cls': data['noderef']._CyObject__data['plugcls'] or CyObject._CyObject__glbpcls,
-    })
+    return cls.newObject(_RefData(data, donothing, data.nodedata.plugcls or CyObject._CyObject__glbpcls))
 
@@ -24,8 +24,11 @@ from .cyobject import (
     _node4ArgsByMPlug,
     _newNodeObjByArgs,
     _newNodeRefByArgs,
+    _nodeClsObjByMObj,
+    _getPlugTypeInfo,
 )
 from .objectref import _getObjectRef
+from ._mplugarray import mplugGetArray, _requireNumpy
 from ._api2mplug import (
     nonNetworkedElemMPlug,
     toNonNetworkedElemMPlug,
@@ -37,11 +40,17 @@ from ._api2mplug import (
     attrToUnitValue, unitAttrToUnitValue,
     attrFromRawValue, attrFromUnitValue,
     mplugGetRawValue, mplugGetUnitValue,
+    mplugRawValueGetter, mplugUnitValueGetter,
     mplugCurrentValueSetter, mplugApiValueSetter,
     mplug_get_matrix,
     _RE_NUMERIC_COMPOUND_match,
+    _UnitConvTypes,
 )
 import maya.api.OpenMaya as _api2
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
 
 __all__ = []
 
@@ -52,6 +61,15 @@ _2_MFnCompoundAttribute = _api2.MFnCompoundAttribute
 _2_MFnMatrixData = _api2.MFnMatrixData
 _2_MFnUnitAttribute = _api2.MFnUnitAttribute
 _2_MFnNumericAttribute = _api2.MFnNumericAttribute
+_2_MFnDependencyNode = _api2.MFnDependencyNode
+_2_MObjectHandle = _api2.MObjectHandle
+_2_MItDependencyGraph = _api2.MItDependencyGraph
+_2_MDGContext = _api2.MDGContext
+_2_MDGContextGuard = getattr(_api2, 'MDGContextGuard', None)  # 2018 以降。
+_2_MTime = _api2.MTime
+_2_MTime_uiUnit = _2_MTime.uiUnit
+
+_currentTime = cmds.currentTime
 
 _2_MPlug_logicalIndex = _2_MPlug.logicalIndex
 _2_MPlug_connectedTo = _2_MPlug.connectedTo
@@ -125,20 +143,20 @@ class Plug_c(CyObject):
             return self
 
         self.checkValid()
-        mplug = self._CyObject__data['mplug']
+        mplug = self._CyObject__data.mplug
         if not mplug.isArray:
             raise TypeError('plug is not an array: ' + self.name_())
 
         # スライスはサポートしない。
         #if isinstance(idx, slice):
         #    cls = _type(self)
-        #    noderef = self._CyObject__data['noderef']
-        #    info = self._CyObject__data['typeinfo']
+        #    noderef = self._CyObject__data.noderef
+        #    info = self._CyObject__data.typeinfo
         #    num = mplug.elementByPhysicalIndex(mplug.numElements() - 1).logicalIndex() + 1
         #    return [_newNodeRefPlug(cls, noderef, _2_MPlug(mplug).selectAncestorLogicalIndex(i), info) for i in range(*idx.indices(num))]
 
         # マルチアトリビュートの要素には、同じ typeinfo を渡せる（同じタイプ名、同じMObject）。
-        return _newNodeRefPlug(_type(self), self._CyObject__data['noderef'], _2_MPlug(mplug).selectAncestorLogicalIndex(idx), self._CyObject__data['typeinfo'])
+        return _newNodeRefPlug(_type(self), self._CyObject__data.noderef, _2_MPlug(mplug).selectAncestorLogicalIndex(idx), self._CyObject__data.typeinfo)
 
     def __getattr__(self, name):
         u"""
@@ -155,9 +173,9 @@ class Plug_c(CyObject):
 
         :rtype: `.Node` 派生クラス
         """
-        node = self._CyObject__data['noderef'].object()
+        node = self._CyObject__data.noderef.object()
         if not node:
-            node = self._CyObject__data['noderef']._newobject()
+            node = self._CyObject__data.noderef._newobject()
             _setPlugCache(node, self)
         return node
 
@@ -167,7 +185,7 @@ class Plug_c(CyObject):
 
         :rtype: `.ObjectRef`
         """
-        return self._CyObject__data['noderef']
+        return self._CyObject__data.noderef
 
     def nodeName(self):
         u"""
@@ -176,7 +194,7 @@ class Plug_c(CyObject):
         :rtype: `str`
         """
         self.checkValid()
-        return self._CyObject__data['noderef']._CyObject__data['getname']()
+        return self._CyObject__data.noderef._CyObject__data.getname()
 
     def nodeType(self):
         u"""
@@ -184,7 +202,7 @@ class Plug_c(CyObject):
 
         :rtype: `str`
         """
-        return self._CyObject__data['noderef']._CyObject__data['nodetype']
+        return self._CyObject__data.noderef._CyObject__data.nodetype
 
     def isNodeType(self, typename):
         u"""
@@ -193,8 +211,8 @@ class Plug_c(CyObject):
         :param `str` typename: ノードタイプ名。
         :rtype: `bool`
         """
-        dt = self._CyObject__data['noderef']._CyObject__data
-        return _isDerivedNodeType(dt['nodetype'], typename, dt['getname']())
+        dt = self._CyObject__data.noderef._CyObject__data
+        return _isDerivedNodeType(dt.nodetype, typename, dt.getname())
 
     def hasNodeFn(self, fn):
         u"""
@@ -203,9 +221,9 @@ class Plug_c(CyObject):
         :param `int` fn: :mayaapi2:`MFn` タイプ。
         :rtype: `bool`
         """
-        dt = self._CyObject__data['noderef']._CyObject__data
-        dt['isValid']()
-        return dt['mnode'].hasFn(fn)
+        dt = self._CyObject__data.noderef._CyObject__data
+        dt.isValid()
+        return dt.mnode.hasFn(fn)
 
     def mplug(self):
         u"""
@@ -214,7 +232,7 @@ class Plug_c(CyObject):
         :rtype: :mayaapi2:`MPlug`
         """
         self.checkValid()
-        return self._CyObject__data['mplug']
+        return self._CyObject__data.mplug
 
     def mplug_(self):
         u"""
@@ -222,7 +240,7 @@ class Plug_c(CyObject):
 
         :rtype: :mayaapi2:`MPlug`
         """
-        return self._CyObject__data['mplug']
+        return self._CyObject__data.mplug
 
     def mplug1(self):
         u"""
@@ -232,7 +250,7 @@ class Plug_c(CyObject):
         """
         self.checkValid()
         _initAPI1Objects(self._CyObject__data)
-        return self._CyObject__data['mplug1']
+        return self._CyObject__data.mplug1
 
     def mplug1_(self):
         u"""
@@ -241,7 +259,7 @@ class Plug_c(CyObject):
         :rtype: :mayaapi1:`MPlug`
         """
         _initAPI1Objects(self._CyObject__data)
-        return self._CyObject__data['mplug1']
+        return self._CyObject__data.mplug1
 
     def mfn(self):
         u"""
@@ -250,7 +268,7 @@ class Plug_c(CyObject):
         :rtype: :mayaapi2:`MFnAttribute` の派生
         """
         self.checkValid()
-        return self._CyObject__data['typeinfo']['mfn']
+        return self._CyObject__data.typeinfo['mfn']
 
     def mfn_(self):
         u"""
@@ -259,7 +277,7 @@ class Plug_c(CyObject):
         :rtype: :mayaapi2:`MFnAttribute` の派生
         """
         _initAPI1Objects(self._CyObject__data)
-        return self._CyObject__data['typeinfo']['mfn']
+        return self._CyObject__data.typeinfo['mfn']
 
     def mfn1(self):
         u"""
@@ -269,7 +287,7 @@ class Plug_c(CyObject):
         """
         self.checkValid()
         _initAPI1Objects(self._CyObject__data)
-        return self._CyObject__data['mfn1']
+        return self._CyObject__data.mfn1
 
     def mfn1_(self):
         u"""
@@ -277,7 +295,7 @@ class Plug_c(CyObject):
 
         :rtype: :mayaapi1:`MFnAttribute` の派生
         """
-        return self._CyObject__data['mfn1']
+        return self._CyObject__data.mfn1
 
     def type(self):
         u"""
@@ -285,7 +303,7 @@ class Plug_c(CyObject):
 
         :rtype: `str`
         """
-        return self._CyObject__data['typeinfo']['typename']
+        return self._CyObject__data.typeinfo['typename']
 
     def subType(self):
         u"""
@@ -297,8 +315,8 @@ class Plug_c(CyObject):
         :rtype: `str` or `None`
         """
         self.checkValid()
-        fixUnitTypeInfo(self._CyObject__data['typeinfo'])
-        return self._CyObject__data['typeinfo'].get('subtype')
+        fixUnitTypeInfo(self._CyObject__data.typeinfo)
+        return self._CyObject__data.typeinfo.get('subtype')
 
     def _unittype(self):
         u"""
@@ -313,8 +331,8 @@ class Plug_c(CyObject):
         :rtype: `str`
         """
         self.checkValid()
-        fixUnitTypeInfo(self._CyObject__data['typeinfo'])
-        return self._CyObject__data['typeinfo'].get('unittype')
+        fixUnitTypeInfo(self._CyObject__data.typeinfo)
+        return self._CyObject__data.typeinfo.get('unittype')
 
     if IS_SUPPORTING_NON_UNIQUE_ATTR_NAMES:
         def isEnforcingUniqueName(self):
@@ -380,7 +398,7 @@ class Plug_c(CyObject):
             """
             return '.'.join([
                 x.split('[')[0]
-                for x in self._CyObject__data['mplug'].partialName(useFullAttributePath=not useCompression, useLongNames=useLongName).split('.')
+                for x in self._CyObject__data.mplug.partialName(useFullAttributePath=not useCompression, useLongNames=useLongName).split('.')
             ])
 
     def isAffectsAppearance(self):
@@ -634,8 +652,8 @@ class Plug_c(CyObject):
         :rtype: `bool`
         """
         self.checkValid()
-        return self._CyObject__data['noderef']._CyObject__data['mfn'].isNewAttribute(
-            self._CyObject__data['mplug'].attribute())
+        return self._CyObject__data.noderef._CyObject__data.mfn.isNewAttribute(
+            self._CyObject__data.mplug.attribute())
 
     isNewAttr = isNewAttribute  #: `isNewAttribute` の別名。
 
@@ -649,7 +667,7 @@ class Plug_c(CyObject):
         """
         return (
             self.mfn().writable and
-            not self._CyObject__data['mplug'].isFreeToChange(
+            not self._CyObject__data.mplug.isFreeToChange(
                 checkAncestors=ancestors, checkChildren=children)
         )
 
@@ -689,7 +707,7 @@ class Plug_c(CyObject):
         :rtype: `bool`
         """
         self.checkValid()
-        return self._CyObject__data['noderef']._CyObject__data['mfn'].isFromReferencedFile
+        return self._CyObject__data.noderef._CyObject__data.mfn.isFromReferencedFile
 
     def isAttrFromReferencedFile(self):
         u"""
@@ -704,8 +722,8 @@ class Plug_c(CyObject):
         """
         self.checkValid()
         # isNodeFromReferencedFile をチェックする必要はない。
-        return not self._CyObject__data['noderef']._CyObject__data['mfn'].isNewAttribute(
-            self._CyObject__data['mplug'].attribute())
+        return not self._CyObject__data.noderef._CyObject__data.mfn.isNewAttribute(
+            self._CyObject__data.mplug.attribute())
 
     def isFromReferencedFile(self, ancestors=False, children=False):
         u"""
@@ -802,7 +820,7 @@ class Plug_c(CyObject):
 
         :rtype: `str`
         """
-        return self._CyObject__data['typeinfo']['shortname']
+        return self._CyObject__data.typeinfo['shortname']
 
     def longName(self):
         u"""
@@ -824,7 +842,7 @@ class Plug_c(CyObject):
 
         :rtype: `str`
         """
-        return self._CyObject__data['attrname']
+        return self._CyObject__data.attrname
 
     def plugName(self, short=False, fullAttrPath=False):
         u"""
@@ -836,7 +854,7 @@ class Plug_c(CyObject):
             コンパウンドアトリビュート階層をフルパスで得るかどうか。
         :rtype: `str`
         """
-        return self._CyObject__data['noderef'].name() + '.' + self._CyObject__data['mplug'].partialName(
+        return self._CyObject__data.noderef.name() + '.' + self._CyObject__data.mplug.partialName(
             includeNonMandatoryIndices=True,  # isIndexMatters=False の場合にもインデックスを含ませる。
             includeInstancedIndices=True,  # worldSpace=True の場合にもインデックスを含ませる。
             useFullAttributePath=fullAttrPath, useLongNames=not short)
@@ -848,8 +866,8 @@ class Plug_c(CyObject):
         :rtype: `str`
         """
         if self.mplug().isArray:
-            return _attributeName(self._CyObject__data['getname'](), n=True).split('[')[0]
-        return _attributeName(self._CyObject__data['getname'](), n=True)
+            return _attributeName(self._CyObject__data.getname(), n=True).split('[')[0]
+        return _attributeName(self._CyObject__data.getname(), n=True)
 
     def alias(self):
         u"""
@@ -858,7 +876,7 @@ class Plug_c(CyObject):
         :rtype: `str`
         """
         self.checkValid()
-        return self._CyObject__data['noderef']._CyObject__data['mfn'].plugsAlias(self._CyObject__data['mplug'])
+        return self._CyObject__data.noderef._CyObject__data.mfn.plugsAlias(self._CyObject__data.mplug)
 
     def plug(self, name):
         u"""
@@ -889,12 +907,12 @@ class Plug_c(CyObject):
         u"""
         下位のプラグを得る共通ルーチン。
         """
-        thisMPlug = self._CyObject__data['mplug']
+        thisMPlug = self._CyObject__data.mplug
         if not thisMPlug.isCompound:
             raise TypeError('plug is not a compound: ' + self.name_())
 
-        noderef = self._CyObject__data['noderef']
-        mfnnode = noderef._CyObject__data['mfn']
+        noderef = self._CyObject__data.noderef
+        mfnnode = noderef._CyObject__data.mfn
         mattr = _findMAttrToGetInferiorPlug(mfnnode, name, self)  # Maya2025以降でないと下位とは限らない。
         if mattr.isNull():
             raise AttributeError('no inferior attribute exists: %s.%s' % (self.name_(), name))
@@ -909,7 +927,7 @@ class Plug_c(CyObject):
             else:
                 # 子が得られない場合、エラーではなく同じ MPlug になるようだ。
                 if mplug != thisMPlug:
-                    return _newNodeRefPlug(_type(self), noderef, mplug, typename=self._CyObject__data['typeinfo'].get('subtype'))
+                    return _newNodeRefPlug(_type(self), noderef, mplug, typename=self._CyObject__data.typeinfo.get('subtype'))
 
         # ノードから得る。
         mplug = mfnnode.findPlug(mattr, False)
@@ -935,9 +953,9 @@ class Plug_c(CyObject):
 
         :rtype: `list`
         """
-        info = self._CyObject__data['elemIdxAttrs']
+        info = self._CyObject__data.elemIdxAttrs
         if info is None:
-            mplug = self._CyObject__data['mplug']
+            mplug = self._CyObject__data.mplug
             if mplug.isElement:
                 info = [(mplug.logicalIndex(), mplug.attribute())]
                 mplug = mplug.array()
@@ -948,7 +966,7 @@ class Plug_c(CyObject):
                 if mplug.isElement:
                     info.append((mplug.logicalIndex(), mplug.attribute()))
                     mplug = mplug.array()
-            self._CyObject__data['elemIdxAttrs'] = info
+            self._CyObject__data.elemIdxAttrs = info
         return info
 
     def root(self, completely=False):
@@ -974,7 +992,7 @@ class Plug_c(CyObject):
                 return self
 
             if mp == mplug:
-                typeinfo = self._CyObject__data['typeinfo']
+                typeinfo = self._CyObject__data.typeinfo
 
         else:
             c = mp.array() if mp.isElement else mp
@@ -984,7 +1002,7 @@ class Plug_c(CyObject):
             if mp is mplug:
                 return self
 
-        return _newNodeRefPlug(_type(self), self._CyObject__data['noderef'], mp, typeinfo)
+        return _newNodeRefPlug(_type(self), self._CyObject__data.noderef, mp, typeinfo)
 
     def parent(self):
         u"""
@@ -994,7 +1012,7 @@ class Plug_c(CyObject):
         """
         self.checkValid()
         try:
-            return _newNodeRefPlug(_type(self), self._CyObject__data['noderef'], self._CyObject__data['mplug'].parent())
+            return _newNodeRefPlug(_type(self), self._CyObject__data.noderef, self._CyObject__data.mplug.parent())
         except:
             raise TypeError('plug is not a child: ' + self.name_())
 
@@ -1006,7 +1024,7 @@ class Plug_c(CyObject):
         """
         self.checkValid()
         try:
-            return self._CyObject__data['mplug'].numChildren()
+            return self._CyObject__data.mplug.numChildren()
         except:
             raise TypeError('plug is not a compound: ' + self.name_())
 
@@ -1019,7 +1037,7 @@ class Plug_c(CyObject):
         """
         # コンパウンドでなければエラー。
         self.checkValid()
-        mplug = self._CyObject__data['mplug']
+        mplug = self._CyObject__data.mplug
         if not mplug.isCompound:
             raise TypeError('plug is not a compound: ' + self.name_())
 
@@ -1027,21 +1045,21 @@ class Plug_c(CyObject):
         if idx < 0 or mplug.numChildren() <= idx:
             raise IndexError('no child attribute exists: %s (%d)' % (self.name_(), idx))
 
-        noderef = self._CyObject__data['noderef']
+        noderef = self._CyObject__data.noderef
+        mattr, typeinfo = _getChildAttrInfos(self._CyObject__data, mplug.numChildren())[idx]
 
         # マルチアトリビュートのインデックスが未解決な場合は、そのまま子に下ると不具合が生じるためノードから得る。
         if mplug.isArray:
-            mattr = self._CyObject__data['typeinfo']['mfn'].child(idx)
-            mp = noderef._CyObject__data['mfn'].findPlug(mattr, False)
+            mp = noderef._CyObject__data.mfn.findPlug(mattr, False)
             # 上位にマルチ要素が在る場合、このプラグにインデックスを合わせる。
             for ia in self.__elementIndexAttrs():
                 mp.selectAncestorLogicalIndex(*ia)
 
         # マルチアトリビュートでなければ子を直接得られる。
         else:
-            mp = mplug.child(idx)
+            mp = mplug.child(mattr)
 
-        return _newNodeRefPlug(_type(self), noderef, mp, typename=self._CyObject__data['typeinfo'].get('subtype'))
+        return _newNodeRefPlug(_type(self), noderef, mp, typeinfo)
 
     def children(self):
         u"""
@@ -1050,21 +1068,20 @@ class Plug_c(CyObject):
         :rtype: `list`
         """
         # コンパウンドでなければエラー。
-        mplug = self._CyObject__data['mplug']
+        mplug = self._CyObject__data.mplug
         if not mplug.isCompound:
             raise TypeError('plug is not a compound: ' + self.name_())
 
-        noderef = self._CyObject__data['noderef']
+        noderef = self._CyObject__data.noderef
+        infos = _getChildAttrInfos(self._CyObject__data, mplug.numChildren())
 
         # 子の MPlug を得るプロシージャを作成。
         if mplug.isArray:
             # マルチアトリビュートのインデックスが未解決な場合は、そのまま子に下ると不具合が生じるためノードから得る。
-            childAttr = self._CyObject__data['typeinfo']['mfn'].child
-            findPlug = noderef._CyObject__data['mfn'].findPlug
+            findPlug = noderef._CyObject__data.mfn.findPlug
             idxAttrs = self.__elementIndexAttrs()
 
-            def getChild(i):
-                mattr = childAttr(i)
+            def getChild(mattr):
                 mp = findPlug(mattr, False)
                 # 上位にマルチ要素が在る場合、このプラグにインデックスを合わせる。
                 for ia in idxAttrs:
@@ -1077,11 +1094,7 @@ class Plug_c(CyObject):
 
         # 子プラグリストを得る。
         cls = _type(self)
-        subtype = self._CyObject__data['typeinfo'].get('subtype')
-        res = [
-            _newNodeRefPlug(cls, noderef, getChild(i), typename=subtype)
-            for i in range(mplug.numChildren())
-        ]
+        res = [_newNodeRefPlug(cls, noderef, getChild(mattr), typeinfo) for mattr, typeinfo in infos]
         getChild = None
         return res
 
@@ -1095,11 +1108,11 @@ class Plug_c(CyObject):
         self.checkValid()
         try:
             # mfn.numChildren() だと double3 などの場合に得られない。
-            n = self._CyObject__data['mplug'].numChildren()
+            n = self._CyObject__data.mplug.numChildren()
         except:
             raise TypeError('plug is not a compound: ' + self.name_())
 
-        c_ = self._CyObject__data['typeinfo']['mfn'].child
+        c_ = self._CyObject__data.typeinfo['mfn'].child
         if long:
             return [_2_MFnAttribute(c_(i)).name for i in range(n)]
         else:
@@ -1116,27 +1129,32 @@ class Plug_c(CyObject):
         """
         self.checkValid()
 
-        def finder(mplug):
+        # 再帰せずに、スタックで深さ優先で辿る。
+        data = self._CyObject__data
+        numElemName = 'evaluateNumElements' if evaluate else 'numElements'
+        leaves = []
+        stack = [(data.mplug, data.typeinfo)]
+        while stack:
+            mplug, typeinfo = stack.pop()
             if mplug.isArray:
-                for i in range(getattr(mplug, numElemName)()):
-                    finder(nonNetworkedElemMPlug(mplug, mplug.elementByPhysicalIndex(i)))
+                elem = mplug.elementByPhysicalIndex
+                stack.extend([
+                    (nonNetworkedElemMPlug(mplug, elem(i)), typeinfo)
+                    for i in range(getattr(mplug, numElemName)() - 1, -1, -1)])
             elif mplug.isCompound:
-                for i in range(mplug.numChildren()):
-                    finder(mplug.child(i))
+                child = mplug.child
+                stack.extend([
+                    (child(mattr), x) for mattr, x in
+                    reversed(_getChildAttrInfos(data, mplug.numChildren(), typeinfo))])
             else:
-                append(mplug)
-
-        leaves = []
-        append = leaves.append
-        numElemName = 'evaluateNumElements' if evaluate else 'numElements'
-        finder(self._CyObject__data['mplug'])
+                leaves.append((mplug, typeinfo))
 
         if len(leaves) == 1:
             return [self]
 
         cls = _type(self)
-        noderef = self._CyObject__data['noderef']
-        leaves = [_newNodeRefPlug(cls, noderef, x) for x in leaves]
+        noderef = data.noderef
+        leaves = [_newNodeRefPlug(cls, noderef, x, t) for x, t in leaves]
         return leaves
 
     def array(self):
@@ -1147,7 +1165,7 @@ class Plug_c(CyObject):
         """
         self.checkValid()
         try:
-            return _newNodeRefPlug(_type(self), self._CyObject__data['noderef'], self._CyObject__data['mplug'].array(), self._CyObject__data['typeinfo'])
+            return _newNodeRefPlug(_type(self), self._CyObject__data.noderef, self._CyObject__data.mplug.array(), self._CyObject__data.typeinfo)
         except:
             raise TypeError('plug is not an element: ' + self.name_())
 
@@ -1180,7 +1198,7 @@ class Plug_c(CyObject):
         if not self.mfn().worldSpace:
             return True
 
-        mp = self._CyObject__data['mplug']
+        mp = self._CyObject__data.mplug
         c = mp.array() if mp.isElement else mp
         while c.isChild:
             mp = c.parent()
@@ -1189,7 +1207,7 @@ class Plug_c(CyObject):
         if not mp.isElement:
             return True
         i = mp.logicalIndex()
-        return i < 0 or i == self._CyObject__data['noderef']._CyObject__data['mpath'].instanceNumber()
+        return i < 0 or i == self._CyObject__data.noderef._CyObject__data.mpath.instanceNumber()
 
     def worldElement(self):
         u"""
@@ -1205,7 +1223,7 @@ class Plug_c(CyObject):
         if not self.mfn().worldSpace:
             return self
 
-        mplug = self._CyObject__data['mplug']
+        mplug = self._CyObject__data.mplug
         root = mplug
 
         isElem = root.isElement
@@ -1215,7 +1233,7 @@ class Plug_c(CyObject):
             isElem = root.isElement
             c = root.array() if isElem else root
 
-        idx = self._CyObject__data['noderef']._CyObject__data['mpath'].instanceNumber()
+        idx = self._CyObject__data.noderef._CyObject__data.mpath.instanceNumber()
         if isElem and root.logicalIndex() == idx:
             # インデックスが正しいなら、自身をそのまま返す。
             return self
@@ -1227,7 +1245,7 @@ class Plug_c(CyObject):
             mplug = _2_MPlug(mplug)
             mplug.selectAncestorLogicalIndex(idx, root.attribute())
 
-        return _newNodeRefPlug(_type(self), self._CyObject__data['noderef'], mplug, self._CyObject__data['typeinfo'])
+        return _newNodeRefPlug(_type(self), self._CyObject__data.noderef, mplug, self._CyObject__data.typeinfo)
 
     def numElements(self):
         u"""
@@ -1245,7 +1263,7 @@ class Plug_c(CyObject):
             返すようになり、これに依存した操作も期待通り動作する。
         """
         self.checkValid()
-        return self._CyObject__data['mplug'].numElements()
+        return self._CyObject__data.mplug.numElements()
 
     def numConnectedElements(self):
         u"""
@@ -1261,7 +1279,7 @@ class Plug_c(CyObject):
             場合がある出力のみのプラグもカウントされる。
         """
         self.checkValid()
-        return self._CyObject__data['mplug'].numConnectedElements()
+        return self._CyObject__data.mplug.numConnectedElements()
 
     def evaluateNumElements(self):
         u"""
@@ -1280,7 +1298,7 @@ class Plug_c(CyObject):
             を利用すること。
         """
         self.checkValid()
-        return self._CyObject__data['mplug'].evaluateNumElements()
+        return self._CyObject__data.mplug.evaluateNumElements()
 
     def element(self, idx):
         u"""
@@ -1292,14 +1310,14 @@ class Plug_c(CyObject):
         :rtype: `.Plug`
         """
         self.checkValid()
-        mplug = self._CyObject__data['mplug']
+        mplug = self._CyObject__data.mplug
         if not mplug.isArray:
             raise TypeError('plug is not an array: ' + self.name_())
         return _newNodeRefPlug(
             _type(self),
-            self._CyObject__data['noderef'],
+            self._CyObject__data.noderef,
             nonNetworkedElemMPlug(mplug, mplug.elementByPhysicalIndex(idx)),
-            self._CyObject__data['typeinfo'])
+            self._CyObject__data.typeinfo)
 
     def elements(self):
         u"""
@@ -1310,12 +1328,12 @@ class Plug_c(CyObject):
         :rtype: `list`
         """
         self.checkValid()
-        mplug = self._CyObject__data['mplug']
+        mplug = self._CyObject__data.mplug
         if not mplug.isArray:
             raise TypeError('plug is not an array: ' + self.name_())
         cls = _type(self)
-        noderef = self._CyObject__data['noderef']
-        info = self._CyObject__data['typeinfo']
+        noderef = self._CyObject__data.noderef
+        info = self._CyObject__data.typeinfo
         getElem = mplug.elementByPhysicalIndex
         return [
             _newNodeRefPlug(cls, noderef, nonNetworkedElemMPlug(mplug, getElem(i)), info)
@@ -1340,16 +1358,16 @@ class Plug_c(CyObject):
             しかし、このメソッドでは、論理インデックスの昇順に得られることを保証する。
         """
         self.checkValid()
-        mplug = self._CyObject__data['mplug']
+        mplug = self._CyObject__data.mplug
         if not mplug.isArray:
             raise TypeError('plug is not an array: ' + self.name_())
         getConElem = mplug.connectionByPhysicalIndex
         # NOTE: selectAncestorLogicalIndex は toNonNetworkedElemMPlug(multi, elem) 相当の操作。
         return _newNodeRefPlug(
             _type(self),
-            self._CyObject__data['noderef'],
+            self._CyObject__data.noderef,
             _2_MPlug(mplug).selectAncestorLogicalIndex(sorted([getConElem(i).logicalIndex() for i in range(mplug.numConnectedElements())])[idx]),
-            self._CyObject__data['typeinfo'])
+            self._CyObject__data.typeinfo)
 
     def connectedElements(self):
         u"""
@@ -1367,12 +1385,12 @@ class Plug_c(CyObject):
             しかし、このメソッドでは、論理インデックスの昇順に得られることを保証する。
         """
         self.checkValid()
-        mplug = self._CyObject__data['mplug']
+        mplug = self._CyObject__data.mplug
         if not mplug.isArray:
             raise TypeError('plug is not an array: ' + self.name_())
         cls = _type(self)
-        noderef = self._CyObject__data['noderef']
-        info = self._CyObject__data['typeinfo']
+        noderef = self._CyObject__data.noderef
+        info = self._CyObject__data.typeinfo
         getConElem = mplug.connectionByPhysicalIndex
         # NOTE: selectAncestorLogicalIndex は toNonNetworkedElemMPlug(multi, elem) 相当の操作。
         return [
@@ -1396,7 +1414,7 @@ class Plug_c(CyObject):
             しかし、このメソッドでは、論理インデックスの昇順に得られることを保証する。
         """
         self.checkValid()
-        mplug = self._CyObject__data['mplug']
+        mplug = self._CyObject__data.mplug
         if not mplug.isArray:
             raise TypeError('plug is not an array: ' + self.name_())
         getConElem = mplug.connectionByPhysicalIndex
@@ -1410,7 +1428,7 @@ class Plug_c(CyObject):
         """
         self.checkValid()
         try:
-            return self._CyObject__data['mplug'].logicalIndex()
+            return self._CyObject__data.mplug.logicalIndex()
         except:
             raise TypeError('plug is not an element: ' + self.name_())
 
@@ -1424,7 +1442,7 @@ class Plug_c(CyObject):
         """
         self.checkValid()
         try:
-            return list(self._CyObject__data['mplug'].getExistingArrayAttributeIndices())
+            return list(self._CyObject__data.mplug.getExistingArrayAttributeIndices())
         except:
             raise TypeError('plug is not an array: ' + self.name_())
 
@@ -1467,9 +1485,9 @@ class Plug_c(CyObject):
         :rtype: `list`
         """
         self.checkValid()
-        noderef = self._CyObject__data['noderef']
-        mfnnode = self._CyObject__data['noderef']._CyObject__data['mfn']
-        mattr = self._CyObject__data['mplug'].attribute()
+        noderef = self._CyObject__data.noderef
+        mfnnode = self._CyObject__data.noderef._CyObject__data.mfn
+        mattr = self._CyObject__data.mplug.attribute()
         mattrs = [x for x in mfnnode.getAffectedAttributes(mattr) if x != mattr]
 
         if worldSpace and self.mfn_().affectsWorldSpace:
@@ -1504,9 +1522,9 @@ class Plug_c(CyObject):
         :rtype: `list`
         """
         self.checkValid()
-        noderef = self._CyObject__data['noderef']
-        mfnnode = self._CyObject__data['noderef']._CyObject__data['mfn']
-        mattr = self._CyObject__data['mplug'].attribute()
+        noderef = self._CyObject__data.noderef
+        mfnnode = self._CyObject__data.noderef._CyObject__data.mfn
+        mattr = self._CyObject__data.mplug.attribute()
         mattrs = [x for x in mfnnode.getAffectingAttributes(mattr) if x != mattr]
 
         if worldSpace and self.mfn_().worldSpace:
@@ -1528,7 +1546,7 @@ class Plug_c(CyObject):
         :rtype: `bool`
         """
         return (
-            self._CyObject__data['typeinfo']['typename'] == 'enum' or 
+            self._CyObject__data.typeinfo['typename'] == 'enum' or 
             self.__getFromMFn('hasMin') or False
         )
 
@@ -1539,7 +1557,7 @@ class Plug_c(CyObject):
         :rtype: `bool`
         """
         return (
-            self._CyObject__data['typeinfo']['typename'] == 'enum' or 
+            self._CyObject__data.typeinfo['typename'] == 'enum' or 
             self.__getFromMFn('hasMax') or False
         )
 
@@ -1565,7 +1583,7 @@ class Plug_c(CyObject):
         """
         v = self.__getFromMFn('getMin', 'hasMin')
         if v is not None:
-            return unitAttrToRawValue(v, self._CyObject__data['typeinfo']['unittype'], True)
+            return unitAttrToRawValue(v, self._CyObject__data.typeinfo['unittype'], True)
 
     def max(self):
         u"""
@@ -1573,7 +1591,7 @@ class Plug_c(CyObject):
         """
         v = self.__getFromMFn('getMax', 'hasMax')
         if v is not None:
-            return unitAttrToRawValue(v, self._CyObject__data['typeinfo']['unittype'], True)
+            return unitAttrToRawValue(v, self._CyObject__data.typeinfo['unittype'], True)
 
     def softMin(self):
         u"""
@@ -1581,7 +1599,7 @@ class Plug_c(CyObject):
         """
         v = self.__getFromMFn('getSoftMin', 'hasSoftMin')
         if v is not None:
-            return unitAttrToRawValue(v, self._CyObject__data['typeinfo']['unittype'], True)
+            return unitAttrToRawValue(v, self._CyObject__data.typeinfo['unittype'], True)
 
     def softMax(self):
         u"""
@@ -1589,7 +1607,7 @@ class Plug_c(CyObject):
         """
         v = self.__getFromMFn('getSoftMax', 'hasSoftMax')
         if v is not None:
-            return unitAttrToRawValue(v, self._CyObject__data['typeinfo']['unittype'], True)
+            return unitAttrToRawValue(v, self._CyObject__data.typeinfo['unittype'], True)
 
     def minu(self):
         u"""
@@ -1597,7 +1615,7 @@ class Plug_c(CyObject):
         """
         v = self.__getFromMFn('getMin', 'hasMin')
         if v is not None:
-            return unitAttrToUnitValue(v, self._CyObject__data['typeinfo']['unittype'], True)
+            return unitAttrToUnitValue(v, self._CyObject__data.typeinfo['unittype'], True)
 
     def maxu(self):
         u"""
@@ -1605,7 +1623,7 @@ class Plug_c(CyObject):
         """
         v = self.__getFromMFn('getMax', 'hasMax')
         if v is not None:
-            return unitAttrToUnitValue(v, self._CyObject__data['typeinfo']['unittype'], True)
+            return unitAttrToUnitValue(v, self._CyObject__data.typeinfo['unittype'], True)
 
     def softMinu(self):
         u"""
@@ -1613,7 +1631,7 @@ class Plug_c(CyObject):
         """
         v = self.__getFromMFn('getSoftMin', 'hasSoftMin')
         if v is not None:
-            return unitAttrToUnitValue(v, self._CyObject__data['typeinfo']['unittype'], True)
+            return unitAttrToUnitValue(v, self._CyObject__data.typeinfo['unittype'], True)
 
     def softMaxu(self):
         u"""
@@ -1621,17 +1639,17 @@ class Plug_c(CyObject):
         """
         v = self.__getFromMFn('getSoftMax', 'hasSoftMax')
         if v is not None:
-            return unitAttrToUnitValue(v, self._CyObject__data['typeinfo']['unittype'], True)
+            return unitAttrToUnitValue(v, self._CyObject__data.typeinfo['unittype'], True)
 
     def __getFromMFn(self, method, checker=None):
         subType = self.subType()  # これで fixUnitTypeInfo もされる。
-        mfn = self._CyObject__data['typeinfo']['mfn']
+        mfn = self._CyObject__data.typeinfo['mfn']
         if subType:
             cls = _2_MFnUnitAttribute if subType in _UNIT_ATTRTYPE_SET else _2_MFnNumericAttribute
             mfn_child = mfn.child
             return [
                 _getFrom(cls(mfn_child(i)), method, checker)
-                for i in range(self._CyObject__data['mplug'].numChildren())
+                for i in range(self._CyObject__data.mplug.numChildren())
             ]
         else:
             return _getFrom(mfn, method, checker)
@@ -1645,7 +1663,7 @@ class Plug_c(CyObject):
         except:
             return
         if v is not None:
-            return attrToRawValue(v, self._CyObject__data['typeinfo']['typename'])
+            return attrToRawValue(v, self._CyObject__data.typeinfo['typename'])
 
     def defaultu(self):
         u"""
@@ -1656,8 +1674,8 @@ class Plug_c(CyObject):
         except:
             return
         if v is not None:
-            fixUnitTypeInfo(self._CyObject__data['typeinfo'])
-            return attrToUnitValue(v, self._CyObject__data['typeinfo']['unittype'])
+            fixUnitTypeInfo(self._CyObject__data.typeinfo)
+            return attrToUnitValue(v, self._CyObject__data.typeinfo['unittype'])
 
     def evaluate(self):
         u"""
@@ -1671,7 +1689,7 @@ class Plug_c(CyObject):
         """
         self.checkValid()
         try:
-            self._CyObject__data['mplug'].asMObject()
+            self._CyObject__data.mplug.asMObject()
         except:
             pass
 
@@ -1685,7 +1703,7 @@ class Plug_c(CyObject):
         :rtype: `callable`
         """
         self.checkValid()
-        mplug = self._CyObject__data['mplug']
+        mplug = self._CyObject__data.mplug
 
         def proc():
             try:
@@ -1702,15 +1720,15 @@ class Plug_c(CyObject):
         DAGノードのインスタンス番号は動的に変わるので、キャッシュはされない。
         `~.CyObject.checkValid` は呼び出し側で保証すること。
         """
-        if not self._CyObject__data['typeinfo']['mfn'].worldSpace:
-            return self._CyObject__data['mplug']
+        if not self._CyObject__data.typeinfo['mfn'].worldSpace:
+            return self._CyObject__data.mplug
 
-        mplug = self._CyObject__data['mplug']
+        mplug = self._CyObject__data.mplug
         if mplug.isArray:
             if not mplug.isChild:
                 # 最上位のプラグで isArray なら、現在のインスタンス番号の要素を得る。
                 mplug = _2_MPlug(mplug)
-                mplug.selectAncestorLogicalIndex(self._CyObject__data['noderef']._CyObject__data['mpath'].instanceNumber())
+                mplug.selectAncestorLogicalIndex(self._CyObject__data.noderef._CyObject__data.mpath.instanceNumber())
                 return mplug
             root = mplug.parent()
         else:
@@ -1725,10 +1743,10 @@ class Plug_c(CyObject):
             # 最上位のインデックスが未確定なら、現在のインスタンス番号に合わせた要素を得る。
             if mplug is root:
                 mplug = _2_MPlug(mplug)
-                mplug.selectAncestorLogicalIndex(self._CyObject__data['noderef']._CyObject__data['mpath'].instanceNumber())
+                mplug.selectAncestorLogicalIndex(self._CyObject__data.noderef._CyObject__data.mpath.instanceNumber())
             else:
                 mplug = _2_MPlug(mplug)
-                mplug.selectAncestorLogicalIndex(self._CyObject__data['noderef']._CyObject__data['mpath'].instanceNumber(), root.attribute())
+                mplug.selectAncestorLogicalIndex(self._CyObject__data.noderef._CyObject__data.mpath.instanceNumber(), root.attribute())
         return mplug
 
     def get(self):
@@ -1742,7 +1760,7 @@ class Plug_c(CyObject):
         """
         self.checkValid()
         # どのみち一般 compound の数値型は通常手段では得られないので unittype ではなく typename としている。
-        return mplugGetRawValue(self.__fixedMPlug(), self._CyObject__data['typeinfo']['typename'])
+        return mplugGetRawValue(self.__fixedMPlug(), self._CyObject__data.typeinfo['typename'])
 
     def getu(self):
         u"""
@@ -1754,8 +1772,153 @@ class Plug_c(CyObject):
         :returns: アトリビュート値。
         """
         self.checkValid()
-        fixUnitTypeInfo(self._CyObject__data['typeinfo'])
-        return mplugGetUnitValue(self.__fixedMPlug(), self._CyObject__data['typeinfo']['unittype'])
+        fixUnitTypeInfo(self._CyObject__data.typeinfo)
+        return mplugGetUnitValue(self.__fixedMPlug(), self._CyObject__data.typeinfo['unittype'])
+
+    @staticmethod
+    def getMany(plugs, unit=False, asDict=False):
+        u"""
+        複数のプラグの値をまとめて得る。
+
+        異なるノードのプラグが混在していても良い。
+        有効性チェックはノードごとに1回だけ行われ、
+        値を得る関数は型ごとに1回だけ決定されるため、
+        個々の `get` や `getu` を呼び出すよりも高速である。
+
+        :param `iterable` plugs: `Plug` のリスト。
+        :param `bool` unit: 内部単位ではなくUI設定単位で得る。
+        :param `bool` asDict: プラグをキーとした辞書で得る。
+        :rtype: `list` or `dict`
+        """
+        plugs = list(plugs)
+        vals = [getter(mplug) for getter, mplug in Plug_c.__valueGetters(plugs, unit)]
+        if asDict:
+            return dict(zip(plugs, vals))
+        return vals
+
+    @staticmethod
+    def sampleMany(plugs, times, unit=False):
+        u"""
+        複数のプラグの複数の時間における値をまとめて得る。
+
+        値は :mayaapi2:`MDGContext` によって評価されるため、
+        カレントタイムは変更されず、シーン全体の評価も行われない。
+
+        数値や数値コンパウンドや matrix などの数値として扱える型のみ可能で、
+        全てのプラグの要素数が揃っている必要がある。
+
+        NumPy がインストールされていない場合は ImportError となる。
+
+        :param `iterable` plugs: `Plug` のリスト。
+        :param `iterable` times: UI設定単位の時間のリスト。
+        :param `bool` unit: 内部単位ではなく `getu` と同じUI設定単位で得る。
+        :returns:
+            (時間数, プラグ数) か、
+            要素を持つ型の場合は (時間数, プラグ数, 要素数) の形状の配列。
+        :rtype: numpy.ndarray
+        """
+        _requireNumpy()
+        pairs = Plug_c.__valueGetters(list(plugs), unit)
+        times = list(times)
+
+        uiUnit = _2_MTime_uiUnit()
+        rows = []
+        if _2_MDGContextGuard:
+            for t in times:
+                with _2_MDGContextGuard(_2_MDGContext(_2_MTime(t, uiUnit))):
+                    rows.append([getter(mplug) for getter, mplug in pairs])
+        else:
+            # 2017 以前はカレントタイムを更新せずに変更して評価する。
+            cur = _currentTime(q=True)
+            try:
+                for t in times:
+                    _currentTime(t, u=False)
+                    rows.append([getter(mplug) for getter, mplug in pairs])
+            finally:
+                _currentTime(cur, u=False)
+
+        if rows and rows[0]:
+            lens = set([(len(v) if hasattr(v, '__len__') else -1) for v in rows[0]])
+            if len(lens) > 1:
+                raise ValueError('plugs have different numbers of components')
+        elif not rows:
+            return _np.empty((0, len(pairs)), dtype=_np.float64)
+        return _np.array(rows, dtype=_np.float64)
+
+    def getAtTimes(self, times, unit=False):
+        u"""
+        複数の時間における値を得る。
+
+        `sampleMany` によってカレントタイムを変更せずに評価される。
+
+        NumPy がインストールされていない場合は ImportError となる。
+
+        :param `iterable` times: UI設定単位の時間のリスト。
+        :param `bool` unit: 内部単位ではなく `getu` と同じUI設定単位で得る。
+        :returns:
+            (時間数,) か、
+            要素を持つ型の場合は (時間数, 要素数) の形状の配列。
+        :rtype: numpy.ndarray
+        """
+        self.checkValid()
+        return Plug_c.sampleMany([self], times, unit)[:, 0]
+
+    @staticmethod
+    def __valueGetters(plugs, unit):
+        u"""
+        プラグのリストから、値を得る関数と MPlug のペアのリストを得る。
+
+        有効性チェックはノードごとに1回だけ行われ、
+        値を得る関数は型ごとに1回だけ決定される。
+        """
+        if unit:
+            factory = mplugUnitValueGetter
+            key = 'unittype'
+        else:
+            factory = mplugRawValueGetter
+            key = 'typename'
+
+        validNodes = set()
+        getters = {}
+        pairs = []
+        for plug in plugs:
+            data = plug._CyObject__data
+            nodedata = data.nodedata
+            if id(nodedata) not in validNodes:
+                if not nodedata.mhdl.isValid():
+                    plug.checkValid()
+                validNodes.add(id(nodedata))
+            if data.attrIsAlive and not data.isValid():
+                plug.checkValid()
+
+            typeinfo = data.typeinfo
+            if unit:
+                fixUnitTypeInfo(typeinfo)
+            mplug = plug.__fixedMPlug() if typeinfo['mfn'].worldSpace else data.mplug
+
+            gkey = (typeinfo[key], mplug.isArray)
+            getter = getters.get(gkey)
+            if not getter:
+                getter = factory(*gkey)
+                getters[gkey] = getter
+            pairs.append((getter, mplug))
+        return pairs
+
+    def getArray(self):
+        u"""
+        データ配列型アトリビュートの値を NumPy 配列として得る。
+
+        doubleArray 、 floatArray 、 Int32Array は (N,) 、
+        vectorArray は (N,3) 、 pointArray は (N,4) の形状となる。
+        値は Python のリストを経由せずに得られ、
+        floatArray や pointArray も :mayacmd:`getAttr` を使用しない。
+
+        NumPy がインストールされていない場合は ImportError となる。
+
+        :rtype: numpy.ndarray
+        """
+        self.checkValid()
+        return mplugGetArray(self.__fixedMPlug(), self.mplug1_, self._CyObject__data.typeinfo['typename'])
 
     def getM(self):
         u"""
@@ -1780,7 +1943,7 @@ class Plug_c(CyObject):
         u"""
         enum 型アトリビュートから現在の値の名前を得る。
         """
-        return self.mfn().fieldName(self._CyObject__data['mplug'].asShort())
+        return self.mfn().fieldName(self._CyObject__data.mplug.asShort())
 
     def enumName(self, val):
         u"""
@@ -1806,7 +1969,7 @@ class Plug_c(CyObject):
 
         :rtype: `bool`
         """
-        if self._CyObject__data['typeinfo']['typename'] == 'matrix':
+        if self._CyObject__data.typeinfo['typename'] == 'matrix':
             self.checkValid()
             try:
                 return _2_MFnMatrixData(self.__fixedMPlug().asMObject()).isTransformation()
@@ -1859,9 +2022,9 @@ class Plug_c(CyObject):
         # worldSpaceでインデックスが未確定の場合はインスタンスに合わせた MPlug を得る。
         self.checkValid()
         mplug = self.__fixedMPlug()
-        if mplug is self._CyObject__data['mplug']:
+        if mplug is self._CyObject__data.mplug:
             # 上位に未解決なインデックスがある場合は、コネクションは得られないものとする。
-            if '[-1]' in self._CyObject__data['attrname']:
+            if '[-1]' in self._CyObject__data.attrname:
                 return [] if index is None else None
             fromPlug = self
         else:
@@ -2032,6 +2195,30 @@ class Plug_c(CyObject):
         kwargs['checkElements'] = False
         return self.connections(False, True, **kwargs)
 
+    def iterUpstream(self, **kwargs):
+        u"""
+        このプラグから上流のプラグかノードを辿って得るジェネレータ。
+
+        オプションは `.Node.iterUpstream` と同じである。
+
+        :rtype: generator
+        """
+        self.checkValid()
+        kwargs.setdefault('pcls', self.plugClass())
+        return _iterDependencyGraph(self._CyObject__data.mplug, False, **kwargs)
+
+    def iterDownstream(self, **kwargs):
+        u"""
+        このプラグから下流のプラグかノードを辿って得るジェネレータ。
+
+        オプションは `.Node.iterUpstream` と同じである。
+
+        :rtype: generator
+        """
+        self.checkValid()
+        kwargs.setdefault('pcls', self.plugClass())
+        return _iterDependencyGraph(self._CyObject__data.mplug, True, **kwargs)
+
     def isConnectedTo(self, dst):
         u"""
         このプラグから指定プラグへ向かう接続が在るかどうか検査する。
@@ -2119,9 +2306,9 @@ class Plug_c(CyObject):
         # インデックスかプラグを返す。
         return _newNodeRefPlug(
             _type(self),
-            self._CyObject__data['noderef'],
+            self._CyObject__data.noderef,
             _2_MPlug(mplug).selectAncestorLogicalIndex(idx),
-            self._CyObject__data['typeinfo']
+            self._CyObject__data.typeinfo
         ) if asPlug else idx
 
     if MAYA_VERSION >= (2016, 5):
@@ -2264,18 +2451,18 @@ class Plug_c(CyObject):
                 for p, v in zip(self.children(), val):
                     v = attrFromRawValue(v, typ)
                     p.mfn_().default = v
-                    setApiVal(p._CyObject__data['mplug'], v)
+                    setApiVal(p._CyObject__data.mplug, v)
             else:
                 for p, v in zip(self.children(), val):
                     p.mfn_().default = attrFromRawValue(v, typ)
         else:
             if reset:
-                typ = self._CyObject__data['typeinfo']['typename']
+                typ = self._CyObject__data.typeinfo['typename']
                 val = attrFromRawValue(val, typ)
                 self.mfn().default = val
-                mplugApiValueSetter(typ)(self._CyObject__data['mplug'], val)
+                mplugApiValueSetter(typ)(self._CyObject__data.mplug, val)
             else:
-                self.mfn().default = attrFromRawValue(val, self._CyObject__data['typeinfo']['typename'])
+                self.mfn().default = attrFromRawValue(val, self._CyObject__data.typeinfo['typename'])
 
     def apiSetDefaultu(self, val, reset=False, force=False):
         u"""
@@ -2297,18 +2484,18 @@ class Plug_c(CyObject):
                 for p, v in zip(self.children(), val):
                     v = attrFromUnitValue(v, typ)
                     p.mfn_().default = v
-                    setApiVal(p._CyObject__data['mplug'], v)
+                    setApiVal(p._CyObject__data.mplug, v)
             else:
                 for p, v in zip(self.children(), val):
                     p.mfn_().default = attrFromUnitValue(v, typ)
         else:
             if reset:
-                typ = self._CyObject__data['typeinfo']['typename']
+                typ = self._CyObject__data.typeinfo['typename']
                 val = attrFromUnitValue(val, typ)
                 self.mfn().default = val
-                mplugApiValueSetter(typ)(self._CyObject__data['mplug'], val)
+                mplugApiValueSetter(typ)(self._CyObject__data.mplug, val)
             else:
-                self.mfn().default = attrFromUnitValue(val, self._CyObject__data['typeinfo']['typename'])
+                self.mfn().default = attrFromUnitValue(val, self._CyObject__data.typeinfo['typename'])
 
     def apiGetSetNullProc(self):
         u"""
@@ -2328,7 +2515,7 @@ class Plug_c(CyObject):
 
         :rtype: `callable`
         """
-        return mplugCurrentValueSetter(self.mplug(), self._CyObject__data['typeinfo']['typename'])
+        return mplugCurrentValueSetter(self.mplug(), self._CyObject__data.typeinfo['typename'])
 
 
 #------------------------------------------------------------------------------
@@ -2393,8 +2580,8 @@ def _evalConnList(baseobj, results, pcls=None, basepcls=None, index=None, nodety
     # objMap によって、なるべく同じインスタンスがシェアされるようにする。
     if results:
         isNode = baseobj.CLASS_TYPE is CY_NODE
-        noderef = _getObjectRef(baseobj) if isNode else baseobj._CyObject__data['noderef']
-        nodename = noderef._CyObject__data['getname']()
+        noderef = _getObjectRef(baseobj) if isNode else baseobj._CyObject__data.noderef
+        nodename = noderef._CyObject__data.getname()
         objMap = {nodename: noderef}
 
         # asPair=True の場合 basepcls が渡される。
@@ -2434,6 +2621,120 @@ def _evalConnList(baseobj, results, pcls=None, basepcls=None, index=None, nodety
         return results[0]
 
 
+def _getChildAttrInfos(data, num, typeinfo=None):
+    u"""
+    コンパウンドアトリビュートの子の (MObject, タイプ情報) のリストを得る。
+
+    結果はタイプ情報に保持されるため、
+    静的アトリビュートであればノードタイプごとに共有され、
+    :mayaapi2:`MFnCompoundAttribute` などへの問い合わせは1度だけとなる。
+
+    :param data: Plug の内部データ。
+    :param `int` num: MPlug から得た子の数。
+    :param `dict` typeinfo: 省略時は data のものが使用される。
+    """
+    if typeinfo is None:
+        typeinfo = data.typeinfo
+    infos = typeinfo.get('children')
+    if infos is None or len(infos) != num:
+        fixUnitTypeInfo(typeinfo)
+        subtype = typeinfo.get('subtype')
+        childAttr = typeinfo['mfn'].child
+        nodedata = data.nodedata
+        infos = []
+        for i in range(num):
+            mattr = childAttr(i)
+            infos.append((mattr, _getPlugTypeInfo(nodedata, mattr, subtype)))
+        typeinfo['children'] = infos
+    return infos
+
+
+def _iterDependencyGraph(
+    root, downstream, depth=None, type=None, exactType=False,
+    plugLevel=False, skipConversionNodes=True, breadthFirst=False,
+    prune=None, pcls=None,
+):
+    u"""
+    :mayaapi2:`MItDependencyGraph` でグラフを辿り、
+    ルート以外のノードかプラグを得るジェネレータ。
+
+    訪問済みのノードは :mayaapi2:`MObjectHandle` のハッシュコード
+    （プラグレベルの場合はそれとプラグ名）で管理され、
+    ラッパーオブジェクトは yield するものだけが生成される
+    （prune が指定された場合は訪問する全てで生成される）。
+
+    深さ優先では、長い経路で先に訪問されたノードが深さの制限で刈られると、
+    より短い経路の先にあるノードが得られなくなるため、
+    depth が指定された場合は常に幅優先で辿る（最短経路で最初に訪問される）。
+
+    :param root: :mayaapi2:`MObject` か :mayaapi2:`MPlug` 。
+    """
+    if depth is not None:
+        if depth < 1:
+            return
+        breadthFirst = True
+    it = _2_MItDependencyGraph(
+        root, _MFn.kInvalid,
+        _2_MItDependencyGraph.kDownstream if downstream else _2_MItDependencyGraph.kUpstream,
+        _2_MItDependencyGraph.kBreadthFirst if breadthFirst else _2_MItDependencyGraph.kDepthFirst,
+        _2_MItDependencyGraph.kPlugLevel if plugLevel else _2_MItDependencyGraph.kNodeLevel,
+    )
+    rootNode = it.rootNode()
+
+    if plugLevel:
+        objMap = {}
+
+        def getObj(mnode):
+            mplug = toNonNetworkedMPlug(it.currentPlug())
+            return _mplugToPlug(pcls, mplug, _node4ArgsByMPlug(mplug), objMap)
+    else:
+        def getObj(mnode):
+            return _nodeClsObjByMObj(CyObject, mnode)
+
+    visited = set()
+    it.next()  # ルートはスキップ。
+    while not it.isDone():
+        mnode = it.currentNode()
+        if skipConversionNodes and mnode.apiType() in _UnitConvTypes:
+            it.next()
+            continue
+
+        key = _2_MObjectHandle(mnode).hashCode()
+        if plugLevel:
+            key = (key, it.currentPlug().partialName(includeNonMandatoryIndices=True, includeInstancedIndices=True))
+        if key in visited:
+            it.next()
+            continue
+        visited.add(key)
+
+        # 深さの制限に達したら、その先は辿らない。
+        if depth is not None:
+            n = 0
+            for x in it.getNodePath():
+                if x != rootNode and not (skipConversionNodes and x.apiType() in _UnitConvTypes):
+                    n += 1
+            if n >= depth:
+                it.prune()
+
+        obj = None
+        if prune:
+            obj = getObj(mnode)
+            if prune(obj):
+                it.prune()
+
+        if type:
+            typename = _2_MFnDependencyNode(mnode).typeName
+            if exactType:
+                ok = typename == type
+            else:
+                ok = _isDerivedNodeType(typename, type)
+        else:
+            ok = True
+        if ok:
+            yield obj or getObj(mnode)
+        it.next()
+
+
 def _argsToNode(args, objMap):
     u"""
     名前をキーとする辞書で結果を共有しつつ MPlug から得た引数リストから Node オブジェクトを得る。
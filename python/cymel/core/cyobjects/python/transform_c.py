@@ -29,9 +29,10 @@ from .dagnode_c import (
     _Joint_ssc,
     _Joint_is,
 )
+from .plug import PlugBatch
 import maya.api.OpenMaya as _api2
 
-__all__ = []
+__all__ = ['setMatrices', 'setTransformations']
 
 _MFn = _api2.MFn
 _MX = _api2.MTransformationMatrix
@@ -40,6 +41,7 @@ _MQ = _api2.MQuaternion
 _ME = _api2.MEulerRotation
 _MP = _api2.MPoint
 _MV = _api2.MVector
+_2_MDagPath = _api2.MDagPath
 
 _MFn_kJoint = _MFn.kJoint
 _MSpace_kTransform = _api2.MSpace.kTransform
@@ -409,21 +411,7 @@ class TransformMixin(object):
         if ws and mpath.length() > 1:
             m = _newM(m._Matrix__data * mpath.exclusiveMatrixInverse())
 
-        findPlug = self.mfn_().findPlug
-        attrs = {
-            'ro': findPlug(_Transform_ro, True).asShort(),
-            'ra': mplug_get_nums(findPlug(_Transform_ra, True)),
-            'rp': mplug_get_nums(findPlug(_Transform_rp, True)),
-            'rpt': mplug_get_nums(findPlug(_Transform_rpt, True)),
-            'sp': mplug_get_nums(findPlug(_Transform_sp, True)),
-            'spt': mplug_get_nums(findPlug(_Transform_spt, True)),
-        }
-        if mpath.hasFn(_MFn_kJoint):
-            attrs['ssc'] = findPlug(_Joint_ssc, True).asBool()
-            attrs['is'] = mplug_get_nums(findPlug(_Joint_is, True))
-            attrs['jo'] = mplug_get_nums(findPlug(_Joint_jo, True))
-
-        x = X(m, **attrs)
+        x = X(m, **_xformAttrs(self.mfn_().findPlug, mpath.hasFn(_MFn_kJoint)))
 
         if get:
             x.r  # 結果を repr したときに r が見えるように評価。
@@ -515,6 +503,273 @@ class TransformMixin(object):
 
 
 #------------------------------------------------------------------------------
+def setMatrices(nodes, ms, ws=False, safe=False):
+    u"""
+    複数のノードにマトリックスをまとめてセットする。
+
+    各ノードに `.Transform.setMatrix` を行うのと同じ結果となるが、
+    `.PlugBatch` によって1つの :mayaapi2:`MDGModifier` で実行され、
+    undo も1回で済む。
+
+    ws=True の場合、親か祖先もセット対象に含まれていれば
+    最も近いそのノードにセットされるマトリックスを基準にローカルに変換される
+    （間のノードの現在の相対マトリックスは維持されるものとする）。
+    そうでなければ親の :mayaapi2:`MDagPath` の
+    exclusiveMatrixInverse が用いられる。
+    セグメントスケール補正されたジョイントの inverseScale も、
+    親がセット対象に含まれていれば、その新しいスケールが考慮される。
+
+    `.PlugBatch` の中で呼ばれた場合は、その終了時にまとめて実行される。
+
+    :param `iterable` nodes: `.Transform` のリスト。
+    :param ms:
+        `.Matrix` のリストか、
+        (ノード数, 4, 4) の形状の配列。
+    :param `bool` ws: ワールド空間でセットするかどうか。
+    :param `bool` safe:
+        アトリビュートがロックされていているなどのために
+        セットできない場合もエラーにならない。
+        また、 double3 のセットできる箇所だけセットされる。
+    :returns: 失敗したプラグ名のリスト（safe=False なら常に空）。
+    :rtype: `list`
+    """
+    nodes = list(nodes)
+    ms = [_toMM(m) for m in ms]
+    if len(ms) != len(nodes):
+        raise ValueError('the number of matrices does not match the number of nodes')
+
+    mpaths, parents, ancestors, order = _hierarchyInfo(nodes)
+    invs = {}
+    xs = [None] * len(nodes)
+    for i in order:
+        mpath = mpaths[i]
+        j = parents[i]
+        m = ms[i]
+        if ws and mpath.length() > 1:
+            m = m * _parentInverse(mpaths, ancestors, invs, i, ms.__getitem__)
+
+        findPlug = nodes[i].mfn_().findPlug
+        isJoint = mpath.hasFn(_MFn_kJoint)
+        attrs = _xformAttrs(findPlug, isJoint, _inverseScale(findPlug, xs, j) if isJoint else None)
+        xs[i] = X(_newM(m), **attrs)
+
+    return _runInBatch(safe, _setXformValues, nodes, xs, safe)
+
+
+def setTransformations(nodes, xs, ws=False, safe=False):
+    u"""
+    複数のノードにトランスフォーメーションをまとめてセットする。
+
+    各ノードに `.Transform.setTransformation` を行うのと同じ結果となるが、
+    `.PlugBatch` によって1つの :mayaapi2:`MDGModifier` で実行され、
+    undo も1回で済む。
+
+    ピボットや jointOrient などの修飾系アトリビュートは、
+    ロックや接続のためにセットできない場合は現在の値が維持され、
+    マトリックスが一致するように他の値が計算される。
+
+    ws=True の場合の親の扱いは `setMatrices` と同様である。
+
+    `.PlugBatch` の中で呼ばれた場合は、その終了時にまとめて実行される。
+
+    :param `iterable` nodes: `.Transform` のリスト。
+    :param `iterable` xs: `.Transformation` のリスト。
+    :param `bool` ws: ワールド空間でセットするかどうか。
+    :param `bool` safe:
+        アトリビュートがロックされていているなどのために
+        セットできない場合もエラーにならない。
+        また、 double3 のセットできる箇所だけセットされる。
+    :returns: 失敗したプラグ名のリスト（safe=False なら常に空）。
+    :rtype: `list`
+    """
+    nodes = list(nodes)
+    srcs = list(xs)
+    if len(srcs) != len(nodes):
+        raise ValueError('the number of transformations does not match the number of nodes')
+
+    mpaths, parents, ancestors, order = _hierarchyInfo(nodes)
+    invs = {}
+    xs = [None] * len(nodes)
+    mods = []
+    for i in order:
+        mpath = mpaths[i]
+        j = parents[i]
+        isJoint = mpath.hasFn(_MFn_kJoint)
+
+        # Transformation に Matrix を乗じることで、
+        # ピボットなどの各基準位置もワールド空間で一致させる。
+        x = srcs[i]._Transformation__copy()
+        if ws and mpath.length() > 1:
+            x *= _newM(_parentInverse(mpaths, ancestors, invs, i, lambda k: srcs[k].m._Matrix__data))
+        m = x.m
+
+        # ノードタイプによって修飾属性の有無や利用可否を合わせる。
+        clear = x.clear
+        if isJoint:
+            clear('rp')
+            clear('rpt')
+            clear('sp')
+            clear('spt')
+            x.is_ = _newV(_MP(_inverseScale(nodes[i].mfn_().findPlug, xs, j)))
+        else:
+            clear('jo')
+            clear('ssc')
+            clear('is')
+
+        # 修飾属性のうちセットできないものは、その値を読み取る。
+        p_ = nodes[i].plug_
+        names = _JOINT_MOD_ATTRS if isJoint else _TRANSFORM_MOD_ATTRS
+        mods.append([_fitBatchXformAttr(p_, x, name) for name in names])
+
+        x.m = m
+        xs[i] = x
+
+    def proc():
+        for plugvals in mods:
+            for plug, val in plugvals:
+                if plug:
+                    plug.set(val, safe=True)
+        _setXformValues(nodes, xs, safe)
+
+    return _runInBatch(safe, proc)
+
+
+def _toMM(m):
+    data = getattr(m, '_Matrix__data', None)
+    if data is not None:
+        return data
+    if hasattr(m, 'ravel'):
+        return _MM(m.ravel().tolist())
+    m = list(m)
+    if len(m) == 4:
+        m = [v for row in m for v in row]
+    return _MM(m)
+
+
+def _hierarchyInfo(nodes):
+    u"""
+    ノードの MDagPath リスト、セット対象内の親のインデックスリスト、
+    セット対象内の最も近い祖先のインデックスリスト、
+    パス長順のインデックスリストを得る。
+    """
+    mpaths = [x._mpath() for x in nodes]
+    names = [x.fullPathName() for x in mpaths]
+    idxDict = dict([(x, i) for i, x in enumerate(names)])
+    parents = []
+    ancestors = []
+    for name in names:
+        name = name.rpartition('|')[0]
+        j = idxDict.get(name, -1)
+        parents.append(j)
+        while j < 0 and name:
+            name = name.rpartition('|')[0]
+            j = idxDict.get(name, -1)
+        ancestors.append(j)
+    order = sorted(range(len(mpaths)), key=lambda i: mpaths[i].length())
+    return mpaths, parents, ancestors, order
+
+
+def _parentInverse(mpaths, ancestors, invs, i, getWorld):
+    u"""
+    ノードの新しい親のワールドマトリックスの逆行列を得る。
+
+    セット対象内の祖先があれば、その新しいワールドマトリックスに、
+    祖先から親までの現在の相対マトリックスを乗じたものを親のワールドマトリックスとする。
+
+    :param `callable` getWorld:
+        インデックスからセット対象の新しいワールドマトリックス
+        （ :mayaapi2:`MMatrix` ）を得る関数。
+    """
+    mpath = mpaths[i]
+    k = ancestors[i]
+    if k < 0:
+        return mpath.exclusiveMatrixInverse()
+    if mpath.length() == mpaths[k].length() + 1:
+        inv = invs.get(k)
+        if inv is None:
+            inv = getWorld(k).inverse()
+            invs[k] = inv
+        return inv
+    return (mpath.exclusiveMatrix() * mpaths[k].inclusiveMatrixInverse() * getWorld(k)).inverse()
+
+
+def _xformAttrs(findPlug, isJoint, inverseScale=None):
+    u"""
+    マトリックスから `.Transformation` を構築する際の修飾属性の現在の値の辞書を得る。
+
+    :param `callable` findPlug: :mayaapi2:`MFnDependencyNode` の findPlug 。
+    :param `bool` isJoint: ジョイントかどうか。
+    :param inverseScale:
+        ジョイントの inverseScale として使う値。
+        省略時は現在の値となる。
+    :rtype: `dict`
+    """
+    attrs = {
+        'ro': findPlug(_Transform_ro, True).asShort(),
+        'ra': mplug_get_nums(findPlug(_Transform_ra, True)),
+        'rp': mplug_get_nums(findPlug(_Transform_rp, True)),
+        'rpt': mplug_get_nums(findPlug(_Transform_rpt, True)),
+        'sp': mplug_get_nums(findPlug(_Transform_sp, True)),
+        'spt': mplug_get_nums(findPlug(_Transform_spt, True)),
+    }
+    if isJoint:
+        attrs['ssc'] = findPlug(_Joint_ssc, True).asBool()
+        attrs['is'] = mplug_get_nums(findPlug(_Joint_is, True)) if inverseScale is None else inverseScale
+        attrs['jo'] = mplug_get_nums(findPlug(_Joint_jo, True))
+    return attrs
+
+
+def _inverseScale(findPlug, xs, j):
+    u"""
+    ジョイントの inverseScale を得る。
+
+    親もセット対象の場合は、接続されていれば親の新しいスケールとする。
+    """
+    mplug = findPlug(_Joint_is, True)
+    if j >= 0 and mplug.isDestination:
+        return list(xs[j].s)
+    return mplug_get_nums(mplug)
+
+
+def _runInBatch(safe, proc, *args):
+    if PlugBatch.current() is not None:
+        proc(*args)
+        return []
+    with PlugBatch(safe) as batch:
+        proc(*args)
+    return batch.failures
+
+
+def _setXformValues(nodes, xs, safe):
+    for node, x in zip(nodes, xs):
+        p_ = node.plug_
+        p_('t').set(x.t, safe=safe)
+        p_('r').set(x.r, safe=safe)
+        p_('sh').set(x.sh, safe=safe)
+        p_('s').set(x.s, safe=safe)
+
+
+def _fitBatchXformAttr(p_, x, name):
+    u"""
+    `_fitXformAttr` の `.PlugBatch` 用で、セットすべきプラグと値を得る。
+
+    PlugBatch では実行前に結果を得られないため、
+    変更可能でなければセットせずに現在の値を読み取る。
+    """
+    plug = p_(name)
+    if plug.isFreeToChange() != 0:
+        setattr(x, name, plug.get())
+        return None, None
+    if name in _QUAT_MOD_ATTRS:
+        return plug, getattr(x, name).asE()
+    return plug, getattr(x, name)
+
+
+_TRANSFORM_MOD_ATTRS = ('rp', 'rpt', 'sp', 'spt', 'ra', 'ro')
+_JOINT_MOD_ATTRS = ('jo', 'ssc') + _TRANSFORM_MOD_ATTRS
+_QUAT_MOD_ATTRS = frozenset(['jo', 'ra'])
+
+
 def _fitXformAttr(p_, x, name):
     plug = p_(name)
     if plug.set(getattr(x, name), safe=True):
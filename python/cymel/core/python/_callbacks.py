@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+u"""
+システム内部で使用する API メッセージコールバックの管理。
+
+キャッシュの無効化などのためのコールバックをキーで一元管理する。
+同じキーで登録すると古いものは削除されるため、
+モジュールがリロードされても古いコールバックが残ることはない。
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import maya.api.OpenMaya as _api2
+
+__all__ = []
+
+_2_MMessage_removeCallback = _api2.MMessage.removeCallback
+_2_MSceneMessage = _api2.MSceneMessage
+
+
+#------------------------------------------------------------------------------
+def addCallback(key, adder, *args):
+    u"""
+    API2 のメッセージクラスの登録関数でコールバックを登録する。
+
+    :param key: 管理用のキー。既に登録されていれば古いものは削除される。
+    :param `callable` adder: addCallback など API2 の登録関数。
+    :param args: 登録関数に渡す引数。
+    :returns: コールバックID。
+    """
+    removeCallback(key)
+    cid = adder(*args)
+    _CALLBACK_IDS[key] = cid
+    return cid
+
+
+def removeCallback(key):
+    u"""
+    キーで管理されているコールバックを削除する。
+
+    :param key: 管理用のキー。
+    :rtype: `bool` (削除されたかどうか)
+    """
+    cid = _CALLBACK_IDS.pop(key, None)
+    if cid is None:
+        return False
+    try:
+        _2_MMessage_removeCallback(cid)
+    except RuntimeError:
+        pass
+    return True
+
+
+def hasCallback(key):
+    u"""
+    キーでコールバックが登録されているかどうか。
+
+    :param key: 管理用のキー。
+    :rtype: `bool`
+    """
+    return key in _CALLBACK_IDS
+
+
+def addPluginChangedCallback(key, proc):
+    u"""
+    プラグインのロードとアンロードの後に呼ばれるコールバックを登録する。
+
+    :param key: 管理用のキー。
+    :param `callable` proc: 引数無しで呼び出されるプロシージャ。
+    """
+    def callback(strs, *args):
+        proc()
+    addCallback((key, 'load'), _2_MSceneMessage.addStringArrayCallback, _2_MSceneMessage.kAfterPluginLoad, callback)
+    addCallback((key, 'unload'), _2_MSceneMessage.addStringArrayCallback, _2_MSceneMessage.kAfterPluginUnload, callback)
+
+
+def addSceneResetCallback(key, proc):
+    u"""
+    シーンが新規作成されたり開かれたりする前に呼ばれるコールバックを登録する。
+
+    :param key: 管理用のキー。
+    :param `callable` proc: 引数無しで呼び出されるプロシージャ。
+    """
+    def callback(*args):
+        proc()
+    addCallback((key, 'new'), _2_MSceneMessage.addCallback, _2_MSceneMessage.kBeforeNew, callback)
+    addCallback((key, 'open'), _2_MSceneMessage.addCallback, _2_MSceneMessage.kBeforeOpen, callback)
+
+
+def removeCallbacks(key):
+    u"""
+    `addPluginChangedCallback` や `addSceneResetCallback` などで
+    まとめて登録されたものも含め、キーに関連するコールバックを削除する。
+
+    :param key: 管理用のキー。
+    """
+    for k in [x for x in _CALLBACK_IDS if x == key or (isinstance(x, tuple) and x[0] == key)]:
+        removeCallback(k)
+
+
+#------------------------------------------------------------------------------
+# NOTE: リロード時にも登録済みIDを失わないように、既存の辞書を引き継ぐ。
+try:
+    _CALLBACK_IDS
+except NameError:
+    _CALLBACK_IDS = {}  #: キーとコールバックIDの辞書。
@@ -10,6 +10,7 @@ from ..common import *
 from ..pyutils import Singleton, parentClasses
 from .typeinfo import isDerivedNodeType, getInheritedNodeTypes
 from ..compat_nodetype import compat_nodetype_map
+from ._callbacks import addPluginChangedCallback
 import maya.api.OpenMaya as _api2
 
 __all__ = ['nodetypes']
@@ -177,6 +178,7 @@ class NodeTypes(with_metaclass(Singleton, object)):
             if not old or hasattr(old, '_verifyNode'):
                 # 同名のベーシッククラスが在る場合、属性ではそちらが優先される。
                 setattr(self, name, cls)
+            _decideClsMemo.clear()
 
         # ベーシッククラスの場合。
         else:
@@ -201,6 +203,7 @@ class NodeTypes(with_metaclass(Singleton, object)):
 
             # 登録。
             self.__registerBasicNodeCls(nodetype, cls)
+            _decideClsMemo.clear()
 
     def deregisterNodeClass(self, cls, warn=False):
         u"""
@@ -212,6 +215,7 @@ class NodeTypes(with_metaclass(Singleton, object)):
         """
         cnt = self.__deregisterNodeClass(_evalAbstrClsDict, cls, warn)
         cnt += self.__deregisterNodeClass(_basicClsDict, cls, warn)
+        _decideClsMemo.clear()
         if not cnt:
             raise ValueError('unknown class: ' + repr(cls))
 
@@ -357,36 +361,59 @@ class NodeTypes(with_metaclass(Singleton, object)):
             マッチするものが無ければ None が返される。
         :rtype: `type` or None
         """
+        # ノードタイプと basecls の組み合わせごとに、検査候補のクラスとベーシッククラスをメモしておく。
+        # 検査の結果はノードの状態次第で変わるので、メモしない。
+        clss, cls = _decideClsMemo_get((nodetype, basecls)) or self.__makeDecideClassMemo(nodename, nodetype, basecls)
+        if clss:
+            mfn = getMFn()
+            for c in clss:
+                if c._verifyNode(mfn, nodename):
+                    return c
+        return cls
+
+    def __decideClassMemo(self, nodename, nodetype, basecls=None):
+        u"""
+        `__decideClass` のためのメモを得る。
+
+        検査メソッド付きクラスの候補のタプルと、
+        いずれも適合しなかった場合のクラスのペアが返される。
+        候補が空なら、ノードタイプのみからクラスが決まることを意味する。
+        """
+        return _decideClsMemo_get((nodetype, basecls)) or self.__makeDecideClassMemo(nodename, nodetype, basecls)
+
+    def __makeDecideClassMemo(self, nodename, nodetype, basecls):
+        u"""
+        `__decideClass` のためのメモを生成する。
+
+        検査メソッド付きクラスの候補のタプルと、
+        いずれも適合しなかった場合のクラスのペアが返される。
+        """
         if basecls:
             # 検査メソッド付きノードクラス辞書の中から basecls 派生クラスを調べる。
             if _evalAbstrClsDict and basecls in _clsNodeTypeDict:
-                mfn = None
-                for typ in getInheritedNodeTypes(nodetype, nodename):
-                    for cls in _evalAbstrClsDict_get(typ, EMPTY_TUPLE):
-                        if issubclass(cls, basecls):  # <-- この判定が加わるだけ。
-                            if mfn is None:
-                                mfn = getMFn()
-                            if cls._verifyNode(mfn, nodename):
-                                return cls
+                clss = tuple([
+                    cls for typ in getInheritedNodeTypes(nodetype, nodename)
+                    for cls in _evalAbstrClsDict_get(typ, EMPTY_TUPLE)
+                    if issubclass(cls, basecls)])  # <-- この判定が加わるだけ。
             # basecls が未登録なら、それだけを適合検査する。
-            elif basecls._verifyNode(getMFn(), nodename):
-                return basecls
-
+            else:
+                clss = (basecls,)
             # ベーシッククラスは認めない。
+            memo = (clss, None)
 
         else:
             # 検査メソッド付きノードクラス辞書を調べる。
             if _evalAbstrClsDict:
-                mfn = None
-                for typ in getInheritedNodeTypes(nodetype, nodename):
-                    for cls in _evalAbstrClsDict_get(typ, EMPTY_TUPLE):
-                        if mfn is None:
-                            mfn = getMFn()
-                        if cls._verifyNode(mfn, nodename):
-                            return cls
-
+                clss = tuple([
+                    cls for typ in getInheritedNodeTypes(nodetype, nodename)
+                    for cls in _evalAbstrClsDict_get(typ, EMPTY_TUPLE)])
+            else:
+                clss = EMPTY_TUPLE
             # ベーシックノードクラスを得る。
-            return self.__basicNodeClass(nodetype, nodename)
+            memo = (clss, self.__basicNodeClass(nodetype, nodename))
+
+        _decideClsMemo[(nodetype, basecls)] = memo
+        return memo
 
     def __deregisterNodeClass(self, dic, cls, warn):
         u"""
@@ -420,7 +447,10 @@ _evalAbstrClsDict = {}  #: 検査メソッド付きクラス辞書。
 _basicClsDict = {}  #: ベーシッククラス辞書。
 _clsNodeTypeDict = {}  #: クラスに紐付けられたノードタイプの辞書。
 
+_decideClsMemo = {}  #: ノードタイプと basecls をキーとする、クラス決定のためのメモ。
+
 _evalAbstrClsDict_get = _evalAbstrClsDict.get
+_decideClsMemo_get = _decideClsMemo.get
 _basicClsDict_get = _basicClsDict.get
 _clsNodeTypeDict_get = _clsNodeTypeDict.get
 
@@ -430,3 +460,6 @@ nodetypes = NodeTypes()  #: `NodeTypes` の唯一のインスタンス。
 
 _CLS_DEFAULT_ATTRS = {'__slots__': tuple()} if _FIX_SLOTS else {}
 
+# プラグインのロードやアンロードでノードタイプの構成が変わり得るので、メモを破棄する。
+addPluginChangedCallback('typeregistry', _decideClsMemo.clear)
+
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+u"""
+Benchmarks of cymel.
+
+Maya 上で各モジュールの run() を呼び出して計測する。
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import time
+import gc
+
+
+def timeit(proc, number=1):
+    u"""
+    処理の実行時間（秒）を計測する。
+
+    計測中はガベージコレクションを無効にし、
+    number 回実行したうちの最小値を返す。
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        best = None
+        for i in range(number):
+            t = time.time()
+            proc()
+            t = time.time() - t
+            if best is None or t < best:
+                best = t
+    finally:
+        if enabled:
+            gc.enable()
+    return best
+
+
+def report(title, rows):
+    u"""
+    計測結果を表形式で出力する。
+
+    :param `str` title: タイトル。
+    :param `list` rows: (ラベル, 値) のリスト。
+    """
+    print('-' * 70)
+    print(title)
+    width = max([len(x[0]) for x in rows]) if rows else 0
+    for label, val in rows:
+        if isinstance(val, float):
+            val = '%.6f' % val
+        print('  %s : %s' % (label.ljust(width), val))
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+u"""
+多数のノードへの同じアトリビュート群の追加の計測。
+
+`.Node.addAttr` の繰り返しと `.addAttrsToNodes` を比較する。
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import maya.cmds as cmds
+import cymel.main as cm
+from cymel_bench import timeit, report
+
+NUM_NODES = 500
+SPECS = [
+    {'ln': 'weight', 'dv': .5, 'min': 0., 'max': 1., 'k': True},
+    {'ln': 'offset', 'type': 'double3', 'subType': 'doubleLinear', 'k': True},
+    {'ln': 'mode', 'type': 'enum', 'en': 'off:on:auto'},
+    {'ln': 'label', 'type': 'string'},
+]
+
+
+#------------------------------------------------------------------------------
+def run():
+    def addAttr():
+        cmds.file(f=True, new=True)
+        for node in [cm.nt.Transform() for i in range(NUM_NODES)]:
+            node.addAttr('weight', 'double', dv=.5, min=0., max=1., k=True)
+            node.addAttr('offset', 'double3', 'doubleLinear', k=True)
+            node.addAttr('mode', 'enum', en='off:on:auto')
+            node.addAttr('label', 'string')
+
+    schema = cm.AttrSchema(SPECS)
+
+    def addAttrsToNodes():
+        cmds.file(f=True, new=True)
+        cm.addAttrsToNodes([cm.nt.Transform() for i in range(NUM_NODES)], schema)
+
+    report('add %d attributes to %d nodes' % (len(SPECS), NUM_NODES), [
+        ('Node.addAttr', timeit(addAttr)),
+        ('addAttrsToNodes', timeit(addAttrsToNodes)),
+    ])
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+u"""
+`.CyObject.fromNames` と `.CyObject.fromMObjects` による一括生成の計測。
+
+個別のコンストラクタ呼び出しとの、1アイテムあたりのコストを比較する。
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as api2
+import cymel.main as cm
+from cymel_bench import timeit, report
+
+SIZES = (1000, 10000, 100000)
+
+
+#------------------------------------------------------------------------------
+def _prepare(num):
+    cmds.file(f=True, new=True)
+    nodes = [cmds.createNode('transform') for i in range(num // 2)]
+    names = []
+    for x in nodes:
+        names.append(x)
+        names.append(x + '.tx')
+    return names[:num]
+
+
+def run(sizes=SIZES):
+    for num in sizes:
+        names = _prepare(num)
+        sel = api2.MSelectionList()
+        for x in names:
+            sel.add(x)
+        mobjs = [
+            (sel.getPlug(i) if '.' in names[i] else sel.getDependNode(i))
+            for i in range(sel.length())]
+
+        O = cm.O
+        tCtor = timeit(lambda: [O(x) for x in names])
+        tNames = timeit(lambda: O.fromNames(names))
+        tCtorObj = timeit(lambda: [O(x) for x in mobjs])
+        tMObjs = timeit(lambda: O.fromMObjects(mobjs))
+
+        report('batch construction: %d items' % num, [
+            ('O(name) (usec/item)', tCtor * 1e6 / num),
+            ('O.fromNames (usec/item)', tNames * 1e6 / num),
+            ('O(MObject/MPlug) (usec/item)', tCtorObj * 1e6 / len(mobjs)),
+            ('O.fromMObjects (usec/item)', tMObjs * 1e6 / len(mobjs)),
+        ])
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+u"""
+多数のノードのワールド空間のバウンディングボックスの取得の計測。
+
+`.DagNode.boundingBox` のループと `.boundingBoxes` を比較する。
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import maya.cmds as cmds
+import cymel.main as cm
+from cymel_bench import timeit, report
+
+NUM_NODES = 1000
+
+
+#------------------------------------------------------------------------------
+def run(num=NUM_NODES):
+    cmds.file(f=True, new=True)
+    nodes = []
+    for i in range(num):
+        node = cm.O(cmds.polyCube(ch=False)[0])
+        node.t.set((i, 0., 0.))
+        node.r.set((0., i * .01, 0.))
+        nodes.append(node)
+
+    def loop():
+        [x.boundingBox(ws=True) for x in nodes]
+
+    def boundingBoxes():
+        cm.boundingBoxes(nodes)
+
+    report('world bounding boxes: %d nodes' % num, [
+        ('DagNode.boundingBox loop', timeit(loop)),
+        ('boundingBoxes', timeit(boundingBoxes)),
+    ])
+
+
+if __name__ == '__main__':
+    run()
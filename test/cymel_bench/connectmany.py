@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+u"""
+多数の接続の計測。
+
+多数のプラグを接続する場合に、
+`.Plug.connect` のループと `.connectMany` を比較する。
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import maya.cmds as cmds
+import cymel.main as cm
+from cymel_bench import timeit, report
+
+NUM_NODES = 2000
+ATTR_NAMES = ['tx', 'ty', 'tz', 'rx', 'ry', 'rz', 'sx', 'sy', 'sz', 'v']
+
+
+#------------------------------------------------------------------------------
+def run(num=NUM_NODES, names=ATTR_NAMES):
+    cmds.file(f=True, new=True)
+    srcs = [cm.nt.Transform() for i in range(num)]
+    dsts = [cm.nt.Transform() for i in range(num)]
+    pairs = [(s.plug(n), d.plug(n)) for s, d in zip(srcs, dsts) for n in names]
+
+    def loop():
+        for src, dst in pairs:
+            dst.connect(src)
+        cm.disconnectMany(pairs)
+
+    def connectMany():
+        cm.connectMany(pairs)
+        cm.disconnectMany(pairs)
+
+    def disconnectMany():
+        cm.disconnectMany(pairs)
+
+    cm.connectMany(pairs)
+    t_disconnect = timeit(disconnectMany)
+
+    report('bulk connection: %d connections' % len(pairs), [
+        ('Plug.connect loop (+disconnectMany)', timeit(loop)),
+        ('connectMany (+disconnectMany)', timeit(connectMany)),
+        ('disconnectMany', t_disconnect),
+    ])
+
+
+if __name__ == '__main__':
+    run()
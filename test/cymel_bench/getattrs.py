@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+u"""
+アトリビュート値の一括取得の計測。
+
+多数のアトリビュートの値を得る場合に、
+`.Plug.get` のループと `.Plug.getMany` や `.Node.getAttrs` を比較する。
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import maya.cmds as cmds
+import cymel.main as cm
+from cymel_bench import timeit, report
+
+NUM_NODES = 1000
+ATTR_NAMES = ['t', 'r', 's', 'tx', 'ty', 'tz', 'v', 'rotateOrder', 'wm', 'm']
+
+
+#------------------------------------------------------------------------------
+def run(num=NUM_NODES, names=ATTR_NAMES):
+    cmds.file(f=True, new=True)
+    nodes = [cm.nt.Transform() for i in range(num)]
+    plugs = [x.plug(n) for x in nodes for n in names]
+
+    def loop():
+        [x.get() for x in plugs]
+
+    def getMany():
+        cm.Plug.getMany(plugs)
+
+    def getAttrsLoop():
+        for node in nodes:
+            [node.plug(n).get() for n in names]
+
+    def getAttrs():
+        for node in nodes:
+            node.getAttrs(names)
+
+    report('bulk attribute read: %d plugs' % len(plugs), [
+        ('Plug.get loop', timeit(loop)),
+        ('Plug.getMany', timeit(getMany)),
+        ('Node.plug(name).get loop', timeit(getAttrsLoop)),
+        ('Node.getAttrs', timeit(getAttrs)),
+    ])
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+u"""
+多数のノードのワールドマトリックスの取得の計測。
+
+`.DagNode.getMatrix` のループと `.getMatrices` を比較する。
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import maya.cmds as cmds
+import cymel.main as cm
+from cymel_bench import timeit, report
+
+NUM_NODES = 1000
+
+
+#------------------------------------------------------------------------------
+def run(num=NUM_NODES):
+    cmds.file(f=True, new=True)
+    nodes = []
+    parent = None
+    for i in range(num):
+        parent = cm.nt.Joint(p=parent) if parent else cm.nt.Joint()
+        parent.t.set((1., 0., 0.))
+        nodes.append(parent)
+
+    def loop():
+        [x.getMatrix(ws=True) for x in nodes]
+
+    def getMatrices():
+        cm.getMatrices(nodes)
+
+    report('world matrices: %d joints' % num, [
+        ('DagNode.getMatrix loop', timeit(loop)),
+        ('getMatrices', timeit(getMatrices)),
+    ])
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+u"""
+多数のアトリビュートを持つノードのプラグの列挙の計測。
+
+:mayacmd:`listAttr` を使う `.Node.plugs` と `.Node.iterPlugs` を比較する。
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import maya.cmds as cmds
+import cymel.main as cm
+from cymel_bench import timeit, report
+
+
+#------------------------------------------------------------------------------
+def run():
+    cmds.file(f=True, new=True)
+    node = cm.O(cmds.polyCube(ch=False)[0]).shape()
+
+    def plugs():
+        node.plugs()
+
+    def iterPlugs():
+        list(node.iterPlugs())
+
+    report('list all plugs of mesh: %d attributes' % node.mfn().attributeCount(), [
+        ('Node.plugs', timeit(plugs)),
+        ('Node.iterPlugs', timeit(iterPlugs)),
+    ])
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+u"""
+ノード名の解決結果のキャッシュの計測。
+
+深い DAG パスに対する `.CyObject` の繰り返し生成で、
+名前のキャッシュが有効な場合と無効な場合を比較する。
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import maya.cmds as cmds
+import cymel.main as cm
+from cymel_bench import timeit, report
+
+DEPTH = 50
+NUM_REPEAT = 10000
+
+
+#------------------------------------------------------------------------------
+def run(depth=DEPTH, num=NUM_REPEAT):
+    cmds.file(f=True, new=True)
+    parent = None
+    for i in range(depth):
+        parent = cmds.createNode('transform', n='node%d' % i, p=parent)
+    path = cmds.ls(parent, l=True)[0]
+    plugpath = path + '.tx'
+
+    def nodes():
+        for i in range(num):
+            cm.O(path)
+
+    def plugs():
+        for i in range(num):
+            cm.O(plugpath)
+
+    enabled = cm.O.isNameCacheEnabled()
+    try:
+        cm.O.enableNameCache(False)
+        rows = [
+            ('O(node) without cache', timeit(nodes)),
+            ('O(plug) without cache', timeit(plugs)),
+        ]
+        cm.O.enableNameCache()
+        rows += [
+            ('O(node) with cache', timeit(nodes)),
+            ('O(plug) with cache', timeit(plugs)),
+        ]
+    finally:
+        cm.O.enableNameCache(enabled)
+
+    report('name resolution: depth=%d x %d' % (depth, num), rows)
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+u"""
+ノードクラス決定処理の計測。
+
+多数のノードに対する `.CyObject.ls` で、
+クラス決定のメモが有効な場合と無効な場合を比較する。
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import maya.cmds as cmds
+import cymel.main as cm
+from cymel.core import typeregistry as _typeregistry
+from cymel_bench import timeit, report
+
+NUM_NODES = 50000
+
+
+#------------------------------------------------------------------------------
+def run(num=NUM_NODES):
+    cmds.file(f=True, new=True)
+    for i in range(num):
+        cmds.createNode('transform')
+
+    def ls():
+        cm.nt.Transform.ls()
+
+    def lsWithoutMemo():
+        memo = _typeregistry._decideClsMemo
+        for i in range(num):
+            memo.clear()
+            cm.O('transform%d' % (i + 1))
+
+    def lsWithMemo():
+        for i in range(num):
+            cm.O('transform%d' % (i + 1))
+
+    report('node class decision: %d nodes' % num, [
+        ('Transform.ls', timeit(ls)),
+        ('O(name) without memo', timeit(lsWithoutMemo)),
+        ('O(name) with memo', timeit(lsWithMemo)),
+    ])
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+u"""
+`.Plug.set` のスループットの計測。
+
+数値、数値コンパウンド、行列のアトリビュートへのセットで、
+:mayacmd:`setAttr` による場合と API による場合を比較する。
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import maya.cmds as cmds
+import cymel.main as cm
+from cymel_bench import timeit, report
+
+NUM_SETS = 10000
+
+
+#------------------------------------------------------------------------------
+def run(num=NUM_SETS):
+    cmds.file(f=True, new=True)
+    node = cm.nt.Transform()
+    cases = [
+        ('double', node.tx, 1.5),
+        ('double3doubleLinear', node.t, (1., 2., 3.)),
+        ('matrix', node.addAttr('mtx', 'matrix', getPlug=True), cm.Matrix()),
+    ]
+
+    enabled = cm.Plug.isApiSetterEnabled()
+    rows = []
+    try:
+        for typ, plug, val in cases:
+            def sets():
+                for i in range(num):
+                    plug.set(val)
+
+            cm.Plug.enableApiSetter(False)
+            rows.append((typ + ' setAttr', timeit(sets)))
+            cm.Plug.enableApiSetter(True)
+            rows.append((typ + ' API', timeit(sets)))
+    finally:
+        cm.Plug.enableApiSetter(enabled)
+
+    report('Plug.set: %d sets' % num, rows)
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+u"""
+時間サンプリングによるアトリビュート値の取得の計測。
+
+アニメーションした多数のアトリビュートの値を多数のフレームで得る場合に、
+:mayacmd:`currentTime` を変更しながらの `.Plug.get` のループと
+`.Plug.sampleMany` を比較する。
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import maya.cmds as cmds
+import cymel.main as cm
+from cymel_bench import timeit, report
+
+NUM_NODES = 1000
+NUM_FRAMES = 100
+
+
+#------------------------------------------------------------------------------
+def run(num=NUM_NODES, frames=NUM_FRAMES):
+    cmds.file(f=True, new=True)
+    nodes = [cm.nt.Transform() for i in range(num)]
+    for node in nodes:
+        cmds.setKeyframe(node.name(), at='t', t=1, v=0)
+        cmds.setKeyframe(node.name(), at='t', t=frames, v=10)
+    plugs = [x.plug(n) for x in nodes for n in ('tx', 'ty', 'tz')]
+    times = list(range(1, frames + 1))
+
+    def loop():
+        cur = cmds.currentTime(q=True)
+        for t in times:
+            cmds.currentTime(t)
+            [x.get() for x in plugs]
+        cmds.currentTime(cur)
+
+    def sampleMany():
+        cm.Plug.sampleMany(plugs, times)
+
+    report('time sampled read: %d plugs x %d frames' % (len(plugs), len(times)), [
+        ('currentTime + Plug.get loop', timeit(loop)),
+        ('Plug.sampleMany', timeit(sampleMany)),
+    ])
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+u"""
+多数のジョイントへのワールドマトリックスのセットの計測。
+
+`.Transform.setMatrix` のループと `.setMatrices` を比較する。
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import maya.cmds as cmds
+import cymel.main as cm
+from cymel_bench import timeit, report
+
+NUM_NODES = 500
+
+
+#------------------------------------------------------------------------------
+def run(num=NUM_NODES):
+    cmds.file(f=True, new=True)
+    nodes = []
+    parent = None
+    for i in range(num):
+        parent = cm.nt.Joint(p=parent) if parent else cm.nt.Joint()
+        parent.t.set((1., 0., 0.))
+        parent.r.set((0., .1, 0.))
+        nodes.append(parent)
+    ms = [x.getMatrix(ws=True) for x in nodes]
+
+    def loop():
+        for node, m in zip(nodes, ms):
+            node.setMatrix(m, ws=True)
+
+    def setMatrices():
+        cm.setMatrices(nodes, ms, ws=True)
+
+    report('set world matrices: %d joints' % num, [
+        ('Transform.setMatrix loop', timeit(loop)),
+        ('setMatrices', timeit(setMatrices)),
+    ])
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+u"""
+ラッパーオブジェクトの内部データのメモリ使用量の計測。
+
+内部データ（ `_NodeData` や `_PlugData` ）と、
+かつての辞書とクロージャによる実装との比較をする。
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import gc
+import sys
+import maya.cmds as cmds
+import cymel.main as cm
+from cymel.core.cyobjects.python.cyobject import _getAttrKeyName, _makePlugData
+from cymel_bench import report
+
+try:
+    import tracemalloc as _tracemalloc
+except ImportError:
+    _tracemalloc = None
+
+NUM_PLUGS = 100000
+
+
+#------------------------------------------------------------------------------
+def _legacyPlugData(noderef, mplug, typeinfo, attrname):
+    u"""
+    辞書とクロージャによる旧実装と同等の Plug 内部データを構築する。
+    """
+    noderef_data = noderef._CyObject__data
+    node_getname = noderef_data.getname
+    data = {
+        'hash': hash((noderef_data.hash, attrname)),
+        'mplug': mplug,
+        'noderef': noderef,
+        'attrname': attrname,
+        'typeinfo': typeinfo,
+        'getname': lambda: node_getname() + attrname,
+        'elemIdxAttrs': None,
+    }
+
+    attr_isAlive = typeinfo['isAlive']
+    if attr_isAlive:
+        node_isAlive = noderef_data.isAlive
+        node_isValid = noderef_data.isValid
+        node_hasAttr = noderef_data.mfn.hasAttribute
+        keyname = _getAttrKeyName(typeinfo)
+        data['isValid'] = lambda: attr_isAlive() and node_isValid() and node_hasAttr(keyname)
+        isAlive = lambda: attr_isAlive() and node_isAlive()
+    else:
+        data['isValid'] = noderef_data.isValid
+        isAlive = noderef_data.isAlive
+    data['isAlive'] = isAlive
+
+    def eq(self, other):
+        return isAlive() and mplug == other._CyObject__data.mplug and attrname == other._CyObject__data.attrname
+    data['eq'] = eq
+    return data
+
+
+def _measure(proc):
+    u"""
+    処理で確保され、保持されたメモリのバイト数を得る。
+    """
+    gc.collect()
+    if _tracemalloc:
+        _tracemalloc.start()
+        try:
+            res = proc()
+            size = _tracemalloc.get_traced_memory()[0]
+        finally:
+            _tracemalloc.stop()
+    else:
+        res = proc()
+        size = sum([sys.getsizeof(x) + _sizeof(x._CyObject__data) for x in res])
+    return res, size
+
+
+def _sizeof(data):
+    u"""
+    tracemalloc が使えない場合の簡易的なサイズ計算。
+    """
+    if isinstance(data, dict):
+        return sys.getsizeof(data) + sum([
+            sys.getsizeof(v) + (sys.getsizeof(v.__closure__) if getattr(v, '__closure__', None) else 0)
+            for v in data.values() if callable(v)])
+    return sys.getsizeof(data)
+
+
+#------------------------------------------------------------------------------
+def run(num=NUM_PLUGS):
+    cmds.file(f=True, new=True)
+    node = cm.nt.Transform(n='wrapperMemoryBench')
+    node.addAttr('vals', 'double', m=True)
+    name = node.name() + '.vals'
+    for i in range(num):
+        cmds.setAttr('%s[%d]' % (name, i), i)
+
+    mplug = node.plug('vals').mplug_()
+    mplugs = [mplug.elementByLogicalIndex(i) for i in range(num)]
+    attrnames = ['.vals[%d]' % i for i in range(num)]
+    typeinfo = node.plug('vals')[0]._CyObject__data.typeinfo
+    pcls = cm.CyObject.globalPlugClass()
+    noderef = cm.ObjectRef(node)
+
+    # 旧実装相当の辞書とクロージャ。
+    def legacy():
+        return [
+            pcls.newObject(_legacyPlugData(noderef, m, typeinfo, a))
+            for m, a in zip(mplugs, attrnames)]
+    plugs, oldSize = _measure(legacy)
+    del plugs
+
+    # 現行のスロットによる実装。
+    def slotted():
+        return [
+            pcls.newObject(_makePlugData(noderef, m, typeinfo, None, a))
+            for m, a in zip(mplugs, attrnames)]
+    plugs, newSize = _measure(slotted)
+    del plugs
+
+    report('wrapper memory: %d plugs' % num, [
+        ('dict + closures (bytes/plug)', float(oldSize) / num),
+        ('slotted records (bytes/plug)', float(newSize) / num),
+        ('ratio', float(newSize) / oldSize if oldSize else 0.),
+    ])
+
+if __name__ == '__main__':
+    run()
@@ -73,6 +73,828 @@ class TestCyObjects(unittest.TestCase):
         # Use without registration.
         self.assertTrue(type(cm.sel) is MyTransform)
 
+    def test_NodeCache(self):
+        cmds.file(f=True, new=True)
+        cm.O.enableNodeCache()
+        try:
+            obj = cm.nt.Transform(n='foo')
+            self.assertTrue(cm.O('foo') is cm.O('foo'))
+            self.assertTrue(cm.O('foo') == obj)
+
+            # instanced DAG paths are distinguished.
+            cmds.createNode('transform', n='bar')
+            cmds.parent('foo', 'bar', add=True)
+            self.assertFalse(cm.O('|foo') is cm.O('|bar|foo'))
+            cmds.parent('|bar|foo', rm=True)
+
+            stats = cm.O.nodeCacheStats()
+            self.assertTrue(stats['hits'] > 0)
+            self.assertTrue(stats['misses'] > 0)
+
+            # deleted and recreated node.
+            old = cm.O('|foo')
+            cmds.delete('|foo')
+            cmds.createNode('transform', n='foo')
+            new = cm.O('|foo')
+            self.assertFalse(old is new)
+            self.assertTrue(new.isValid())
+            self.assertFalse(old.isValid())
+        finally:
+            cm.O.enableNodeCache(False)
+        self.assertFalse(cm.O('bar') is cm.O('bar'))
+
+    def test_FromNames(self):
+        cmds.file(f=True, new=True)
+        cmds.createNode('transform', n='foo')
+        cmds.createNode('joint', n='bar')
+        names = ['foo.tx', 'foo', 'bar', 'bar.r', 'foo.ty']
+
+        objs = cm.O.fromNames(names)
+        self.assertEqual(objs, [cm.O(x) for x in names])
+        self.assertTrue(type(objs[1]) is cm.nt.Transform)
+        self.assertTrue(type(objs[2]) is cm.nt.Joint)
+        self.assertTrue(objs[0].noderef() is objs[1])
+        self.assertTrue(objs[3].noderef() is objs[2])
+
+        objs = cm.O.fromMObjects([x.mnode() if x.CLASS_TYPE == 1 else x.mplug() for x in objs])
+        self.assertEqual(objs, [cm.O(x) for x in names])
+
+        # the node's own plug class is respected.
+        class MyPlug(cm.Plug):
+            pass
+        cm.O.enableNodeCache()
+        try:
+            foo = cm.O('foo')
+            foo.setPlugClass(MyPlug)
+            objs = cm.O.fromNames(['foo', 'foo.tx'])
+            self.assertTrue(objs[0] is foo)
+            self.assertTrue(type(objs[1]) is MyPlug)
+        finally:
+            cm.O.enableNodeCache(False)
+
+        self.assertRaises(TypeError, cm.nt.Transform.fromNames, ['foo', 'foo.tx'])
+        self.assertRaises(KeyError, cm.O.fromNames, ['foo', 'baz'])
+
+    def test_SelectionCache(self):
+        cmds.file(f=True, new=True)
+        cmds.createNode('transform', n='foo')
+        cmds.createNode('transform', n='bar')
+        cmds.createNode('transform', n='baz')
+        cm.enableSelectionCache()
+        try:
+            cmds.select(['foo', 'bar.tx'])
+            objs = cm.selected()
+            self.assertEqual(objs, [cm.O('foo'), cm.O('bar.tx')])
+            self.assertTrue(cm.sel is objs[0])
+            self.assertTrue(cm.selobj(1) is objs[1])
+
+            # only newly selected items are created.
+            cmds.select('baz', add=True)
+            objs2 = cm.selected()
+            self.assertTrue(objs2[0] is objs[0])
+            self.assertTrue(objs2[1] is objs[1])
+            self.assertEqual(objs2[2], cm.O('baz'))
+
+            cmds.select(cl=True)
+            self.assertEqual(cm.selected(), [])
+            self.assertTrue(cm.sel is None)
+
+            # an empty snapshot is still valid and is not rebuilt.
+            mod = sys.modules['cymel.core.cyobjects.cyobject']
+            snapshot = mod._SELCACHE_OBJS
+            self.assertEqual(snapshot, [])
+            cm.selected()
+            self.assertTrue(mod._SELCACHE_OBJS is snapshot)
+        finally:
+            cm.enableSelectionCache(False)
+        self.assertFalse(cm.isSelectionCacheEnabled())
+
+    def test_UUIDIndex(self):
+        cmds.file(f=True, new=True)
+        foo = cm.nt.Transform(n='foo')
+        bar = cm.nt.Transform(n='bar')
+        fooId = foo.uuid(py=True)
+        cm.O.enableUUIDIndex()
+        try:
+            self.assertEqual(cm.O.byUUID(fooId, py=True), [foo])
+            self.assertEqual(cm.O.byUUID(bar.uuid()), [bar])
+
+            # maintained after the index is built.
+            barId = bar.uuid(py=True)
+            self.assertEqual(cm.O.byUUID([fooId, barId], py=True), [foo, bar])
+            self.assertEqual(cm.O.byUUID([fooId, str(fooId)], py=True), [foo])
+            self.assertEqual(cm.O.byUUID([bar.uuid(), bar.uuid()]), [bar])
+            baz = cm.nt.Transform(n='baz')
+            baz.assignUUID(fooId, py=True)
+            self.assertEqual(set(cm.O.byUUID(fooId, py=True)), set([foo, baz]))
+            cmds.setAttr('foo.uuid', str(barId), type='string')
+            self.assertEqual(set(cm.O.byUUID(barId, py=True)), set([foo, bar]))
+            cmds.delete('bar')
+            self.assertEqual(cm.O.byUUID(barId, py=True), [foo])
+
+            cmds.file(f=True, new=True)
+            self.assertEqual(cm.O.byUUID(fooId, py=True), [])
+        finally:
+            cm.O.enableUUIDIndex(False)
+
+    def test_NameCache(self):
+        cmds.file(f=True, new=True)
+        self.assertTrue(cm.O.isNameCacheEnabled())
+        cmds.createNode('transform', n='foo')
+        cmds.createNode('transform', n='bar')
+        foo = cm.O('foo')
+        self.assertEqual(cm.O('foo'), foo)
+        self.assertEqual(cm.O('foo.tx'), foo.tx)
+
+        # rename, reparent and delete.
+        cmds.rename('foo', 'baz')
+        self.assertRaises(KeyError, cm.O, 'foo')
+        cmds.createNode('transform', n='foo')
+        self.assertNotEqual(cm.O('foo'), foo)
+        cmds.parent('baz', 'bar')
+        self.assertEqual(cm.O('baz'), foo)
+        self.assertEqual(cm.O('baz').parent(), cm.O('bar'))
+        cmds.delete('bar')
+        self.assertRaises(KeyError, cm.O, 'baz')
+
+        cm.O.enableNameCache(False)
+        try:
+            self.assertEqual(cm.O('foo.tx').name(), 'foo.translateX')
+        finally:
+            cm.O.enableNameCache()
+
+    def test_ApiSetter(self):
+        cmds.file(f=True, new=True)
+        obj = cm.nt.Transform(n='foo')
+        cm.Plug.enableApiSetter()
+        try:
+            obj.t.set((1., 2., 3.))
+            obj.rx.setu(90.)
+            obj.v.set(False)
+            self.assertEqual(cmds.getAttr('foo.t')[0], (1., 2., 3.))
+            self.assertAlmostEqual(cmds.getAttr('foo.rx'), 90.)
+            self.assertFalse(cmds.getAttr('foo.v'))
+
+            cmds.undo()
+            self.assertTrue(cmds.getAttr('foo.v'))
+            cmds.undo()
+            self.assertAlmostEqual(cmds.getAttr('foo.rx'), 0.)
+            cmds.redo()
+            self.assertAlmostEqual(cmds.getAttr('foo.rx'), 90.)
+
+            # locked attributes behave the same as setAttr.
+            cmds.setAttr('foo.tx', l=True)
+            self.assertRaises(RuntimeError, obj.tx.set, 5.)
+            self.assertEqual(obj.t.set((4., 5., 6.), safe=True), 1)
+            self.assertEqual(cmds.getAttr('foo.t')[0], (1., 5., 6.))
+        finally:
+            cm.Plug.enableApiSetter(False)
+
+    def test_PlugBatch(self):
+        cmds.file(f=True, new=True)
+        foo = cm.nt.Transform(n='foo')
+        bar = cm.nt.Transform(n='bar')
+        with cm.PlugBatch() as batch:
+            foo.t.set((1., 2., 3.))
+            bar.rx.setu(90.)
+            bar.ty.connect(foo.tx)
+            bar.tz.connect(foo.tz)
+            self.assertEqual(len(batch), 4)
+            self.assertEqual(cmds.getAttr('foo.tx'), 0.)
+        self.assertEqual(cmds.getAttr('foo.t')[0], (1., 2., 3.))
+        self.assertAlmostEqual(cmds.getAttr('bar.rx'), 90.)
+        self.assertTrue(foo.tx.isConnectedTo(bar.ty))
+
+        # one undo step.
+        cmds.undo()
+        self.assertEqual(cmds.getAttr('foo.t')[0], (0., 0., 0.))
+        self.assertFalse(foo.tx.isConnectedTo(bar.ty))
+        cmds.redo()
+        self.assertTrue(foo.tz.isConnectedTo(bar.tz))
+
+        # validation errors report the plugs and nothing is done.
+        cmds.setAttr('foo.sx', l=True)
+        try:
+            with cm.PlugBatch():
+                foo.sx.set(2.)
+                foo.sy.set(3.)
+                bar.tz.disconnect(foo.tz)
+                bar.ty.connect(foo.ty)
+            self.fail()
+        except RuntimeError as e:
+            self.assertTrue('foo.scaleX' in str(e) or 'foo.sx' in str(e))
+            self.assertTrue('bar.ty' in str(e) or 'bar.translateY' in str(e))
+        self.assertEqual(cmds.getAttr('foo.sy'), 1.)
+        self.assertTrue(foo.tz.isConnectedTo(bar.tz))
+
+        with cm.PlugBatch(safe=True) as batch:
+            foo.s.set((2., 3., 4.))
+        self.assertEqual(len(batch.failures), 1)
+        self.assertEqual(cmds.getAttr('foo.s')[0], (1., 3., 4.))
+
+        # non-unique DAG node names are distinguished.
+        cmds.file(f=True, new=True)
+        src = cm.nt.Transform(n='src')
+        a = cm.nt.Transform(n='foo', p=cm.nt.Transform(n='a'))
+        b = cm.nt.Transform(n='foo', p=cm.nt.Transform(n='b'))
+        cmds.setAttr(a.tx.name(), l=True)
+        cmds.setAttr(b.tx.name(), l=True)
+        with cm.PlugBatch():
+            a.tx.connect(src.tx, f=True)
+            b.tx.connect(src.tx, f=True)
+        self.assertTrue(src.tx.isConnectedTo(a.tx))
+        self.assertTrue(src.tx.isConnectedTo(b.tx))
+        self.assertTrue(a.tx.isLocked())
+        self.assertTrue(b.tx.isLocked())
+        with cm.PlugBatch():
+            a.tx.disconnect(src.tx, f=True)
+        self.assertFalse(src.tx.isConnectedTo(a.tx))
+        self.assertTrue(src.tx.isConnectedTo(b.tx))
+
+        # locks inherited from a parent plug are temporarily released on the parent itself.
+        cmds.setAttr(a.t.name(), l=True)
+        with cm.PlugBatch():
+            a.ty.connect(src.ty, f=True)
+        self.assertTrue(src.ty.isConnectedTo(a.ty))
+        self.assertTrue(a.t.isLocked())
+        with cm.PlugBatch():
+            a.ty.disconnect(src.ty, f=True)
+        self.assertFalse(src.ty.isConnectedTo(a.ty))
+        cmds.setAttr(a.t.name(), l=False)
+        self.assertFalse(a.ty.isLocked())
+        self.assertTrue(a.tx.isLocked())
+
+    def test_GetMany(self):
+        cmds.file(f=True, new=True)
+        foo = cm.nt.Transform(n='foo')
+        bar = cm.nt.Joint(n='bar')
+        cmds.setAttr('foo.t', 1., 2., 3.)
+        cmds.setAttr('bar.rx', 45.)
+        names = ['t', 'tx', 'v', 'rotateOrder', 'wm']
+        self.assertEqual(foo.getAttrs(names), [foo.plug(x).get() for x in names])
+        self.assertEqual(foo.getAttrs(['tx', 'ty'], asDict=True), {'tx': 1., 'ty': 2.})
+
+        plugs = [foo.t, bar.r, bar.rx, foo.wm, bar.radius]
+        self.assertEqual(cm.Plug.getMany(plugs), [x.get() for x in plugs])
+        self.assertEqual(cm.Plug.getMany(plugs, unit=True), [x.getu() for x in plugs])
+        self.assertEqual(cm.Plug.getMany(plugs, asDict=True)[bar.rx], bar.rx.get())
+
+        from cymel.core.cyobjects.cyobject import CymelInvalidHandle
+        cmds.delete('bar')
+        self.assertRaises(CymelInvalidHandle, cm.Plug.getMany, plugs)
+
+    def test_PlugArray(self):
+        try:
+            import numpy as np
+        except ImportError:
+            return
+        cmds.file(f=True, new=True)
+        node = cm.nt.Transform(n='foo')
+        for typ, arr in (
+            ('doubleArray', np.arange(10, dtype=np.float64)),
+            ('floatArray', np.arange(10, dtype=np.float32) * .5),
+            ('Int32Array', np.arange(10, dtype=np.int32) - 5),
+            ('vectorArray', np.arange(30, dtype=np.float64).reshape(10, 3)),
+            ('pointArray', np.arange(40, dtype=np.float64).reshape(10, 4)),
+        ):
+            plug = node.addAttr(typ, typ, getPlug=True)
+            self.assertEqual(len(plug.getArray()), 0)
+            plug.setArray(arr)
+            res = plug.getArray()
+            self.assertEqual(res.shape, arr.shape)
+            self.assertTrue((res == arr).all())
+            cmds.undo()
+            self.assertEqual(len(plug.getArray()), 0)
+
+        plug = node.plug('pointArray')
+        plug.setArray(np.ones((5, 3)))
+        self.assertEqual(plug.getArray().shape, (5, 4))
+        self.assertTrue((plug.getArray()[:, 3] == 1.).all())
+        plug.setArray(np.empty((0, 4)))
+        self.assertEqual(plug.getArray().shape, (0, 4))
+        self.assertRaises(ValueError, plug.setArray, np.ones((5, 2)))
+        self.assertRaises(TypeError, node.tx.getArray)
+
+    def test_TypeInfoCache(self):
+        cmds.file(f=True, new=True)
+        self.assertTrue(cm.CyObject.isTypeInfoCacheEnabled())
+        a = cm.nt.Transform(n='foo')
+        b = cm.nt.Transform(n='bar')
+        typeinfo = lambda p: p._CyObject__data.typeinfo
+        self.assertTrue(typeinfo(a.tx) is typeinfo(b.tx))
+        self.assertEqual(b.t.subType(), 'doubleLinear')
+
+        a.addAttr('dyn', 'double')
+        b.addAttr('dyn', 'float')
+        self.assertFalse(typeinfo(a.dyn) is typeinfo(b.dyn))
+        self.assertEqual(b.dyn.type(), 'float')
+        a.dyn.delete()
+        a.addAttr('dyn', 'long')
+        self.assertEqual(a.dyn.type(), 'long')
+
+        cm.CyObject.enableTypeInfoCache(False)
+        try:
+            self.assertFalse(cm.CyObject.isTypeInfoCacheEnabled())
+            self.assertFalse(typeinfo(a.tx) is typeinfo(b.tx))
+        finally:
+            cm.CyObject.enableTypeInfoCache()
+
+    def test_AttrPathCache(self):
+        cmds.file(f=True, new=True)
+        self.assertTrue(cm.CyObject.isAttrPathCacheEnabled())
+        cm.CyObject.clearAttrPathCache()
+        a = cm.nt.Transform(n='foo')
+        b = cm.nt.Transform(n='bar')
+        self.assertEqual(a.plug('worldMatrix[0]').name(), 'foo.worldMatrix[0]')
+        self.assertEqual(b.plug('worldMatrix[0]').name(), 'bar.worldMatrix[0]')
+        self.assertEqual(b.plug('t.tx').name(), 'bar.tx')
+        self.assertEqual(cm.O('bar.worldMatrix[0]').name(), 'bar.worldMatrix[0]')
+        stats = cm.CyObject.attrPathCacheStats()
+        self.assertEqual(stats['hits'], 2)
+        self.assertEqual(stats['misses'], 2)
+        self.assertEqual(stats['tokenMisses'], 2)
+
+        bs = cm.nt.BlendShape()
+        cmds.aliasAttr('foo', bs.name() + '.w[3]')
+        self.assertEqual(bs.plug('foo').name(), bs.plug('w[3]').name())
+        self.assertEqual(cm.CyObject.attrPathCacheStats()['size'], 3)
+
+        cm.CyObject.enableAttrPathCache(False)
+        try:
+            self.assertFalse(cm.CyObject.isAttrPathCacheEnabled())
+            self.assertEqual(a.plug('worldMatrix[0]').name(), 'foo.worldMatrix[0]')
+            self.assertEqual(cm.CyObject.attrPathCacheStats()['size'], 0)
+        finally:
+            cm.CyObject.enableAttrPathCache()
+
+    def test_IterGraph(self):
+        cmds.file(f=True, new=True)
+        a = cm.nt.Transform(n='a')
+        b = cm.nt.Transform(n='b')
+        c = cm.nt.Transform(n='c')
+        d = cm.nt.Transform(n='d')
+        a.t >> b.t
+        b.r >> c.r
+        b.tx >> d.rx  # unitConversion 経由。
+        c.s >> d.s
+
+        self.assertEqual(set(d.iterUpstream()), set([a, b, c]))
+        self.assertEqual(set(d.iterUpstream(breadthFirst=True)), set([a, b, c]))
+        self.assertEqual(set(d.iterUpstream(depth=1)), set([b, c]))
+        self.assertEqual(set(a.iterDownstream()), set([b, c, d]))
+        self.assertTrue(any(x.type() == 'unitConversion' for x in a.iterDownstream(skipConversionNodes=False)))
+        self.assertEqual(list(a.iterDownstream(type='unitConversion')), [])
+        self.assertEqual(set(a.iterDownstream(prune=lambda x: x == b)), set([b]))
+
+        plugs = list(c.iterDownstream(plugLevel=True))
+        self.assertTrue(plugs)
+        self.assertTrue(all(isinstance(x, cm.Plug) for x in plugs))
+        self.assertTrue(d.s in plugs or d.sx in plugs)
+        self.assertEqual(list(a.t.iterDownstream(depth=1)), [b])
+
+        # diamond: a -> b -> c -> d and a -> c.
+        # d is within depth 2 through the shorter path.
+        cmds.file(f=True, new=True)
+        a = cm.nt.Transform(n='a')
+        b = cm.nt.Transform(n='b')
+        c = cm.nt.Transform(n='c')
+        d = cm.nt.Transform(n='d')
+        a.tx >> b.tx
+        b.tx >> c.tx
+        a.ty >> c.ty
+        c.tx >> d.tx
+        self.assertEqual(set(a.iterDownstream(depth=2)), set([b, c, d]))
+        self.assertEqual(set(a.iterDownstream(depth=1)), set([b, c]))
+        self.assertEqual(set(d.iterUpstream(depth=2)), set([a, b, c]))
+
+    def test_SampleMany(self):
+        try:
+            import numpy as np
+        except ImportError:
+            return
+        cmds.file(f=True, new=True)
+        a = cm.nt.Transform(n='foo')
+        cmds.setKeyframe('foo', at='tx', t=1, v=0, itt='linear', ott='linear')
+        cmds.setKeyframe('foo', at='tx', t=11, v=10, itt='linear', ott='linear')
+        cmds.setKeyframe('foo', at='rx', t=1, v=0, itt='linear', ott='linear')
+        cmds.setKeyframe('foo', at='rx', t=11, v=90, itt='linear', ott='linear')
+        cmds.currentTime(1)
+
+        self.assertTrue(np.allclose(a.tx.getAtTimes([1, 6, 11]), [0, 5, 10]))
+        self.assertTrue(np.allclose(a.rx.getAtTimes([11], True), [90]))
+        self.assertEqual(cmds.currentTime(q=True), 1)
+
+        res = cm.Plug.sampleMany([a.tx, a.rx], [1, 11], True)
+        self.assertEqual(res.shape, (2, 2))
+        self.assertTrue(np.allclose(res[1], [10, 90]))
+
+        res = a.sampleAttrs(['t', 'r'], range(1, 12))
+        self.assertEqual(res.shape, (11, 2, 3))
+        self.assertTrue(np.allclose(res[5, 0], [5, 0, 0]))
+        self.assertEqual(a.sampleAttrs(['wm'], [1, 2]).shape, (2, 1, 16))
+        self.assertRaises(ValueError, cm.Plug.sampleMany, [a.t, a.tx], [1])
+
+    def test_ConnectMany(self):
+        cmds.file(f=True, new=True)
+        src = cm.nt.Transform(n='src')
+        dsts = [cm.nt.Transform(n='dst%d' % i) for i in range(3)]
+        cm.connectMany([(src.t, x.t) for x in dsts])
+        self.assertTrue(all(src.t.isConnectedTo(x.t) for x in dsts))
+        cmds.undo()
+        self.assertFalse(any(src.t.isConnectedTo(x.t) for x in dsts))
+        cmds.redo()
+        self.assertTrue(all(src.t.isConnectedTo(x.t) for x in dsts))
+
+        dsts[1].r.setLocked()
+        self.assertRaises(RuntimeError, cm.connectMany, [(src.r, x.r) for x in dsts])
+        self.assertFalse(src.r.isConnectedTo(dsts[0].r))
+        self.assertEqual(cm.connectMany([(src.r, x.r) for x in dsts], safe=True), [dsts[1].r.name()])
+        self.assertTrue(src.r.isConnectedTo(dsts[0].r))
+        cm.connectMany([(src.r, dsts[1].r)], force=True)
+        self.assertTrue(src.r.isConnectedTo(dsts[1].r))
+        self.assertTrue(dsts[1].r.isLocked())
+
+        cm.disconnectMany([dsts[0].t, (src.t, dsts[1].t)])
+        self.assertFalse(src.t.isConnectedTo(dsts[0].t))
+        self.assertFalse(src.t.isConnectedTo(dsts[1].t))
+        self.assertTrue(src.t.isConnectedTo(dsts[2].t))
+        self.assertRaises(RuntimeError, cm.disconnectMany, [dsts[1].r])
+        cm.disconnectMany([dsts[1].r], force=True)
+        self.assertFalse(src.r.isConnectedTo(dsts[1].r))
+        cmds.undo()
+        self.assertTrue(src.r.isConnectedTo(dsts[1].r))
+
+        # unconnected plugs are reported in safe mode.
+        self.assertRaises(RuntimeError, cm.disconnectMany, [dsts[0].t, dsts[0].s])
+        self.assertTrue(src.t.isConnectedTo(dsts[0].t))
+        self.assertEqual(cm.disconnectMany([dsts[0].t, dsts[0].s], safe=True), [dsts[0].s.name()])
+        self.assertFalse(src.t.isConnectedTo(dsts[0].t))
+
+        # safe=True conflicts with an outer batch without safe.
+        with cm.PlugBatch():
+            self.assertRaises(ValueError, cm.connectMany, [(src.s, dsts[0].s)], safe=True)
+            self.assertEqual(cm.connectMany([(src.s, dsts[0].s)]), [])
+        self.assertTrue(src.s.isConnectedTo(dsts[0].s))
+
+        # locks inherited from a parent plug are respected like Plug.connect.
+        dst = cm.nt.Transform(n='dst')
+        dst.r.setLocked()
+        self.assertRaises(RuntimeError, cm.connectMany, [(src.sx, dst.rx)])
+        cm.connectMany([(src.sx, dst.rx)], force=True)
+        self.assertTrue(src.sx.isConnectedTo(dst.rx))
+        self.assertTrue(dst.r.isLocked())
+
+    def test_AttrTree(self):
+        cmds.file(f=True, new=True)
+        a = cm.nt.Transform(n='foo')
+        b = cm.nt.Transform(n='bar')
+        self.assertEqual(a.t.children(), [a.tx, a.ty, a.tz])
+        self.assertEqual(a.t.child(2), a.tz)
+        self.assertTrue(b.t.children()[0]._CyObject__data.typeinfo is a.t.children()[0]._CyObject__data.typeinfo)
+        self.assertEqual(a.t.children()[0].type(), 'doubleLinear')
+
+        a.addAttr('cmp', 'compound', nc=2, multi=True)
+        a.addAttr('cmpA', 'double', parent='cmp')
+        a.addAttr('cmpB', 'double3', parent='cmp')
+        a.plug('cmp[0].cmpA').set(1.)
+        a.plug('cmp[2].cmpB').set((1., 2., 3.))
+        self.assertEqual(
+            [x.name() for x in a.cmp.leaves()],
+            ['foo.cmp[0].cmpA', 'foo.cmp[0].cmpBX', 'foo.cmp[0].cmpBY', 'foo.cmp[0].cmpBZ',
+             'foo.cmp[2].cmpA', 'foo.cmp[2].cmpBX', 'foo.cmp[2].cmpBY', 'foo.cmp[2].cmpBZ'])
+        self.assertEqual(len(a.cmp.children()), 2)
+        self.assertEqual(a.plug('cmp[2]').children(), [a.plug('cmp[2].cmpA'), a.plug('cmp[2].cmpB')])
+
+        names = [x.name() for x in a.cmp.iterHierarchy()]
+        self.assertEqual(names[:4], ['foo.cmp', 'foo.cmp[0]', 'foo.cmp[0].cmpA', 'foo.cmp[0].cmpB'])
+        self.assertEqual(len(names), 13)
+        names = [x.name() for x in a.cmp.iterHierarchy(checker=lambda x: not x.name().endswith('cmpB'))]
+        self.assertEqual(names, ['foo.cmp', 'foo.cmp[0]', 'foo.cmp[0].cmpA', 'foo.cmp[2]', 'foo.cmp[2].cmpA'])
+
+    def test_UnitFactor(self):
+        cmds.file(f=True, new=True)
+        a = cm.nt.Transform(n='foo')
+        a.t.set((1., 2., 3.))
+        a.rx.set(1.)
+        self.assertEqual(a.tx.getu(), 1.)
+        self.assertAlmostEqual(a.rx.getu(), 57.29577951308232)
+        lin = cmds.currentUnit(q=True, l=True)
+        ang = cmds.currentUnit(q=True, a=True)
+        try:
+            cmds.currentUnit(l='mm', a='rad')
+            self.assertAlmostEqual(a.tx.getu(), 10.)
+            self.assertEqual([round(x, 9) for x in a.t.getu()], [10., 20., 30.])
+            self.assertAlmostEqual(a.rx.getu(), 1.)
+        finally:
+            cmds.currentUnit(l=lin, a=ang)
+        self.assertAlmostEqual(a.tx.getu(), 1.)
+        self.assertAlmostEqual(a.rx.getu(), 57.29577951308232)
+
+    def test_DagSnapshot(self):
+        cmds.file(f=True, new=True)
+        a = cm.nt.Transform(n='a')
+        b = cm.nt.Transform(n='b', p=a)
+        c = cm.nt.Transform(n='c', p=a)
+        d = cm.nt.Transform(n='d', p=c)
+        s = cm.O(cmds.createNode('mesh', p='d'))
+        snap = cm.DagSnapshot()
+        self.assertEqual(snap.parent(b), a)
+        self.assertEqual(snap.root(d), a)
+        self.assertEqual(snap.children(a), a.children())
+        self.assertEqual(snap.children(d), [])
+        self.assertEqual(snap.children(d, shapes=True), [s])
+        self.assertEqual(snap.numChildren(a), 2)
+        self.assertEqual(snap.siblings(b), [c])
+        self.assertEqual(snap.leaves(a), a.leaves())
+        for x in (a, b, c, d, s):
+            self.assertEqual(snap.pathLength(x), x.pathLength())
+            self.assertEqual(snap.siblingIndices(x), x.siblingIndices())
+        nodes = [s, c, a, d, b]
+        self.assertEqual(sorted(nodes, key=snap.keyForDepthFirst), sorted(nodes, key=cm.keyForDepthFirst))
+        self.assertEqual(sorted(nodes, key=snap.keyForBreadthFirst), sorted(nodes, key=cm.keyForBreadthFirst))
+
+        cmds.instance('c')
+        self.assertTrue(snap.isStale())
+        self.assertRaises(RuntimeError, snap.parent, b)
+        snap.update()
+        self.assertFalse(snap.isStale())
+        d2 = cm.O('|c1|d')
+        self.assertTrue(snap.isInstanced(d2))
+        self.assertEqual(snap.instanceIndex(d2), d2.instanceIndex())
+        self.assertEqual(snap.parent(d2), d2.parent())
+        for x in snap.nodes():
+            self.assertEqual(snap.node(snap.indexOf(x)), x)
+        self.assertRaises(KeyError, snap.indexOf, cm.O('time1'))
+
+    def test_GetMatrices(self):
+        try:
+            import numpy as np
+        except ImportError:
+            return
+        cmds.file(f=True, new=True)
+        a = cm.nt.Transform(n='a')
+        b = cm.nt.Transform(n='b', p=a)
+        a.t.set((1., 2., 3.))
+        b.r.set((.5, 0., 0.))
+        s = cm.O(cmds.createNode('mesh', p='b'))
+        nodes = [a, b, s]
+        for ws in (True, False):
+            for p in (True, False):
+                for inv in (True, False):
+                    res = cm.getMatrices(nodes, ws, p, inv)
+                    self.assertEqual(res.shape, (3, 4, 4))
+                    for x, m in zip(nodes, res):
+                        self.assertTrue(np.allclose(m.ravel(), list(x.getMatrix(ws, p, inv))))
+        self.assertEqual(cm.getMatrices([]).shape, (0, 4, 4))
+
+        cmds.setKeyframe('a', at='tx', t=1, v=0, itt='linear', ott='linear')
+        cmds.setKeyframe('a', at='tx', t=11, v=10, itt='linear', ott='linear')
+        cmds.currentTime(1)
+        res = cm.sampleMatrices([a, b], [1, 6, 11])
+        self.assertEqual(res.shape, (3, 2, 4, 4))
+        self.assertTrue(np.allclose(res[1, 1, 3, :3], [5., 2., 3.]))
+        self.assertTrue(np.allclose(cm.sampleMatrices([b], [11], ws=False)[0, 0], cm.getMatrices([b], False)[0]))
+        self.assertTrue(np.allclose(cm.sampleMatrices([b], [1], p=True)[0, 0, 3, :3], [0., 2., 3.]))
+        self.assertEqual(cmds.currentTime(q=True), 1)
+
+    def test_SetMatrices(self):
+        cmds.file(f=True, new=True)
+        src = [cm.nt.Joint(n='s0')]
+        src.append(cm.nt.Joint(n='s1', p=src[0]))
+        src[0].t.set((1., 2., 3.))
+        src[0].r.set((.5, .2, 0.))
+        src[0].s.set((2., 1., 1.))
+        src[1].t.set((1., 0., 0.))
+        src[1].r.set((0., 0., .3))
+        dst = [cm.nt.Joint(n='d0')]
+        dst.append(cm.nt.Joint(n='d1', p=dst[0]))
+
+        cm.setMatrices(dst, [x.getMatrix(ws=True) for x in src], ws=True)
+        for a, b in zip(src, dst):
+            self.assertTrue(b.getMatrix(ws=True).isEquivalent(a.getMatrix(ws=True)))
+        cmds.undo()
+        for x in dst:
+            self.assertTrue(x.getMatrix(ws=True).isEquivalent(cm.M()))
+        cmds.redo()
+        self.assertTrue(dst[1].getMatrix(ws=True).isEquivalent(src[1].getMatrix(ws=True)))
+
+        cmds.undo()
+        dst[0].tx.setLocked(True)
+        self.assertRaises(RuntimeError, cm.setMatrices, dst, [x.getMatrix() for x in src])
+        self.assertEqual(cm.setMatrices(dst, [x.getMatrix() for x in src], safe=True), ['d0.tx'])
+        self.assertEqual(dst[0].t.get(), [0., 2., 3.])
+
+        dst[0].tx.setLocked(False)
+        src[1].jo.set((0., .4, 0.))
+        cm.setTransformations(dst, [x.getTransformation(ws=True) for x in src], ws=True)
+        for a, b in zip(src, dst):
+            self.assertTrue(b.getMatrix(ws=True).isEquivalent(a.getMatrix(ws=True)))
+
+        # every other node of a chain: the nearest ancestor in the batch is respected.
+        cmds.file(f=True, new=True)
+        chain = [cm.nt.Transform(n='c0')]
+        for i in range(1, 4):
+            chain.append(cm.nt.Transform(n='c%d' % i, p=chain[-1]))
+        for i, x in enumerate(chain):
+            x.t.set((1., i, 0.))
+            x.r.set((0., .1 * i, .2))
+        targets = [cm.nt.Transform(n='t%d' % i) for i in range(2)]
+        targets[0].t.set((3., 2., 1.))
+        targets[0].r.set((.3, 0., .1))
+        targets[1].t.set((-1., 4., 2.))
+        targets[1].r.set((0., .5, 0.))
+        targets[1].s.set((1., 2., 1.))
+        ms = [x.getMatrix(ws=True) for x in targets]
+        local = chain[1].getMatrix()
+        cm.setMatrices([chain[0], chain[2]], ms, ws=True)
+        self.assertTrue(chain[0].getMatrix(ws=True).isEquivalent(ms[0]))
+        self.assertTrue(chain[1].getMatrix().isEquivalent(local))
+        self.assertTrue(chain[2].getMatrix(ws=True).isEquivalent(ms[1]))
+        cmds.undo()
+        cm.setTransformations([chain[2], chain[0]], [x.getTransformation(ws=True) for x in reversed(targets)], ws=True)
+        self.assertTrue(chain[0].getMatrix(ws=True).isEquivalent(ms[0]))
+        self.assertTrue(chain[2].getMatrix(ws=True).isEquivalent(ms[1]))
+
+    def test_ShapeCache(self):
+        cmds.file(f=True, new=True)
+        cm.O.enableShapeCache()
+        trn = cm.nt.Transform(n='foo')
+        a = cm.O(cmds.createNode('mesh', n='fooA', p='foo'))
+        b = cm.O(cmds.createNode('mesh', n='fooB', p='foo'))
+        s = trn.shape()
+        self.assertEqual(s, a)
+        stats = cm.O.shapeCacheStats()
+        self.assertTrue(trn.shape() is s)
+        self.assertTrue(s.transform() is trn)
+        self.assertEqual(cm.O.shapeCacheStats()['hits'], stats['hits'] + 2)
+
+        # reorder, intermediate object and removal.
+        cmds.reorder('fooB', f=True)
+        self.assertEqual(trn.shape(), b)
+        b.io.set(True)
+        self.assertEqual(trn.shape(), a)
+        self.assertEqual(trn.shape(intermediates=True), b)
+        cmds.delete('fooA')
+        self.assertEqual(trn.shape(), None)
+        self.assertEqual(trn.shape(intermediates=True), b)
+        cmds.undo()
+        self.assertEqual(trn.shape(), a)
+
+        # watches are released when shapes are deleted, and restored shapes are watched again.
+        watched = cm.O.shapeCacheStats()['watched']
+        cmds.delete('fooA')
+        self.assertEqual(cm.O.shapeCacheStats()['watched'], watched - 1)
+        cmds.undo()
+        self.assertEqual(trn.shape(), a)
+        self.assertEqual(cm.O.shapeCacheStats()['watched'], watched)
+        a.io.set(True)
+        self.assertEqual(trn.shape(), None)
+        a.io.set(False)
+        self.assertEqual(trn.shape(), a)
+
+        # shapes that were never fetched are watched too.
+        trn2 = cm.nt.Transform(n='bar')
+        cmds.createNode('mesh', n='barA', p='bar')
+        cmds.setAttr('barA.io', True)
+        cmds.createNode('mesh', n='barB', p='bar')
+        self.assertEqual(trn2.shape().name(), 'barB')
+        cmds.setAttr('barA.io', False)
+        self.assertEqual(trn2.shape().name(), 'barA')
+
+        s = trn.shape()
+        cm.O.invalidateShapeCache(trn)
+        self.assertTrue(trn.shape() is s)
+        self.assertTrue(cm.O.shapeCacheStats()['invalidations'] > 0)
+        cm.O.enableShapeCache(False)
+        try:
+            self.assertFalse(cm.O.isShapeCacheEnabled())
+            self.assertEqual(trn.shape(), a)
+            self.assertEqual(cm.O.shapeCacheStats()['hits'], 0)
+        finally:
+            cm.O.enableShapeCache()
+
+    def test_BoundingBoxes(self):
+        try:
+            import numpy as np
+        except ImportError:
+            return
+        cmds.file(f=True, new=True)
+        a = cm.O(cmds.polyCube(ch=False)[0])
+        b = cm.O(cmds.polySphere(ch=False)[0])
+        a.t.set((1., 2., 3.))
+        a.r.set((.3, .5, .7))
+        a.s.set((1., 2., 3.))
+        b.t.set((-5., 0., 0.))
+        nodes = [a.shape(), b.shape(), a]
+        for ws in (True, False):
+            res = cm.boundingBoxes(nodes, ws)
+            self.assertEqual(res.shape, (3, 2, 3))
+            for x, bb in zip(nodes, res):
+                expected = x.boundingBox(ws)
+                self.assertTrue(np.allclose(bb[0], list(expected.min())))
+                self.assertTrue(np.allclose(bb[1], list(expected.max())))
+
+        bb = cm.unionBoundingBox(nodes)
+        expected = a.shape().boundingBox(True)
+        expected.expand(b.shape().boundingBox(True))
+        self.assertTrue(np.allclose(list(bb.min()), list(expected.min())))
+        self.assertTrue(np.allclose(list(bb.max()), list(expected.max())))
+        self.assertEqual(cm.boundingBoxes([]).shape, (0, 2, 3))
+
+    def test_IterPlugs(self):
+        cmds.file(f=True, new=True)
+        a = cm.nt.Transform(n='foo')
+        a.addAttr('bar', 'double', k=True)
+        a.addAttr('baz', 'double3', cb=True)
+        self.assertEqual(len(list(a.iterPlugs())), a.mfn().attributeCount())
+        plugs = list(a.iterPlugs(keyable=True))
+        self.assertTrue(a.tx in plugs)
+        self.assertTrue(a.bar in plugs)
+        self.assertFalse(a.baz in plugs)
+        self.assertTrue(a.baz in list(a.iterPlugs(channelBox=True)))
+        self.assertEqual(
+            [x.name() for x in a.iterPlugs(userDefined=True)],
+            ['foo.bar', 'foo.baz', 'foo.bazX', 'foo.bazY', 'foo.bazZ'])
+        self.assertEqual(
+            [x.name() for x in a.iterPlugs(userDefined=True, topLevel=True)],
+            ['foo.bar', 'foo.baz'])
+        self.assertEqual(
+            [x.name() for x in a.iterPlugs(userDefined=True, leaf=False)],
+            ['foo.baz'])
+        self.assertTrue(a.wm in list(a.iterPlugs(multi=True)))
+
+    def test_AddAttrs(self):
+        cmds.file(f=True, new=True)
+        schema = cm.AttrSchema([
+            {'ln': 'weight', 'dv': .5, 'min': 0., 'max': 1., 'k': True},
+            {'longName': 'offset', 'type': 'double3', 'subType': 'doubleLinear', 'channelBox': True, 'dv': (1., 2., 3.)},
+            {'ln': 'mode', 'type': 'enum', 'en': 'off:on=3'},
+            {'ln': 'label', 'type': 'string', 'dv': 'foo'},
+            {'ln': 'data', 'type': 'compound', 'children': [
+                {'ln': 'dataA', 'type': 'long', 'dv': 2},
+                {'ln': 'dataB', 'type': 'message'},
+            ]},
+        ])
+        self.assertEqual(schema.names(), ['weight', 'offset', 'mode', 'label', 'data'])
+        objs = [cm.nt.Transform() for i in range(3)]
+        cm.addAttrsToNodes(objs, schema)
+        for obj in objs:
+            self.assertEqual(obj.weight.get(), .5)
+            self.assertTrue(obj.weight.isKeyable())
+            self.assertEqual(obj.offset.get(), [1., 2., 3.])
+            self.assertEqual(obj.offsetX.type(), 'doubleLinear')
+            self.assertTrue(obj.offsetY.isChannelBox())
+            self.assertEqual(obj.mode.listEnum(), [('off', 0), ('on', 3)])
+            self.assertEqual(obj.label.get(), 'foo')
+            self.assertEqual(obj.plug('data.dataA').get(), 2)
+        cmds.undo()
+        self.assertFalse(objs[0].hasAttr('weight'))
+        self.assertFalse(objs[2].hasAttr('data'))
+        cmds.redo()
+        self.assertTrue(objs[2].hasAttr('dataB'))
+
+        self.assertRaises(ValueError, objs[0].addAttrs, schema)
+        objs[0].addAttrs([{'ln': 'extra', 'type': 'doubleAngle', 'dv': 1.}])
+        self.assertEqual(objs[0].extra.get(), 1.)
+        self.assertRaises(ValueError, cm.AttrSchema, [{'ln': 'bad', 'type': 'unknownType'}])
+        self.assertRaises(ValueError, cm.AttrSchema, [{'ln': 'bad', 'foo': 1}])
+
+        # clashes are checked with short names and child names too.
+        obj = cm.nt.Transform()
+        obj.addAttr('fooX', 'double')
+        obj.addAttr('barLong', 'double', sn='bar')
+        self.assertRaises(ValueError, obj.addAttrs, [{'ln': 'ok'}, {'ln': 'foo', 'type': 'double3'}])
+        self.assertRaises(ValueError, obj.addAttrs, [{'ln': 'ok'}, {'ln': 'baz', 'sn': 'bar'}])
+        self.assertRaises(ValueError, obj.addAttrs, [{'ln': 'ok'}, {'ln': 'cmp', 'type': 'compound', 'children': [{'ln': 'fooX'}]}])
+        self.assertFalse(obj.hasAttr('ok'))
+        self.assertRaises(ValueError, cm.AttrSchema, [{'ln': 'foo', 'type': 'double3'}, {'ln': 'fooY'}])
+
+        # the same node is added only once.
+        cm.addAttrsToNodes([obj, obj, cm.O(obj.name())], [{'ln': 'once'}])
+        self.assertTrue(obj.hasAttr('once'))
+
+    def test_ObjectRefExtendedData(self):
+        cmds.file(f=True, new=True)
+        cmds.createNode('transform', n='foo')
+
+        class ExTransform(cm.nt.Transform):
+            @classmethod
+            def newObject(cls, data):
+                if isinstance(data, dict):
+                    obj = super(ExTransform, cls).newObject(data['DATA'])
+                    obj.extra = data['extra']
+                else:
+                    obj = super(ExTransform, cls).newObject(data)
+                    obj.extra = 1
+                return obj
+
+            def internalData(self):
+                return {'DATA': super(ExTransform, self).internalData(), 'extra': self.extra}
+
+        obj = ExTransform('foo')
+        ref = obj.tx.noderef()
+        self.assertEqual(ref.name(), 'foo')
+        self.assertTrue(ref() is obj)
 
 #------------------------------------------------------------------------------
 def suite():
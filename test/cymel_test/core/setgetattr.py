@@ -27,7 +27,19 @@ TIME_TOLERANCE = 1e-6 if cm.MAYA_VERSION >= (2017,) else 1e-3
 
 
 #------------------------------------------------------------------------------
-def doit(s=13):
+def doit(s=13, api=False):
+    u"""
+    :param `bool` api: `.Plug.enableApiSetter` を有効にしてテストする。
+    """
+    enabled = cm.Plug.isApiSetterEnabled()
+    cm.Plug.enableApiSetter(api)
+    try:
+        _doit(s)
+    finally:
+        cm.Plug.enableApiSetter(enabled)
+
+
+def _doit(s):
     cmds.file(f=True, new=True)
 
     seed(s)